@@ -0,0 +1,54 @@
+# coding=utf-8
+#
+# Micro-benchmark for the attribute access of Params parameters.
+#
+# Compares the per class parameter descriptors against an emulation
+# of the former ``Params.__getattribute__`` based attribute lookup.
+#
+# Usage:
+#    python -m benchmarks.bench_access
+#
+
+from __future__ import division, absolute_import, print_function
+
+import timeit
+
+import params as pp
+
+
+class AccessParams(pp.Params):
+    param_a = 1
+    param_b = "b"
+
+    @property
+    def param_c(self):
+        return self.param_a + 1
+
+
+class LegacyAccessParams(AccessParams):
+    """ Emulates the attribute lookup overhead of the former ``Params.__getattribute__``. """
+    def __getattribute__(self, attr):
+        if not attr.startswith("_") and attr in LEGACY_SPECS:
+            spec = LEGACY_SPECS[attr]
+            if spec.is_property:
+                return spec.value(self)
+            return self.__getitem__(attr)
+        return object.__getattribute__(self, attr)
+
+
+LEGACY_SPECS = dict(AccessParams._Params__specs)
+
+
+def run(number=1000000):
+    results = []
+    for cls in [AccessParams, LegacyAccessParams]:
+        inst = cls()
+        for stmt in ["inst.param_a", "inst.param_c", "inst['param_a']", "inst.clone"]:
+            secs = timeit.timeit(stmt, globals={"inst": inst}, number=number)
+            results.append((cls.__name__, stmt, secs))
+    return results
+
+
+if __name__ == '__main__':
+    for cls_name, stmt, secs in run():
+        print("{:20s} {:16s} {:8.3f}s".format(cls_name, stmt, secs))
@@ -0,0 +1,42 @@
+# coding=utf-8
+#
+# Benchmark for the import time of a module defining 1000 Params subclasses
+# (single inheritance chains with plain, Param() and @property parameters),
+# and for the in-process class creation time (the ``classes/create_1000`` suite scenario).
+#
+# Each import runs in a fresh python interpreter (best of ``--repeat`` runs).
+#
+# Usage:
+#    python -m benchmarks.bench_class_creation
+#
+
+from __future__ import division, absolute_import, print_function
+
+import os
+import tempfile
+
+from benchmarks.bench_import import best_time
+from benchmarks.suite import class_chains_source, measure
+
+
+def run(repeat=5, num_classes=1000):
+    source = class_chains_source(num_classes)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with open(os.path.join(temp_dir, "many_params.py"), "w") as fp:
+            fp.write(source)
+        baseline = best_time("import params", repeat, python_path=[temp_dir])
+        import_time = best_time("import many_params", repeat, python_path=[temp_dir])
+
+    code = compile(source, "many_params", "exec")
+    create_time = measure(lambda: exec(code, {}), repeat=repeat)["median"]
+    return [
+        ("import params", baseline),
+        ("import {} subclasses".format(num_classes), import_time),
+        ("  (overhead)", import_time - baseline),
+        ("create {} subclasses".format(num_classes), create_time),
+    ]
+
+
+if __name__ == '__main__':
+    for name, secs in run():
+        print("{:30s} {:8.1f}ms".format(name, secs * 1000))
@@ -0,0 +1,45 @@
+# coding=utf-8
+#
+# Benchmark of deriving many configs overriding few parameters of a wide base config:
+# the regular Params.clone() versus the copy-on-write FrozenParams.clone().
+#
+# Usage:
+#    python -m benchmarks.bench_clone
+#
+
+from __future__ import division, absolute_import, print_function
+
+import time
+import tracemalloc
+
+import params as pp
+
+WideParams = type("WideParams", (pp.Params,), {"param_{}".format(idx): idx for idx in range(200)})
+
+
+def _measure(clone_fn, number):
+    start = time.perf_counter()
+    clones = [clone_fn(idx) for idx in range(number)]
+    elapsed = time.perf_counter() - start
+
+    del clones
+    tracemalloc.start()
+    clones = [clone_fn(idx) for idx in range(number)]
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del clones
+    return elapsed, memory
+
+
+def run(number=20000):
+    base = WideParams(param_0=-1)
+    frozen_base = base.freeze()
+    return [
+        ("Params.clone()", ) + _measure(lambda idx: base.clone(param_1=idx, param_2=idx), number),
+        ("FrozenParams.clone()", ) + _measure(lambda idx: frozen_base.clone(param_1=idx, param_2=idx), number),
+    ]
+
+
+if __name__ == '__main__':
+    for name, elapsed, memory in run():
+        print("{:22s} {:8.1f}ms {:10.1f}KiB".format(name, elapsed * 1000, memory / 1024))
@@ -0,0 +1,65 @@
+# coding=utf-8
+#
+# Benchmark for the start up time of ``import params`` followed by a first config load.
+#
+# Each measurement runs in a fresh python interpreter (best of ``--repeat`` runs).
+#
+# Usage:
+#    python -m benchmarks.bench_import
+#
+
+from __future__ import division, absolute_import, print_function
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LOAD_CONFIG = """
+import params as pp
+
+class ServiceParams(pp.Params):
+    batch_size = 32
+    timeout    = 1.5
+    model_name = "default"
+
+ServiceParams.from_json_file({config_file!r})
+"""
+
+
+def best_time(code, repeat, python_path=()):
+    """ Returns the best time of running ``code`` in a fresh python interpreter
+    (with the ``python_path`` directories importable, but without caching their bytecode). """
+    env = None
+    if python_path:
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join([ROOT_DIR] + list(python_path)), PYTHONDONTWRITEBYTECODE="1")
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.check_call([sys.executable, "-c", code], cwd=ROOT_DIR, env=env)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run(repeat=10):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_file = os.path.join(temp_dir, "config.json")
+        with open(config_file, "w") as fp:
+            fp.write('{"batch_size": 64, "timeout": 0.5}')
+
+        baseline = best_time("pass", repeat)
+        results = [
+            ("python -c pass", baseline),
+            ("import params", best_time("import params", repeat)),
+            ("import + first config load", best_time(LOAD_CONFIG.format(config_file=config_file), repeat)),
+        ]
+    return [(name, secs, secs - baseline) for name, secs in results]
+
+
+if __name__ == '__main__':
+    for name, secs, overhead in run():
+        print("{:30s} {:8.1f}ms  (+{:.1f}ms)".format(name, secs * 1000, overhead * 1000))
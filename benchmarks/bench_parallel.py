@@ -0,0 +1,43 @@
+# coding=utf-8
+#
+# Benchmark of Params.map_parallel() versus a naive multiprocessing Pool.map()
+# over many (cheap to evaluate) configs of a property heavy Params class.
+#
+# Usage:
+#    python -m benchmarks.bench_parallel
+#
+
+from __future__ import division, absolute_import, print_function
+
+import multiprocessing
+import time
+
+import params as pp
+
+TrialParams = type("TrialParams", (pp.Params,), dict(
+    {"param_{}".format(idx): float(idx) for idx in range(100)},
+    **{"derived_{}".format(idx): property(lambda self, idx=idx: getattr(self, "param_{}".format(idx)) * 2) for idx in range(20)}))
+
+
+def evaluate(params):
+    return params.param_1 + params.derived_1
+
+
+def run(number=50000, workers=4):
+    configs = [TrialParams(param_1=float(idx)) for idx in range(number)]
+    results = []
+
+    start = time.perf_counter()
+    with multiprocessing.Pool(workers) as pool:
+        pool.map(evaluate, configs, chunksize=256)
+    results.append(("Pool.map()", time.perf_counter() - start))
+
+    start = time.perf_counter()
+    list(TrialParams.map_parallel(evaluate, configs, workers=workers, chunksize=256))
+    results.append(("Params.map_parallel()", time.perf_counter() - start))
+    return results
+
+
+if __name__ == '__main__':
+    for name, elapsed in run():
+        print("{:22s} {:8.1f}ms".format(name, elapsed * 1000))
@@ -0,0 +1,60 @@
+# coding=utf-8
+#
+# Throughput benchmark of the Params serialization codecs
+# (keyed and positional encoding, round-trips per second).
+#
+# Usage:
+#    python -m benchmarks.bench_serialization
+#
+
+from __future__ import division, absolute_import, print_function
+
+import timeit
+
+import params as pp
+from params.codecs import get_codec
+
+
+class TrialParams(pp.Params):
+    learning_rate = 0.001
+    batch_size    = 32
+    num_layers    = 12
+    hidden_size   = 768
+    dropout       = 0.1
+    optimizer     = "adam"
+    use_bias      = True
+    vocab_path    = "gs://bucket/vocab.txt"
+    layer_sizes   = [768, 768, 3072]
+    max_steps     = pp.Param(None, dtype=int)
+
+
+def _available_codecs():
+    codecs = []
+    for codec in ["json", "json-compact", "orjson", "msgpack"]:
+        try:
+            get_codec(codec)
+            codecs.append(codec)
+        except ModuleNotFoundError:  # pragma: no cover
+            pass
+    return codecs
+
+
+def run(number=20000):
+    params = TrialParams(learning_rate=0.01)
+    results = []
+    for codec in _available_codecs():
+        for positional in [False, True]:
+            data = params.serialize(codec, positional=positional)
+
+            def round_trip():
+                TrialParams.deserialize(params.serialize(codec, positional=positional), codec, positional=positional)
+
+            secs = timeit.timeit(round_trip, number=number)
+            results.append((codec, positional, len(data), number / secs))
+    return results
+
+
+if __name__ == '__main__':
+    print("{:14s} {:10s} {:>6s} {:>14s}".format("codec", "positional", "size", "round-trips/s"))
+    for codec, positional, size, rate in run():
+        print("{:14s} {:10s} {:6d} {:14.0f}".format(codec, str(positional), size, rate))
@@ -0,0 +1,51 @@
+# coding=utf-8
+#
+# Benchmark of the overhead of the strict=True value validation
+# on parameter assignment (Params.__setitem__()) and on construction.
+#
+# Usage:
+#    python -m benchmarks.bench_validation
+#
+
+from __future__ import division, absolute_import, print_function
+
+import timeit
+from typing import List, Optional
+
+import params as pp
+
+
+class LooseParams(pp.Params):
+    learning_rate = 0.1
+    num_layers    = 2
+    name          = "model"
+    layer_sizes   = pp.Param([8, 4], dtype=List[int])
+    dropout       = pp.Param(None, dtype=Optional[float])
+
+
+class StrictParams(LooseParams, strict=True):
+    pass
+
+
+class CompactStrictParams(StrictParams, compact=True):
+    pass
+
+
+def run(number=200000):
+    results = []
+    for params_class in [LooseParams, StrictParams, CompactStrictParams]:
+        params = params_class()
+        results.append(("{} set float".format(params_class.__name__),
+                        timeit.timeit(lambda: params.__setitem__("learning_rate", 0.2), number=number)))
+        results.append(("{} set List[int]".format(params_class.__name__),
+                        timeit.timeit(lambda: params.__setitem__("layer_sizes", [16, 8, 4]), number=number)))
+        results.append(("{} set Optional".format(params_class.__name__),
+                        timeit.timeit(lambda: params.__setitem__("dropout", 0.5), number=number)))
+        results.append(("{}()".format(params_class.__name__),
+                        timeit.timeit(lambda: params_class(learning_rate=0.2, num_layers=4), number=number // 10)))
+    return results
+
+
+if __name__ == '__main__':
+    for name, elapsed in run():
+        print("{:34s} {:8.1f}ms".format(name, elapsed * 1000))
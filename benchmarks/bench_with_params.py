@@ -0,0 +1,67 @@
+# coding=utf-8
+#
+# Benchmark of building deep WithParams layer trees with WithParams.from_params(),
+# compared against an emulation of the former from_params() implementation
+# (splitting the kwargs in four passes and constructing three Params instances per object).
+#
+# Usage:
+#    python -m benchmarks.bench_with_params
+#
+
+from __future__ import division, absolute_import, print_function
+
+import timeit
+
+import params as pp
+
+
+class LegacyFromParams:
+    """ Emulates the former ``WithParams.from_params()``. """
+    @classmethod
+    def from_params(cls, params, *args, **kwargs):
+        kwargs, other_args = cls.Params.from_dict(kwargs, return_unused=True, return_instance=False)
+        kwargs = dict(cls.Params.from_dict(params, return_unused=False).clone(**kwargs))
+        kwargs.update(**other_args)
+        return cls(*args, **kwargs)
+
+
+class Layer(pp.WithParams):
+    class Params(pp.WithParams.Params):
+        units      = 64
+        activation = "relu"
+        dropout    = 0.1
+
+    def _construct(self, index=0):
+        self.index = index
+
+
+class LegacyLayer(LegacyFromParams, Layer):
+    pass
+
+
+def _layer_tree(leaf_class, depth, fanout):
+    """ Creates the WithParams classes of a tree with ``depth`` levels of ``fanout`` children each. """
+    child = leaf_class
+    for level in range(depth):
+        def construct(self, index=0, _child=child):
+            self.index = index
+            self.children = [_child.from_params(self.params, index=idx) for idx in range(fanout)]
+
+        params_class = type("Params", (child.Params,), {"level_{}".format(level): level})
+        child = type("Node{}".format(level), (child,), {"Params": params_class, "_construct": construct})
+    return child
+
+
+def run(depth=4, fanout=4, number=20):
+    results = []
+    for name, leaf_class in [("from_params", Layer), ("legacy from_params", LegacyLayer)]:
+        root_class = _layer_tree(leaf_class, depth, fanout)
+        root_params = root_class.Params()
+        secs = timeit.timeit(lambda: root_class.from_params(root_params, units=32), number=number)
+        results.append((name, sum(fanout ** level for level in range(depth + 1)), secs / number))
+    return results
+
+
+if __name__ == '__main__':
+    for name, nodes, secs in run():
+        print("{:20s} {:6d} nodes {:8.2f}ms per tree".format(name, nodes, secs * 1000))
@@ -0,0 +1,296 @@
+# coding=utf-8
+#
+# Benchmark suite of the Params hot paths - construction, attribute access, cloning,
+# serialization, WithParams trees and class creation - for small, wide, deep and property-heavy classes.
+#
+# Every scenario is calibrated to run a number of loops taking at least ``--min-time`` seconds
+# per sample and is then timed over ``--repeat`` samples (with the garbage collector disabled),
+# reporting the median and standard deviation of the time per operation, as well as the peak
+# memory allocated by a single operation (traced with ``tracemalloc``).
+#
+# Usage:
+#    python -m benchmarks.suite                          # run all scenarios
+#    python -m benchmarks.suite -k clone                 # run the scenarios matching a pattern
+#    python -m benchmarks.suite --save baseline.json     # save the results as a baseline
+#    python -m benchmarks.suite --compare baseline.json  # compare against a saved baseline
+#
+
+from __future__ import division, absolute_import, print_function
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+import params as pp
+
+#
+# scenario classes
+#
+
+
+class SmallParams(pp.Params):
+    learning_rate = 0.001
+    batch_size    = 32
+    optimizer     = "adam"
+    use_bias      = True
+    layer_sizes   = [64, 32]
+
+
+WideParams = type("WideParams", (pp.Params,), {"param_{}".format(idx): idx for idx in range(500)})
+
+
+def _deep_hierarchy(depth):
+    cls = pp.Params
+    for level in range(depth):
+        cls = type("DeepParams{}".format(level), (cls,), {
+            "param_{}_a".format(level): level,
+            "param_{}_b".format(level): str(level),
+        })
+    return cls
+
+
+DeepParams = _deep_hierarchy(50)
+
+
+def _property(idx):
+    return property(lambda self: self.base * idx + self.offset)
+
+
+PropertyParams = type("PropertyParams", (pp.Params,), dict(
+    {"base": 2, "offset": 1},
+    **{"prop_{}".format(idx): _property(idx) for idx in range(50)}))
+
+
+CLASS_TEMPLATE = """
+class Params{idx}({base}):
+    param_{idx}_a = {idx}
+    param_{idx}_b = pp.Param("{idx}", doc="parameter b of class {idx}")
+
+    @property
+    def param_{idx}_c(self):
+        return self.param_{idx}_a * 2
+"""
+
+
+def class_chains_source(num_classes=1000, chain_length=10):
+    """ Generates a module with ``num_classes`` Params subclasses in single inheritance
+    chains of ``chain_length`` classes (with plain, ``Param()`` and ``@property`` parameters). """
+    lines = ["import params as pp"]
+    for idx in range(num_classes):
+        base = "pp.Params" if idx % chain_length == 0 else "Params{}".format(idx - 1)
+        lines.append(CLASS_TEMPLATE.format(idx=idx, base=base))
+    return "\n".join(lines)
+
+
+class Layer(pp.WithParams):
+    class Params(pp.WithParams.Params):
+        units      = 64
+        activation = "relu"
+        use_bias   = True
+
+    def _construct(self, *args, **kwargs):
+        super()._construct(*args, **kwargs)
+
+
+class Block(pp.WithParams):
+    class Params(Layer.Params):
+        num_layers = 10
+
+    def _construct(self, *args, **kwargs):
+        super()._construct(*args, **kwargs)
+        self.layers = [Layer.from_params(self.params) for _ in range(self.params.num_layers)]
+
+
+class Model(pp.WithParams):
+    class Params(Block.Params):
+        num_blocks = 10
+
+    def _construct(self, *args, **kwargs):
+        super()._construct(*args, **kwargs)
+        self.blocks = [Block.from_params(self.params) for _ in range(self.params.num_blocks)]
+
+
+#
+# scenarios - each returns the operation to measure
+#
+
+def _scenarios():
+    small, wide, deep, props = SmallParams(batch_size=64), WideParams(param_1=-1), DeepParams(), PropertyParams()
+    wide_args = dict(wide, unused_arg=1)
+    wide_json, small_yaml = wide.to_json_string(), small.to_yaml_string()
+    records = [dict(small, batch_size=idx) for idx in range(1000)]
+    instances = list(SmallParams.from_records(records))
+    jsonl = [params.serialize() for params in instances]
+    class_chains = compile(class_chains_source(1000), "class_chains", "exec")
+
+    return {
+        "construct/small": lambda: SmallParams(batch_size=64),
+        "construct/wide500": lambda: WideParams(param_1=-1),
+        "construct/deep50": lambda: DeepParams(param_0_a=-1),
+        "construct/properties50": lambda: PropertyParams(base=3),
+        "access/small": lambda: small.batch_size,
+        "access/wide500": lambda: wide.param_499,
+        "access/deep50": lambda: deep.param_0_a,
+        "access/property": lambda: props.prop_49,
+        "access/item": lambda: small["batch_size"],
+        "set/small": lambda: small.__setitem__("batch_size", 16),
+        "from_dict/wide500": lambda: WideParams.from_dict(wide_args),
+        "clone/small": lambda: small.clone(batch_size=8),
+        "clone/wide500": lambda: wide.clone(param_2=-2),
+        "clone/frozen_wide500": (lambda frozen: lambda: frozen.clone(param_2=-2))(wide.freeze()),
+        "json/to_string_wide500": wide.to_json_string,
+        "json/from_string_wide500": lambda: WideParams.from_json_string(wide_json),
+        "yaml/to_string_small": small.to_yaml_string,
+        "yaml/from_string_small": lambda: SmallParams.from_yaml_string(small_yaml),
+        "bulk/serialize_1000": lambda: [params.serialize() for params in instances],
+        "bulk/deserialize_1000": lambda: [SmallParams.deserialize(line) for line in jsonl],
+        "bulk/from_records_1000": lambda: list(SmallParams.from_records(records)),
+        "with_params/layer": lambda: Layer(units=32),
+        "with_params/from_params": (lambda params: lambda: Layer.from_params(params, units=16))(Layer.Params()),
+        "with_params/tree_111": lambda: Model(num_blocks=10, num_layers=10),
+        "classes/create_1000": lambda: exec(class_chains, {}),
+    }
+
+
+#
+# timing
+#
+
+def _time_loops(fn, loops):
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        return time.perf_counter() - start
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def _calibrate(fn, min_time):
+    loops = 1
+    while True:
+        elapsed = _time_loops(fn, loops)
+        if elapsed >= min_time:
+            return loops
+        loops *= 2 if elapsed <= 0 else max(2, min(10, int(min_time / elapsed * 1.2) + 1))
+
+
+def _peak_memory(fn):
+    fn()                                        # warm up any caches
+    tracemalloc.start()
+    try:
+        result = fn()                           # keep the result alive while tracing
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak
+
+
+def measure(fn, repeat=7, min_time=0.05):
+    """ Returns the median and standard deviation of the time per operation and its peak memory. """
+    loops = _calibrate(fn, min_time)
+    _time_loops(fn, loops)                      # warm up
+    samples = [_time_loops(fn, loops) / loops for _ in range(repeat)]
+    return {
+        "median": statistics.median(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "loops": loops,
+        "peak_memory": _peak_memory(fn),
+    }
+
+
+def run(pattern=None, repeat=7, min_time=0.05, verbose=True):
+    results = {}
+    for name, fn in _scenarios().items():
+        if pattern and pattern not in name:
+            continue
+        results[name] = measure(fn, repeat=repeat, min_time=min_time)
+        if verbose:
+            print(_format_result(name, results[name]), flush=True)
+    return results
+
+
+#
+# reporting
+#
+
+def _format_time(secs):
+    for unit, scale in [("s", 1), ("ms", 1e-3), ("us", 1e-6)]:
+        if secs >= scale:
+            return "{:8.2f}{:2s}".format(secs / scale, unit)
+    return "{:8.1f}ns".format(secs / 1e-9)
+
+
+def _format_result(name, result):
+    return "{:28s} {} +- {}  peak {:10.1f}KiB".format(
+        name, _format_time(result["median"]), _format_time(result["stdev"]).strip(), result["peak_memory"] / 1024)
+
+
+def compare(baseline, results, threshold=0.1):
+    """ Prints the results relative to the baseline and returns the names of the regressed scenarios. """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            print("{:28s} {}  (not in baseline)".format(name, _format_time(result["median"])))
+            continue
+        ratio = result["median"] / base["median"]
+        if ratio > 1 + threshold:
+            status = "SLOWER"
+            regressions.append(name)
+        elif ratio < 1 - threshold:
+            status = "faster"
+        else:
+            status = ""
+        print("{:28s} {} -> {}  x{:5.2f}  peak {:8.1f} -> {:8.1f}KiB  {}".format(
+            name, _format_time(base["median"]), _format_time(result["median"]), ratio,
+            base["peak_memory"] / 1024, result["peak_memory"] / 1024, status))
+    return regressions
+
+
+def _metadata():
+    return {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "params": pp.__version__,
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Runs the Params benchmark suite.")
+    parser.add_argument("-k", dest="pattern", default=None, help="run only the scenarios containing PATTERN")
+    parser.add_argument("--repeat", type=int, default=7, help="number of timed samples per scenario")
+    parser.add_argument("--min-time", type=float, default=0.05, help="minimal duration of a sample in seconds")
+    parser.add_argument("--save", metavar="FILE", help="save the results as a JSON baseline")
+    parser.add_argument("--compare", metavar="FILE", help="compare the results against a saved JSON baseline")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="relative slow down reported as a regression (default: 0.1)")
+    args = parser.parse_args(argv)
+
+    results = run(args.pattern, repeat=args.repeat, min_time=args.min_time, verbose=not args.compare)
+    if args.save:
+        with open(args.save, "w") as fp:
+            json.dump({"metadata": _metadata(), "results": results}, fp, indent=2, sort_keys=True)
+    if args.compare:
+        with open(args.compare, "r") as fp:
+            baseline = json.load(fp)
+        print("baseline: {}".format(baseline.get("metadata")))
+        regressions = compare(baseline["results"], results, args.threshold)
+        if regressions:
+            print("{} regression(s): {}".format(len(regressions), ", ".join(regressions)))
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
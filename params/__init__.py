@@ -5,5 +5,12 @@
 
 from .version import __version__
 
-from .params import Params, Param
+from .params import Params, Param, FrozenParams
 from .with_params import WithParams
+from .table import ParamsTable
+from .file_io import register_file_backend
+from .codecs import register_codec
+from .archive import ParamsArchive
+from .sweep import ParamsGrid, ParamsSampler
+from .cli import ParamsArgumentParser
+from .watcher import ParamsWatcher
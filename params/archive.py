@@ -0,0 +1,218 @@
+# coding=utf-8
+#
+# created by kpe on 18.10.2026 at 7:10 PM
+#
+
+from __future__ import division, absolute_import, print_function
+
+import array
+import json
+import mmap
+import struct
+import sys
+from typing import Text, Type
+
+from .params import Params
+from .table import _TYPECODES, _numpy
+
+_MAGIC = b"PYPARAM1"
+_HEADER_SIZE = struct.Struct("<Q")
+_ALIGNMENT = 8
+
+
+def _padding(size: int) -> int:
+    return -size % _ALIGNMENT
+
+
+def _column_kind(dtype, values) -> Text:
+    """ Selects the storage kind of a column - one of the array typecodes, ``str`` or ``json``. """
+    typecode = _TYPECODES.get(dtype)
+    if typecode is not None:
+        if any(type(value) is not dtype for value in values):
+            return "json"                       # i.e. None values or 1 for a float
+        try:
+            array.array(typecode, values)
+            return typecode
+        except OverflowError:
+            return "json"
+    if dtype is str and all(isinstance(value, str) for value in values):
+        return "str"
+    return "json"
+
+
+class ParamsArchive:
+    """
+    A read-only, memory-mapped binary archive of many instances of a single ``Params`` class,
+    providing O(1) random access by index without parsing the whole file.
+
+    The archive stores the (non ``@property``) parameters in columns - a fixed-width column
+    for the ``bool``, ``int`` and ``float`` parameters, and an offset index into a string heap
+    for the ``str`` (UTF-8) and all other (JSON encoded) parameters.
+
+    Example:
+
+        import params as pp
+
+        pp.ParamsArchive.write("trials.bin", MyParams, trials)
+
+        with pp.ParamsArchive("trials.bin", MyParams) as archive:
+            trial = archive[1000000]                     # a MyParams instance
+            lrs = archive.column("learning_rate")        # zero-copy NumPy view
+    """
+
+    def __init__(self, file_path, params_class: Type[Params]):
+        """
+        Opens an archive (local files only) written with ``ParamsArchive.write()``.
+
+        :param file_path: the archive path.
+        :param params_class: the ``Params`` subclass of the archived instances - it must declare
+               all the archived parameters (parameters not in the archive take their default value).
+        """
+        self.params_class = params_class
+        with open(file_path, "rb") as fp:
+            self._mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buffer = memoryview(self._mmap)
+        try:
+            self._open()
+        except Exception:
+            self.close()
+            raise
+
+    def _open(self):
+        if bytes(self._buffer[:len(_MAGIC)]) != _MAGIC:
+            raise ValueError("Not a Params archive (bad magic)")
+        header_size, = _HEADER_SIZE.unpack_from(self._buffer, len(_MAGIC))
+        header_offset = len(_MAGIC) + _HEADER_SIZE.size
+        header = json.loads(bytes(self._buffer[header_offset:header_offset + header_size]).decode("utf-8"))
+        if header["byteorder"] != sys.byteorder:
+            raise ValueError("Params archive written with a {} endian byte order".format(header["byteorder"]))
+
+        self._size = header["count"]
+        self._columns = header["columns"]
+        data_offset = header_offset + header_size + _padding(header_size)
+        for column in self._columns:
+            for key in ["offset", "heap_offset"]:
+                if key in column:
+                    column[key] += data_offset
+        names = [column["name"] for column in self._columns]
+        self.params_class._check_keys(dict.fromkeys(names))
+
+        self._views = {}
+        for column in self._columns:
+            offset, kind = column["offset"], column["kind"]
+            if kind in ("str", "json"):
+                view = self._buffer[offset:offset + (self._size + 1) * 8].cast("Q")
+            else:
+                view = self._buffer[offset:offset + self._size * array.array(kind).itemsize].cast(kind)
+            self._views[column["name"]] = view
+
+    @staticmethod
+    def write(file_path, params_class: Type[Params], instances) -> int:
+        """ Writes the given instances (or dictionaries) of ``params_class`` to an archive file.
+
+        :return: the number of instances written.
+        """
+        specs = params_class.param_specs()
+        names = params_class.value_names()
+        values = {name: [] for name in names}
+        for params in instances:
+            if not isinstance(params, params_class):
+                params = params_class(params)
+            for name in names:
+                values[name].append(params[name])
+        count = len(values[names[0]]) if names else 0
+
+        columns, sections = [], []
+        for name in names:
+            kind = _column_kind(specs[name].dtype, values[name])
+            column = {"name": name, "kind": kind}
+            if kind in ("str", "json"):
+                if kind == "str":
+                    encoded = [value.encode("utf-8") for value in values[name]]
+                else:
+                    encoded = [json.dumps(value, separators=(",", ":")).encode("utf-8") for value in values[name]]
+                offsets = array.array("Q", [0])
+                for data in encoded:
+                    offsets.append(offsets[-1] + len(data))
+                sections.append((column, "offset", offsets.tobytes()))
+                sections.append((column, "heap_offset", b"".join(encoded)))
+            else:
+                sections.append((column, "offset", array.array(kind, values[name]).tobytes()))
+            columns.append(column)
+
+        offset = 0                              # relative to the end of the header
+        for column, key, data in sections:
+            column[key] = offset
+            offset += len(data) + _padding(len(data))
+
+        header = json.dumps({"params_class": "{}.{}".format(params_class.__module__, params_class.__qualname__),
+                             "byteorder": sys.byteorder, "count": count, "columns": columns}).encode("utf-8")
+        with open(file_path, "wb") as fp:
+            fp.write(_MAGIC)
+            fp.write(_HEADER_SIZE.pack(len(header)))
+            fp.write(header + b"\0" * _padding(len(header)))
+            for _, _, data in sections:
+                fp.write(data + b"\0" * _padding(len(data)))
+        return count
+
+    def __len__(self):
+        return self._size
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """ Closes the archive (fails if NumPy column views are still referenced). """
+        for view in getattr(self, "_views", {}).values():
+            view.release()
+        self._views = {}
+        self._buffer.release()
+        self._mmap.close()
+
+    def _value(self, column, index):
+        view = self._views[column["name"]]
+        kind = column["kind"]
+        if kind == "b":
+            return bool(view[index])
+        if kind in ("str", "json"):
+            heap_offset = column["heap_offset"]
+            data = self._buffer[heap_offset + view[index]:heap_offset + view[index + 1]]
+            return str(data, "utf-8") if kind == "str" else json.loads(bytes(data))
+        return view[index]
+
+    def __getitem__(self, index: int) -> Params:
+        """ Materializes the instance at the given index. """
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("ParamsArchive index out of range")
+        return self.params_class._from_valid_dict({column["name"]: self._value(column, index)
+                                                   for column in self._columns})
+
+    def __iter__(self):
+        for index in range(self._size):
+            yield self[index]
+
+    def column(self, name: Text):
+        """ Returns the values of the given parameter.
+
+        The fixed-width columns are returned as a zero-copy NumPy view into the archive
+        (or a ``memoryview`` if NumPy is not available), all other columns as a ``list``.
+        """
+        for column in self._columns:
+            if column["name"] == name:
+                break
+        else:
+            raise KeyError("Parameter '{}' not in the archive".format(name))
+
+        kind = column["kind"]
+        if kind in ("str", "json"):
+            return [self._value(column, index) for index in range(self._size)]
+        np = _numpy()
+        if np is None:  # pragma: no cover
+            return self._views[name]
+        dtype = np.bool_ if kind == "b" else np.dtype(kind)
+        return np.frombuffer(self._mmap, dtype=dtype, count=self._size, offset=column["offset"])
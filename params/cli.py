@@ -0,0 +1,53 @@
+# coding=utf-8
+#
+# created by kpe on 19.10.2026 at 8:20 PM
+#
+
+from __future__ import division, absolute_import, print_function
+
+import argparse
+from typing import Text, Type, Dict
+
+from .params import Params
+
+
+class ParamsArgumentParser(argparse.ArgumentParser):
+    """
+    An ``argparse`` parser for the parameters of several ``Params`` classes,
+    parsing them in a single pass, with the options of every class namespaced
+    by a prefix (i.e. ``--model.num-layers``).
+
+    Example:
+
+        import params as pp
+
+        parser = pp.ParamsArgumentParser({"model": Model.Params, "train": TrainParams})
+        params = parser.parse_params(["--model.num-layers", "4", "--train.learning-rate", "0.01"])
+        model = Model.from_params(params["model"])
+
+    :param params_classes: a dict with the ``Params`` classes keyed by their namespace prefix.
+    :param kwargs: passed to ``argparse.ArgumentParser``.
+    """
+
+    def __init__(self, params_classes: Dict[Text, Type[Params]], **kwargs):
+        super(ParamsArgumentParser, self).__init__(**kwargs)
+        self.params_classes = dict(params_classes)
+        self._dests = {}
+        for prefix, params_class in self.params_classes.items():
+            group = self.add_argument_group(prefix, params_class.__doc__)
+            self._dests[prefix] = params_class._add_arguments(group, prefix)
+
+    def params_from_namespace(self, namespace: argparse.Namespace) -> Dict[Text, Params]:
+        """ Constructs an instance of every class from the parsed ``namespace``. """
+        return {prefix: params_class._from_namespace(namespace, self._dests[prefix])
+                for prefix, params_class in self.params_classes.items()}
+
+    def parse_params(self, argv=None) -> Dict[Text, Params]:
+        """ Parses the command line arguments into a dict of instances keyed by their namespace prefix. """
+        return self.params_from_namespace(self.parse_args(argv))
+
+    def parse_known_params(self, argv=None):
+        """ Like ``parse_params()``, but returns a ``(params, unused_argv)`` tuple instead of failing
+        on unknown arguments. """
+        namespace, unused_argv = self.parse_known_args(argv)
+        return self.params_from_namespace(namespace), unused_argv
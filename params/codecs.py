@@ -0,0 +1,70 @@
+# coding=utf-8
+#
+# created by kpe on 18.10.2026 at 5:30 PM
+#
+
+from __future__ import division, absolute_import, print_function
+
+import collections
+import functools
+import json
+from typing import Text, Callable
+
+Codec = collections.namedtuple("Codec", ["dumps", "loads"])
+
+
+def _json_codec():
+    return Codec(lambda obj: json.dumps(obj, indent=2, sort_keys=True) + "\n", json.loads)
+
+
+def _json_compact_codec():
+    return Codec(json.JSONEncoder(separators=(",", ":")).encode, json.loads)
+
+
+def _orjson_codec():
+    try:
+        import orjson
+    except Exception:  # pragma: no cover
+        raise ModuleNotFoundError("orjson not found. Try installing with: `pip install orjson`")  # pragma: no cover
+    return Codec(orjson.dumps, orjson.loads)
+
+
+def _msgpack_codec():
+    try:
+        import msgpack
+    except Exception:  # pragma: no cover
+        raise ModuleNotFoundError("msgpack not found. Try installing with: `pip install msgpack`")  # pragma: no cover
+    return Codec(functools.partial(msgpack.packb, use_bin_type=True),
+                 functools.partial(msgpack.unpackb, raw=False))
+
+
+_CODECS = {
+    "json": _json_codec,
+    "json-compact": _json_compact_codec,
+    "orjson": _orjson_codec,
+    "msgpack": _msgpack_codec,
+}
+
+_resolved = {}
+
+
+def register_codec(name: Text, dumps: Callable, loads: Callable):
+    """
+    Registers a codec to be used with ``Params.serialize()`` and ``Params.deserialize()``.
+
+    :param name: the codec name.
+    :param dumps: a callable encoding a ``dict`` or ``list`` to ``str`` or ``bytes``.
+    :param loads: a callable decoding the output of ``dumps``.
+    """
+    _CODECS[name] = lambda: Codec(dumps, loads)
+    _resolved.pop(name, None)
+
+
+def get_codec(name: Text) -> Codec:
+    """ Returns the codec registered with the given name (importing its module on first use). """
+    codec = _resolved.get(name)
+    if codec is None:
+        if name not in _CODECS:
+            raise ValueError("Unknown codec '{}', expected one of: {}".format(name, ", ".join(_CODECS)))
+        codec = _resolved[name] = _CODECS[name]()
+    return codec
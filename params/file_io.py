@@ -0,0 +1,100 @@
+# coding=utf-8
+#
+# created by kpe on 18.10.2026 at 4:05 PM
+#
+
+from __future__ import division, absolute_import, print_function
+
+import os
+from typing import Text, Callable, Union
+
+
+def _local_open():
+    return open
+
+
+def _tensorflow_open():
+    try:
+        import tensorflow as tf
+    except Exception:  # pragma: no cover
+        raise ModuleNotFoundError("TensorFlow not found. Try installing with: `pip install tensorflow`")  # pragma: no cover
+    return tf.io.gfile.GFile  # pragma: no cover
+
+
+def _fsspec_open():
+    try:
+        import fsspec
+    except Exception:  # pragma: no cover
+        raise ModuleNotFoundError("fsspec not found. Try installing with: `pip install fsspec`")  # pragma: no cover
+    return fsspec.open  # pragma: no cover
+
+
+_BACKENDS = {
+    "local": _local_open,
+    "tensorflow": _tensorflow_open,
+    "fsspec": _fsspec_open,
+}
+
+_FALLBACK_BACKENDS = ["tensorflow", "fsspec"]   # tried in order for URL schemes not registered
+
+_schemes = {"": "local", "file": "local"}       # URL scheme -> backend name or open() callable
+_resolved = {}                                  # URL scheme -> resolved open() callable
+
+
+def register_file_backend(scheme: Text, backend: Union[Text, Callable]):
+    """
+    Registers the ``open()`` implementation used for the file paths with the given URL scheme
+    by ``Params.from_json_file()``, ``Params.to_json_file()`` and the other file methods.
+
+    Local paths are always opened with python's ``open()``. The backend of a not registered
+    URL scheme is resolved on first use by trying ``tensorflow`` and ``fsspec`` (in this order).
+
+    Example:
+
+        import params as pp
+
+        pp.register_file_backend("gs", "tensorflow")   # use tf.io.gfile.GFile for gs:// paths
+        pp.register_file_backend("s3", "fsspec")       # use fsspec.open for s3:// paths
+
+    :param scheme: the URL scheme, i.e. ``gs`` for ``gs://bucket/config.json``.
+    :param backend: one of ``local``, ``tensorflow``, ``fsspec`` or a callable
+           with the signature of ``open(path, mode)`` returning a context manager.
+    """
+    if not callable(backend) and backend not in _BACKENDS:
+        raise ValueError("Unknown file backend '{}', expected one of: {} or a callable".format(
+            backend, ", ".join(_BACKENDS)))
+    _schemes[scheme] = backend
+    _resolved.pop(scheme, None)
+
+
+def _url_scheme(path: Text) -> Text:
+    scheme, sep, _ = path.partition("://")
+    return scheme.lower() if sep and scheme.isidentifier() else ""
+
+
+def _resolve(scheme: Text) -> Callable:
+    backend = _schemes.get(scheme)
+    if callable(backend):
+        return backend
+    if backend is not None:
+        return _BACKENDS[backend]()
+
+    for backend in _FALLBACK_BACKENDS:
+        try:
+            return _BACKENDS[backend]()
+        except ModuleNotFoundError:  # pragma: no cover
+            continue                 # pragma: no cover
+    raise ValueError("No file backend available for the '{}://' URL scheme. "
+                     "Try installing tensorflow or fsspec.".format(scheme))
+
+
+def open_file(path, mode: Text = "r", **kwargs):
+    """ Opens the given local path or URL with the ``open()`` implementation registered for its URL scheme. """
+    path = os.fspath(path)
+    scheme = _url_scheme(path)
+    open_fn = _resolved.get(scheme)
+    if open_fn is None:
+        open_fn = _resolved[scheme] = _resolve(scheme)
+    if scheme == "file" and open_fn is open:
+        path = path[len("file://"):]
+    return open_fn(path, mode, **kwargs)
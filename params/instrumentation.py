@@ -0,0 +1,259 @@
+# coding=utf-8
+#
+# created by kpe on 20.10.2026 at 9:30 AM
+#
+
+"""
+Opt-in instrumentation of the parameter access of ``Params`` classes.
+
+An instrumented class counts the reads (attribute and item access) and the writes (assignments)
+of every parameter and times the evaluations of its ``@property`` parameters. Instrumentation
+is enabled per class with ``instrument=True`` or globally with ``enable()``, by installing
+counting wrappers on the instrumented classes only, so the classes not instrumented run
+at full speed (and the subclasses not instrumented of an instrumented class are not counted).
+
+Example:
+
+    import params as pp
+    from params import instrumentation
+
+    class MyParams(pp.Params, instrument=True):
+        ...
+
+    instrumentation.enable()                    # or instrument all the Params classes
+    ...
+    print(instrumentation.format_report())
+    instrumentation.unread_params(MyParams)     # i.e. ['unused_param']
+
+    instrumentation.register_metrics_hook(lambda stats: push_to_metrics(stats))
+    instrumentation.publish()
+
+**N.B.** the ``@property`` parameters are evaluated (and therefore counted as read) once on construction.
+The counters are not synchronized across threads and might miss updates under contention.
+"""
+
+from __future__ import division, absolute_import, print_function
+
+import collections
+import inspect
+import time
+from typing import Text, Callable, List
+
+ParamStats = collections.namedtuple("ParamStats", ["params_class", "name", "reads", "writes",
+                                                   "evaluations", "eval_time"])
+
+_enabled = False
+_counters = {}          # Params class -> {parameter name: _ParamCounter} (kept when uninstrumented)
+_originals = {}         # instrumented Params class -> [(target class, attribute name, original or None)]
+_metrics_hooks = []
+
+
+class _ParamCounter:
+    __slots__ = ("reads", "writes", "evaluations", "eval_time")
+
+    def __init__(self):
+        self.reads = self.writes = self.evaluations = 0
+        self.eval_time = 0.0
+
+
+def _instance_of(instance, params_class) -> bool:
+    """ Returns True if ``instance`` is an instance of ``params_class`` (or of its generated storage,
+    frozen or copy-on-write classes), but not of a subclass inheriting its instrumentation. """
+    cls = type(instance)
+    return (getattr(cls, "_public_class_", None) or cls) is params_class
+
+
+class _ProfiledProperty:
+    """ Wraps the descriptor of an ``@property`` parameter counting and timing its evaluations. """
+    __slots__ = ("attribute", "counter", "params_class")
+
+    def __init__(self, attribute, counter: _ParamCounter, params_class):
+        self.attribute = attribute
+        self.counter = counter
+        self.params_class = params_class
+
+    def __get__(self, instance, owner=None):
+        if instance is None or not _instance_of(instance, self.params_class):
+            return self.attribute.__get__(instance, owner)
+        counter = self.counter
+        counter.reads += 1
+        start = time.perf_counter()
+        try:
+            return self.attribute.__get__(instance, owner)
+        finally:
+            counter.evaluations += 1
+            counter.eval_time += time.perf_counter() - start
+
+    def __set__(self, instance, value):
+        self.attribute.__set__(instance, value)
+
+
+class _CountingSlot:
+    """ Wraps the ``__slots__`` member descriptor of a compact Params storage class counting the reads. """
+    __slots__ = ("member", "counter")
+
+    def __init__(self, member, counter: _ParamCounter):
+        self.member = member
+        self.counter = counter
+
+    def __get__(self, instance, owner=None):
+        if instance is not None:
+            self.counter.reads += 1
+        return self.member.__get__(instance, owner)
+
+    def __set__(self, instance, value):
+        self.member.__set__(instance, value)
+
+    def __delete__(self, instance):
+        self.member.__delete__(instance)
+
+
+def _counting_getitem(getitem, counters, params_class):
+    def __getitem__(self, key):
+        if _instance_of(self, params_class):
+            counter = counters.get(key)
+            if counter is not None:
+                counter.reads += 1
+        return getitem(self, key)
+    __getitem__.__wrapped__ = getitem
+    return __getitem__
+
+
+def _counting_setitem(setitem, counters, params_class):
+    def __setitem__(self, key, value):
+        setitem(self, key, value)
+        if _instance_of(self, params_class):
+            counter = counters.get(key)
+            if counter is not None:
+                counter.writes += 1
+    __setitem__.__wrapped__ = setitem
+    return __setitem__
+
+
+def _unwrapped(method):
+    while hasattr(method, "__wrapped__"):
+        method = method.__wrapped__
+    return method
+
+
+def _replace(params_class, target, name, value):
+    _originals[params_class].append((target, name, target.__dict__.get(name)))
+    setattr(target, name, value)
+
+
+def instrument_class(params_class):
+    """ Instruments the given Params class (called for the classes declared with ``instrument=True``). """
+    if params_class in _originals:
+        return
+    counters = _counters.get(params_class)
+    if counters is None:
+        counters = _counters[params_class] = {name: _ParamCounter() for name in params_class.param_specs()}
+    _originals[params_class] = []
+
+    if params_class._Params__compact:
+        storage_class = params_class._Params__compact_class
+        for name, slot in storage_class._slot_names_.items():   # item and attribute reads end up in the slots
+            _replace(params_class, storage_class, slot, _CountingSlot(storage_class.__dict__[slot], counters[name]))
+    else:
+        storage_class = params_class
+        _replace(params_class, storage_class, "__getitem__",
+                 _counting_getitem(_unwrapped(storage_class.__getitem__), counters, params_class))
+    _replace(params_class, storage_class, "__setitem__",
+             _counting_setitem(_unwrapped(storage_class.__setitem__), counters, params_class))
+
+    for spec in params_class._Params__prop_specs:
+        attribute = inspect.getattr_static(params_class, spec.name)     # might be inherited
+        while isinstance(attribute, _ProfiledProperty):
+            attribute = attribute.attribute
+        _replace(params_class, params_class, spec.name, _ProfiledProperty(attribute, counters[spec.name], params_class))
+
+
+def uninstrument_class(params_class):
+    """ Removes the instrumentation of the given Params class (keeping its collected statistics). """
+    for target, name, original in reversed(_originals.pop(params_class, [])):
+        if original is None:
+            delattr(target, name)
+        else:
+            setattr(target, name, original)
+
+
+def _params_classes():
+    from .params import Params, FrozenParams, _CompactParams, _CopyOnWriteParams
+    generated = (_CompactParams, FrozenParams, _CopyOnWriteParams)
+    stack, seen = [Params], set()
+    while stack:
+        for subclass in stack.pop().__subclasses__():
+            if subclass not in seen and not issubclass(subclass, generated):
+                seen.add(subclass)
+                stack.append(subclass)
+                yield subclass
+
+
+def is_enabled() -> bool:
+    """ Returns True if all the Params classes are instrumented (see ``enable()``). """
+    return _enabled
+
+
+def enable():
+    """ Instruments all the existing and all the Params classes defined later. """
+    global _enabled
+    _enabled = True
+    for params_class in _params_classes():
+        instrument_class(params_class)
+
+
+def disable():
+    """ Removes the instrumentation of the Params classes not declared with ``instrument=True``. """
+    global _enabled
+    _enabled = False
+    for params_class in list(_originals):
+        if not params_class._Params__instrument:
+            uninstrument_class(params_class)
+
+
+def report(params_class=None) -> List[ParamStats]:
+    """ Returns the collected statistics of every parameter (of the given or of all instrumented classes). """
+    rows = []
+    for cls in ([params_class] if params_class is not None else list(_counters)):
+        for name, counter in _counters.get(cls, {}).items():
+            rows.append(ParamStats(cls, name, counter.reads, counter.writes, counter.evaluations, counter.eval_time))
+    return rows
+
+
+def unread_params(params_class) -> List[Text]:
+    """ Returns the names of the parameters of ``params_class`` not read since instrumented. """
+    return [stats.name for stats in report(params_class) if stats.reads == 0]
+
+
+def format_report(params_class=None, sort_by: Text = "reads") -> Text:
+    """ Formats the statistics (see ``report()``) as a table sorted by the given column (descending). """
+    rows = sorted(report(params_class), key=lambda stats: getattr(stats, sort_by), reverse=True)
+    lines = ["{:24s} {:24s} {:>10s} {:>10s} {:>10s} {:>12s}".format(
+        "class", "parameter", "reads", "writes", "evals", "eval time")]
+    for stats in rows:
+        lines.append("{:24s} {:24s} {:10d} {:10d} {:10d} {:10.3f}ms".format(
+            stats.params_class.__qualname__, stats.name, stats.reads, stats.writes,
+            stats.evaluations, stats.eval_time * 1000))
+    return "\n".join(lines)
+
+
+def reset():
+    """ Resets the collected statistics. """
+    for counters in _counters.values():
+        for counter in counters.values():
+            counter.__init__()
+
+
+def register_metrics_hook(hook: Callable):
+    """ Registers a callable to be called by ``publish()`` with the list of ``ParamStats``. """
+    _metrics_hooks.append(hook)
+
+
+def publish(reset_stats: bool = True):
+    """ Calls the registered metrics hooks with the collected statistics (and resets them). """
+    stats = report()
+    for hook in list(_metrics_hooks):
+        hook(stats)
+    if reset_stats:
+        reset()
+    return stats
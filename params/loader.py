@@ -0,0 +1,115 @@
+# coding=utf-8
+#
+# created by kpe on 19.10.2026 at 9:15 PM
+#
+
+from __future__ import division, absolute_import, print_function
+
+import argparse
+import json
+import os
+from typing import Text, Type, Dict, Mapping
+
+from .file_io import open_file
+from .params import Params
+from .validation import parse_text
+
+DEFAULT_SOURCE = "default"
+ARGV_SOURCE    = "argv"
+
+_NOT_GIVEN = object()
+
+
+def _read_file(params_class: Type[Params], file_path) -> Dict:
+    file_path = os.fspath(file_path)
+    with open_file(file_path, "r") as reader:
+        text = reader.read()
+    if file_path.lower().endswith((".yaml", ".yml")):
+        Params._check_yaml_import()
+        import yaml
+        values = yaml.safe_load(text)
+    else:
+        values = json.loads(text)
+    if values is None:
+        return {}                       # i.e. an empty YAML file
+    if not isinstance(values, dict):
+        raise TypeError("Expected a {} record in {}, but got: {}".format(
+            params_class.__name__, file_path, type(values).__name__))
+    return values
+
+
+def parse_env_value(dtype, text: Text):
+    """ Parses an environment variable string into a value of ``dtype``
+    (with JSON for lists, dicts and the other non scalar types). """
+    return parse_text(dtype, text)
+
+
+def _read_env(params_class: Type[Params], env_prefix: Text, environ: Mapping):
+    specs = params_class.param_specs()
+    layer = {}
+    for name in params_class.value_names():
+        env_name = env_prefix + name.upper()
+        if env_name in environ:
+            try:
+                layer[name] = parse_env_value(specs[name].dtype, environ[env_name])
+            except TypeError as err:
+                raise TypeError("Invalid value of the environment variable {} for parameter '{}' "
+                                "in Params instance '{}': {}".format(env_name, name, params_class.__name__, err))
+    return layer
+
+
+def _read_argv(params_class: Type[Params], argv):
+    parser = argparse.ArgumentParser()
+    dests = params_class._add_arguments(parser, required=False)         # might be set by the other sources
+    parser.set_defaults(**{dest: _NOT_GIVEN for _, dest in dests})    # collect only the given arguments
+    namespace = vars(parser.parse_args(argv))
+    return parser, {param_name: namespace[dest] for param_name, dest in dests if namespace[dest] is not _NOT_GIVEN}
+
+
+def _check_required(params_class: Type[Params], parser: argparse.ArgumentParser, values: Dict):
+    specs = params_class.param_specs()
+    missing = [arg_name for param_name, _, arg_name, _ in params_class._argument_specs()
+               if (specs[param_name].required or specs[param_name].positional) and param_name not in values]
+    if missing:
+        parser.error("the following arguments are required: {}".format(", ".join(missing)))
+
+
+def load(params_class: Type[Params], layers=(), env_prefix: Text = None, argv=None,
+         check_params=False, return_sources=False, environ: Mapping = None):
+    """ Implements ``Params.load()``. """
+    resolved = []                               # (source, raw overrides) in order of precedence
+    for index, layer in enumerate(layers):
+        if layer is None:
+            continue
+        if isinstance(layer, Mapping):
+            resolved.append(("layer[{}]".format(index), dict(layer)))
+        else:
+            resolved.append((os.fspath(layer), _read_file(params_class, layer)))
+    if env_prefix is not None:
+        environ = os.environ if environ is None else environ
+        resolved.extend(("env:" + env_prefix + name.upper(), {name: value})
+                        for name, value in _read_env(params_class, env_prefix, environ).items())
+    argv_parser = None
+    if argv is not None:
+        argv_parser, argv_values = _read_argv(params_class, argv)
+        resolved.append((ARGV_SOURCE, argv_values))
+
+    values, sources = {}, {}
+    for source, overrides in resolved:
+        if check_params:
+            try:
+                params_class._check_keys(overrides)
+            except AttributeError as err:
+                raise AttributeError("{} (in {})".format(err, source)) from None
+        for name, value in overrides.items():
+            if name in params_class.param_specs():
+                values[name] = value
+                sources[name] = source
+
+    if argv_parser is not None:
+        _check_required(params_class, argv_parser, values)
+
+    params = params_class._from_valid_dict(values)
+    if return_sources:
+        return params, {name: sources.get(name, DEFAULT_SOURCE) for name in params_class.value_names()}
+    return params
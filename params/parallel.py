@@ -0,0 +1,52 @@
+# coding=utf-8
+#
+# created by kpe on 19.10.2026 at 1:30 PM
+#
+
+from __future__ import division, absolute_import, print_function
+
+import itertools
+import multiprocessing
+from typing import Type, Callable
+
+from .params import Params
+
+_worker_params_class = None
+_worker_fn = None
+
+
+def _init_worker(params_class: Type[Params], fn: Callable):
+    global _worker_params_class, _worker_fn
+    _worker_params_class, _worker_fn = params_class, fn
+
+
+def _run_chunk(chunk):
+    names = _worker_params_class.value_names()
+    from_valid_dict = _worker_params_class._from_valid_dict
+    return [(index, _worker_fn(from_valid_dict(dict(zip(names, values))))) for index, values in chunk]
+
+
+def _chunks(params_class: Type[Params], configs, chunksize: int):
+    names = params_class.value_names()
+
+    def to_values(index_config):
+        index, params = index_config
+        if not isinstance(params, params_class):
+            params = params_class(params)
+        return index, tuple(params[name] for name in names)
+
+    values = map(to_values, enumerate(configs))
+    while True:
+        chunk = list(itertools.islice(values, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def map_parallel(params_class: Type[Params], fn: Callable, configs, workers: int = None, chunksize: int = 16,
+                 mp_context=None):
+    """ Calls ``fn`` with every config in a process pool (see ``Params.map_parallel()``). """
+    context = mp_context or multiprocessing.get_context()
+    with context.Pool(workers, initializer=_init_worker, initargs=(params_class, fn)) as pool:
+        for results in pool.imap_unordered(_run_chunk, _chunks(params_class, configs, chunksize)):
+            yield from results
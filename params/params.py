@@ -5,12 +5,23 @@
 
 from __future__ import division, absolute_import, print_function
 
+import functools
 import json
-import inspect
-from typing import Text, Type, Any, Dict
+import sys
+import threading
+import types
+import weakref
+import collections.abc
+import operator
+from typing import Text, Type, Any, Dict, FrozenSet, List, Tuple
 
 import argparse
 
+from .file_io import open_file
+from .codecs import get_codec
+from .validation import compile_validator, instance_check_type, argument_type
+from . import instrumentation
+
 
 class Param:
     """ Provides a parameter specification to be used within a Params instance. """
@@ -43,7 +54,8 @@ class Param:
         if dtype is None and value is not None and not callable(value):
             self.dtype = type(value)
         if value is not None and not callable(value):
-            if not isinstance(value, self.dtype):
+            check_type = instance_check_type(self.dtype)
+            if check_type is not None and not isinstance(value, check_type):
                 raise RuntimeError(f"Param({value}) does not match dtype:[{self.dtype}]")
         self.name = None
         self.is_property = callable(value)
@@ -53,7 +65,123 @@ class Param:
         return self._default_value(self.params_class) if self.is_property else self._default_value
 
     def value(self, params):
-        return self._default_value(params) if self.is_property else getattr(self.name, params)
+        return self._default_value(params) if self.is_property else params[self.name]
+
+
+class _ParamAttribute:
+    """ A data descriptor providing attribute access to a plain parameter of a Params class. """
+    __slots__ = ("name", "default")
+
+    def __init__(self, name: Text, default):
+        self.name = name
+        self.default = default
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self.default
+        return instance[self.name]
+
+    def __set__(self, instance, value):
+        instance[self.name] = value
+
+
+class _PropertyParamAttribute(_ParamAttribute):
+    """ A data descriptor evaluating an ``@property`` parameter of a Params class
+    (on class level access with the class declaring it, see ``Param.default_value``). """
+    __slots__ = ("fget", "spec")
+
+    def __init__(self, name: Text, spec: Param):
+        super(_PropertyParamAttribute, self).__init__(name, None)
+        self.fget = spec._default_value
+        self.spec = spec
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self.spec.default_value
+        return self.fget(instance)
+
+
+PropertyCacheInfo = collections.namedtuple("PropertyCacheInfo", ["hits", "misses", "currsize"])
+InternInfo = collections.namedtuple("InternInfo", ["hits", "misses", "currsize", "bytes_saved"])
+
+
+class _PropertyCache:
+    """ Caches the values of the ``@property`` parameters of a Params instance
+    together with the plain parameters each of them has read during its evaluation. """
+    __slots__ = ("values", "depends", "readers", "evaluating", "hits", "misses")
+
+    def __init__(self):
+        self.values     = {}  # property name -> cached value
+        self.depends    = {}  # property name -> names of the plain parameters read
+        self.readers    = {}  # plain parameter name -> names of the properties reading it
+        self.evaluating = []  # dependency sets of the properties being evaluated
+        self.hits       = 0
+        self.misses     = 0
+
+    def invalidate(self, name: Text):
+        for prop_name in self.readers.pop(name, ()):
+            self.values.pop(prop_name, None)
+
+
+_PROPERTY_CACHE = "_property_cache_"
+
+
+def _property_cache(instance) -> _PropertyCache:
+    cache = vars(instance).get(_PROPERTY_CACHE)
+    if cache is None:
+        cache = vars(instance)[_PROPERTY_CACHE] = _PropertyCache()
+    return cache
+
+
+class _TrackedParamAttribute(_ParamAttribute):
+    """ A plain parameter descriptor recording the reads done while evaluating a cached ``@property`` parameter. """
+    __slots__ = ()
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self.default
+        cache = vars(instance).get(_PROPERTY_CACHE)
+        if cache is not None and cache.evaluating:
+            cache.evaluating[-1].add(self.name)
+        return instance[self.name]
+
+
+class _CachedPropertyParamAttribute(_PropertyParamAttribute):
+    """ A descriptor caching the value of an ``@property`` parameter until one of the parameters it depends on changes. """
+    __slots__ = ()
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self.spec.default_value
+        cache = _property_cache(instance)
+        name = self.name
+        if name in cache.values:
+            cache.hits += 1
+            depends = cache.depends[name]
+        else:
+            cache.misses += 1
+            depends = set()
+            cache.evaluating.append(depends)
+            try:
+                value = self.fget(instance)
+            finally:
+                cache.evaluating.pop()
+            cache.values[name] = value
+            cache.depends[name] = depends
+            for param_name in depends:
+                cache.readers.setdefault(param_name, set()).add(name)
+        if cache.evaluating:                    # read while evaluating another property
+            cache.evaluating[-1].update(depends)
+        return cache.values[name]
+
+
+def _param_attribute(spec: Param, cache_properties: bool = False) -> _ParamAttribute:
+    """ Creates the class level descriptor for the given parameter spec. """
+    if spec.is_property:
+        attr_cls = _CachedPropertyParamAttribute if cache_properties else _PropertyParamAttribute
+        return attr_cls(spec.name, spec)
+    attr_cls = _TrackedParamAttribute if cache_properties else _ParamAttribute
+    return attr_cls(spec.name, spec.default_value)
 
 
 class Params(dict):
@@ -75,24 +203,75 @@ class Params(dict):
 
             params.another_param = 4.0            # raises ValueError
             params = MyParams(another_param=2.0)  # raises ValueError
+
+       Use ``compact=True`` to store the parameter values of the instances
+       in ``__slots__`` instead of the ``dict`` hash table (saving memory
+       for large populations of instances)::
+
+            class MyCompactParams(pp.Params, compact=True):
+                my_param = 1.0
+
+       **N.B.** as the ``dict`` storage of compact instances stays empty, use ``dict(params)``
+       when passing them to C code accessing the ``dict`` storage directly (i.e. ``json.dumps()``).
+
+       Use ``strict=True`` to validate (and coerce) the parameter values against
+       the ``dtype`` of their ``Param`` spec on construction and assignment
+       (see ``Params.validate()``)::
+
+            class MyStrictParams(pp.Params, strict=True):
+                learning_rate = 0.1
+                layers        = pp.Param([64], dtype=List[int])
+
+            MyStrictParams(learning_rate="0.01").learning_rate   # 0.01 (float)
+            MyStrictParams(layers=["a"])                         # raises TypeError
+
+       Use ``cache_properties=True`` to cache the values of the ``@property`` parameters.
+       A cached value is invalidated, when any of the parameters read (as attributes)
+       during its evaluation gets updated. The cached properties should therefore
+       depend only on other parameters::
+
+            class MyCachedParams(pp.Params, cache_properties=True):
+                vocab_path = "vocab.txt"
+
+                @property
+                def vocab_size(self):
+                    return len(open(self.vocab_path).readlines())
     """
 
-    __specs    : Dict[Text, Param] = {}
-    __defaults : Dict[Text, Any]   = {}
+    __specs            : Dict[Text, Param] = {}
+    __defaults         : Dict[Text, Any]   = {}
+    __keys             : FrozenSet[Text]   = frozenset()
+    __prop_specs       : List[Param]       = []
+    __value_names      : Tuple[Text, ...]  = ()
+    __compact          : bool              = False
+    __cache_properties : bool              = False
+    __strict           : bool              = False
+    __instrument       : bool              = False
 
-    def __init_subclass__(cls, **kwargs):
-        """ Aggregates the Param spec of the parameters over the hierarchy. """
-        base_specs = {}
-        for base in cls.__bases__:
-            if issubclass(base, Params):
-                base_specs.update(base.__specs)
+    def __init_subclass__(cls, compact: bool = None, cache_properties: bool = None, strict: bool = None,
+                          instrument: bool = None, **kwargs):
+        """ Aggregates the Param spec of the parameters over the hierarchy.
+
+        :param compact: True to store the parameter values in ``__slots__``
+               (inherited by the subclasses if not specified).
+        :param cache_properties: True to cache the values of the ``@property`` parameters
+               (inherited by the subclasses if not specified).
+        :param strict: True to validate (and coerce) the parameter values against their ``dtype``
+               on construction and assignment (inherited by the subclasses if not specified).
+        :param instrument: True to count the parameter reads and writes and to time the ``@property``
+               evaluations (see ``params.instrumentation``, inherited by the subclasses if not specified).
+        """
+        if not _GENERATED_BASES.isdisjoint(cls.__bases__):
+            return                      # a generated storage class (see _compact_class(), _frozen_class())
 
         cls_specs = []  # evaluate in order of declaration
         for attr, value in cls.__dict__.items():
-            if attr.startswith("_") or callable(getattr(cls, attr)):
+            if attr.startswith("_"):
                 continue
-
             attr_val = getattr(cls, attr)
+            if callable(attr_val):
+                continue
+
             if isinstance(attr_val, property):
                 param_spec = Param(attr_val.fget, params_class=cls)
             elif not isinstance(attr_val, Param):
@@ -103,30 +282,185 @@ class Params(dict):
             param_spec.name = attr
             cls_specs.append((attr, param_spec))
 
-        _specs = {}
-        for attr, value in list(base_specs.items()) + cls_specs:
-            setattr(cls, attr, value.default_value)
-            _specs[attr] = value
+        cls.__cache_properties = cls.__cache_properties if cache_properties is None else cache_properties
+
+        params_bases = [base for base in cls.__bases__ if issubclass(base, Params)]
+        parent = params_bases[0] if len(params_bases) == 1 else None
+        if parent is not None and parent.__cache_properties == cls.__cache_properties:
+            # single inheritance - reuse the parent tables and attribute descriptors
+            if not cls_specs:
+                cls.__specs, cls.__defaults, cls.__keys = parent.__specs, parent.__defaults, parent.__keys
+                cls.__prop_specs, cls.__value_names = parent.__prop_specs, parent.__value_names
+            else:
+                cls._aggregate_specs(parent.__specs, parent.__defaults, cls_specs, cls_specs)
+        else:
+            base_specs = {}
+            for base in params_bases:
+                base_specs.update(base.__specs)
+            cls._aggregate_specs(base_specs, {}, cls_specs, list(base_specs.items()) + cls_specs)
+
+        cls.__strict = cls.__strict if strict is None else strict
+        if cls.__strict:
+            cls._coerce_defaults()
+
+        cls.__compact = cls.__compact if compact is None else compact
+        if cls.__compact:
+            cls.__compact_class = _compact_class(cls)
+            cls.__new__ = staticmethod(_compact_new)
+
+        cls.__instrument = cls.__instrument if instrument is None else instrument
+        if cls.__instrument or instrumentation.is_enabled():
+            instrumentation.instrument_class(cls)
+
+    @classmethod
+    def _aggregate_specs(cls, base_specs, base_defaults, cls_specs, attr_specs):
+        """ Updates the ``base_specs`` (and their ``base_defaults``, if already aggregated) with the ``cls_specs``
+        and sets the attribute descriptors for the ``attr_specs`` (without evaluating the ``@property`` parameters,
+        which get evaluated only on class level attribute access, see ``Param.default_value``). """
+        _specs = dict(base_specs)
+        for attr, spec in attr_specs:
+            setattr(cls, attr, _param_attribute(spec, cls.__cache_properties))
+            _specs[attr] = spec
+
+        if not base_defaults:
+            cls_specs = _specs.items()
+        _defaults = dict(base_defaults)
+        for attr, spec in cls_specs:
+            _defaults[attr] = None if spec.is_property else spec._default_value
 
         cls.__specs = _specs
-        cls.__defaults = {key: val.default_value for key, val in cls.__specs.items()}
+        cls.__defaults = _defaults
+        cls.__keys = frozenset(_defaults)
+        cls.__prop_specs = [spec for spec in _specs.values() if spec.is_property]
+        cls.__value_names = tuple(name for name, spec in _specs.items() if not spec.is_property)
+
+    @classmethod
+    def _coerce_defaults(cls):
+        """ Validates the defaults of a ``strict=True`` class and stores the coerced values (i.e. ``1`` as ``1.0``). """
+        defaults = {name: cls.__defaults[name] for name in cls.__value_names}
+        coerced = cls._validate_values(defaults)
+        changed = {name: value for name, value in coerced.items() if not _same_value(value, defaults[name])}
+        if changed:
+            cls.__defaults = dict(cls.__defaults, **changed)      # might be shared with the parent class
+            for name, value in changed.items():
+                attribute = _param_attribute(cls.__specs[name], cls.__cache_properties)
+                attribute.default = value
+                setattr(cls, name, attribute)
 
     def __init__(self, *args, **kwargs):
-        super(Params, self).__init__()
-        self.update(self.__defaults)   # start with default values
-        self.update(dict(*args))       # override with tuple list
-        self.update(kwargs)            # override with kwargs
+        overrides = dict(*args)                         # override with tuple list
+        overrides.update(kwargs)                        # override with kwargs
+        if overrides:
+            self._check_keys(overrides)
+            if self.__strict:
+                overrides = self._validate_values(overrides)
+        self._init_values(overrides)
+
+    def _init_values(self, overrides):
+        """ Initializes the instance with the defaults updated with the already validated ``overrides``. """
+        dict.__init__(self, self.__defaults)            # start with default values
+        if overrides:
+            dict.update(self, overrides)
         # update any overridden @property parameters
-        prop_specs = list(filter(lambda spec: spec.is_property,
-                                 self.__class__.__specs.values()))
+        for spec in self.__prop_specs:
+            dict.__setitem__(self, spec.name, getattr(self, spec.name))
+
+    @classmethod
+    def _from_valid_dict(cls, overrides, validated=False):
+        """ Constructs an instance from ``overrides`` known to contain only parameters of this class
+        (and with values already validated if ``validated=True``, see ``strict=True``). """
+        if cls.__init__ is not Params.__init__:
+            return cls(**overrides)                     # respect custom constructors
+        if cls.__strict and overrides and not validated:
+            overrides = cls._validate_values(overrides)
+        params = cls.__new__(cls)
+        params._init_values(overrides)
+        return params
 
-        for spec in prop_specs:
-            self.update({spec.name: spec.value(self)})
+    @classmethod
+    def param_specs(cls) -> Dict[Text, Param]:
+        """ Returns the parameter specifications of this class in declaration order (not to be modified). """
+        return cls.__specs
+
+    @classmethod
+    def value_names(cls) -> Tuple[Text, ...]:
+        """ Returns the names of the (non ``@property``) parameters in declaration order. """
+        return cls.__value_names
+
+    @classmethod
+    def validate(cls, values) -> Dict[Text, Any]:
+        """ Validates and coerces the given parameter values against the ``dtype`` of their ``Param`` spec
+        (also for classes not declared with ``strict=True``, i.e. for validating loaded records).
+
+        ``None`` is accepted for every parameter, ``@property`` parameters are not validated.
+        See ``params.validation.compile_validator()`` for the supported types and coercions.
+
+        Example:
+
+            MyParams.validate({"learning_rate": "0.1"})    # {'learning_rate': 0.1}
+            MyParams.validate({"learning_rate": [0.1]})    # raises TypeError
+
+        :param values: a dict of parameter values.
+        :return: a new dict with the coerced values.
+        :raises TypeError: reporting all the invalid values.
+        """
+        cls._check_keys(values)
+        return cls._validate_values(values)
+
+    @classmethod
+    def _param_validators(cls):
+        """ Returns the validators of the (non ``@property``) parameters, compiled once per class. """
+        params_class = getattr(cls, "_public_class_", None) or cls
+        validators = params_class.__dict__.get("_validators_")
+        if validators is None:
+            validators = {}
+            for name in params_class.__value_names:
+                validator = compile_validator(params_class.__specs[name].dtype)
+                if validator is not None:
+                    validators[name] = validator
+            params_class._validators_ = validators
+        return validators
+
+    @classmethod
+    def _validate_values(cls, values):
+        validators = cls._param_validators()
+        result, errors = dict(values), []
+        for name, value in values.items():
+            validator = validators.get(name)
+            if validator is not None and value is not None:
+                try:
+                    result[name] = validator(value)
+                except TypeError as err:
+                    errors.append("'{}' {}".format(name, err))
+        if errors:
+            raise TypeError("Invalid parameter value{} in Params instance '{}': {}".format(
+                "s" if len(errors) > 1 else "", cls.__name__, "; ".join(errors)))
+        return result
+
+    def _validate_value(self, key, value):
+        validator = self._param_validators().get(key)
+        if validator is None or value is None:
+            return value
+        try:
+            return validator(value)
+        except TypeError as err:
+            raise TypeError("Invalid value for parameter '{}' in Params instance '{}': {}".format(
+                key, self.__class__.__name__, err)) from None
+
+    @classmethod
+    def _check_keys(cls, args):
+        """ Raises an AttributeError reporting all the keys in ``args`` not being a parameter of this class. """
+        unexpected = args.keys() - cls.__keys
+        if unexpected:
+            raise AttributeError("Setting unexpected parameter{} {} in Params instance '{}'".format(
+                "s" if len(unexpected) > 1 else "",
+                ", ".join(map("'{}'".format, sorted(unexpected, key=str))),
+                cls.__name__))
 
     def update(self, arg=None, **kwargs):   # see dict.update()
         if arg:
             keys = getattr(arg, "keys") if hasattr(arg, "keys") else None
-            if keys and (inspect.ismethod(keys) or inspect.isbuiltin(keys)):
+            if keys and isinstance(keys, (types.MethodType, types.BuiltinMethodType)):
                 for key in arg:
                     self[key] = arg[key]
             else:
@@ -135,22 +469,39 @@ class Params(dict):
         for key in kwargs:
             self[key] = kwargs[key]
 
-    def __getattribute__(self, attr):
-        if not attr.startswith("_") and attr in self.__defaults:
-            if self.__specs[attr].is_property:
-                return self.__specs[attr].value(self)
-            else:
-                return self.__getitem__(attr)
-        return object.__getattribute__(self, attr)
-
     def __setattr__(self, key, value):
         self.__setitem__(key, value)
 
     def __setitem__(self, key, value):
-        if key not in self.__defaults:
+        if key not in self.__keys:
             raise AttributeError("Setting unexpected parameter '{}' "
                                  "in Params instance '{}'".format(key, self.__class__.__name__))
+        if self.__strict:
+            value = self._validate_value(key, value)
         super(Params, self).__setitem__(key, value)
+        if self.__cache_properties:
+            self._invalidate_properties(key)
+
+    def _invalidate_properties(self, key):
+        cache = vars(self).get(_PROPERTY_CACHE)
+        if cache is not None:
+            cache.invalidate(key)
+
+    def property_cache_info(self) -> PropertyCacheInfo:
+        """ Returns the hits, misses and size of the ``@property`` parameters cache
+        (see ``cache_properties=True``). """
+        cache = vars(self).get(_PROPERTY_CACHE) or _PropertyCache()
+        return PropertyCacheInfo(cache.hits, cache.misses, len(cache.values))
+
+    def __reduce__(self):
+        """ Pickles the class and the non default parameter values in declaration order (as a bitmask and a tuple). """
+        mask, values = 0, []
+        for bit, name in enumerate(self.__value_names):
+            value = self[name]
+            if not _same_value(value, self.__defaults[name]):
+                mask |= 1 << bit
+                values.append(value)
+        return _restore_params, (getattr(type(self), "_public_class_", None) or type(self), mask, tuple(values))
 
     @classmethod
     def from_dict(cls, args, return_instance=True, return_unused=True):
@@ -165,26 +516,147 @@ class Params(dict):
         :return: a tuple (params, other) of params and a dict of unused arguments,
                  where params is either a dict or a Params instance (where ``return_instance=True``).
         """
-
-        def is_not_none(x):
-            return x is not None
-
         cls_args, unused_args = {}, {}
         if args:
             # extract unused args
-            keys = cls.__defaults.keys()
-            cls_args, unused_args = zip(*list(map(lambda p: (p, None) if p[0] in keys else (None, p),
-                                                  args.items())))
-
-            cls_args    = dict(filter(is_not_none, cls_args))
-            unused_args = dict(filter(is_not_none, unused_args))
+            keys = cls.__keys
+            for key, value in args.items():
+                if key in keys:
+                    cls_args[key] = value
+                else:
+                    unused_args[key] = value
 
-        params = cls(**cls_args) if return_instance else cls_args
+        params = cls._from_valid_dict(cls_args) if return_instance else cls_args
 
         if return_unused:
             return params, unused_args
         return params
 
+    @classmethod
+    def from_records(cls, records, return_unused=False, validate=False):
+        """ Lazily constructs an instance for every record in ``records``.
+
+        The parameter keys are separated from the unused keys only once
+        for every distinct key set found in the records.
+
+        :param records: an iterable of keyword dictionaries with parameters
+        :param return_unused: True to yield ``(params, other)`` tuples including a dict
+               of the arguments not valid for the current class.
+        :param validate: True to validate (and coerce) the record values (see ``Params.validate()``),
+               always done for the classes declared with ``strict=True``.
+        :return: a generator of Params instances (or ``(params, other)`` tuples).
+        """
+        splits = {}
+        for record in records:
+            record_keys = tuple(record.keys())
+            split = splits.get(record_keys)
+            if split is None:
+                split = splits[record_keys] = cls._split_keys(record_keys)
+            used_keys, unused_keys = split
+
+            values = {key: record[key] for key in used_keys}
+            if validate and not cls.__strict:
+                values = cls._validate_values(values)
+            params = cls._from_valid_dict(values)
+            if return_unused:
+                yield params, {key: record[key] for key in unused_keys}
+            else:
+                yield params
+
+    @classmethod
+    def from_columns(cls, columns, return_unused=False):
+        """ Lazily constructs an instance for every row of the given ``columns``.
+
+        :param columns: a dictionary of equally sized columns (lists, tuples or NumPy arrays),
+               keyed by the parameter names. NumPy scalars are converted to python values.
+        :param return_unused: True to yield ``(params, other)`` tuples including a dict
+               of the columns not valid for the current class.
+        :return: a generator of Params instances (or ``(params, other)`` tuples).
+        """
+        sizes = set(map(len, columns.values()))
+        if len(sizes) > 1:
+            raise ValueError("Columns of different length: {}".format(
+                {key: len(col) for key, col in columns.items()}))
+
+        def column_values(col):
+            dtype = getattr(col, "dtype", None)
+            if dtype is not None and dtype.kind != "O":   # numpy scalars to python values
+                return map(operator.methodcaller("item"), col)
+            return iter(col)
+
+        used_keys, unused_keys = cls._split_keys(columns.keys())
+        used_cols   = [column_values(columns[key]) for key in used_keys]
+        unused_cols = [column_values(columns[key]) for key in unused_keys] if return_unused else []
+
+        for _ in range(sizes.pop() if sizes else 0):
+            params = cls._from_valid_dict(dict(zip(used_keys, map(next, used_cols))))
+            if return_unused:
+                yield params, dict(zip(unused_keys, map(next, unused_cols)))
+            else:
+                yield params
+
+    @classmethod
+    def _split_keys(cls, keys):
+        """ Splits ``keys`` into a tuple of parameter keys and a tuple of unused keys. """
+        used_keys   = tuple(key for key in keys if key in cls.__keys)
+        unused_keys = tuple(key for key in keys if key not in cls.__keys)
+        return used_keys, unused_keys
+
+    @classmethod
+    def map_parallel(cls, fn, configs, workers: int = None, chunksize: int = 16, mp_context=None):
+        """ Calls ``fn`` with every config of this class in a pool of worker processes.
+
+        The class and ``fn`` are sent once to every worker process, while the configs are sent
+        in chunks as tuples of parameter values, from which the workers reconstruct the instances.
+
+        Example:
+
+            for index, result in MyParams.map_parallel(train, configs, workers=8):
+                print(configs[index], result)
+
+        :param fn: a picklable (i.e. module level) function to be called with every config.
+        :param configs: an iterable of instances (or dicts) of this class.
+        :param workers: the number of worker processes (defaults to ``os.cpu_count()``).
+        :param chunksize: the number of configs sent to a worker at once.
+        :param mp_context: (Optional) a ``multiprocessing`` context (i.e. ``get_context("spawn")``).
+        :return: a generator of ``(config_index, result)`` tuples in order of completion.
+        """
+        from .parallel import map_parallel
+        return map_parallel(cls, fn, configs, workers=workers, chunksize=chunksize, mp_context=mp_context)
+
+    @classmethod
+    def load(cls, layers=(), env_prefix: Text = None, argv=None, check_params=False, return_sources=False,
+             environ=None):
+        """ Loads an instance from several configuration layers, constructing it only once.
+
+        The raw values of all the layers are collected first and merged in order of precedence
+        (the later layers override the earlier ones): the ``layers``, then the environment variables
+        and then the command line arguments.
+
+        Example:
+
+            params, sources = MyParams.load(["base.yaml", "prod.json"], env_prefix="APP_",
+                                            argv=sys.argv[1:], return_sources=True)
+            sources["learning_rate"]    # i.e. 'env:APP_LEARNING_RATE'
+
+        :param layers: a list of file paths or URLs (``*.yaml``/``*.yml`` files are parsed as YAML,
+               all others as JSON) or dicts of parameter values (``None`` entries are skipped).
+        :param env_prefix: (Optional) read the ``{env_prefix}{PARAM_NAME}`` environment variables,
+               parsed according to the ``dtype`` of the parameters (with JSON for lists and dicts).
+        :param argv: (Optional) a list of command line arguments to parse (see ``Params.to_argument_parser()``),
+               only the arguments given explicitly override the other layers (and the ``required``
+               parameters need to be given only when not set by the other layers).
+        :param check_params: whether to throw an exception when a layer contains
+               params not compatible with the current class.
+        :param return_sources: True to return a ``(params, sources)`` tuple, with ``sources`` being a dict
+               with the layer setting the value of every (non ``@property``) parameter - a file path,
+               ``layer[i]`` for dicts, ``env:{VARIABLE}``, ``argv`` or ``default``.
+        :param environ: (Optional) the environment variables mapping to use instead of ``os.environ``.
+        """
+        from .loader import load
+        return load(cls, layers, env_prefix=env_prefix, argv=argv, check_params=check_params,
+                    return_sources=return_sources, environ=environ)
+
     #
     # serialization
     #
@@ -206,6 +678,43 @@ class Params(dict):
         else:
             return cls.from_dict(lparams, return_instance=True, return_unused=False)
 
+    def serialize(self, codec: Text = "json-compact", positional: bool = False):
+        """ Serializes this instance with the given codec.
+
+        :param codec: one of ``json``, ``json-compact``, ``orjson``, ``msgpack``
+               or a codec registered with ``params.register_codec()``.
+        :param positional: True to encode only the values of the (non ``@property``) parameters
+               in declaration order, i.e. without the keys.
+        :return: a ``str`` or ``bytes`` depending on the codec.
+        """
+        if positional:
+            return get_codec(codec).dumps([self[name] for name in self.__value_names])
+        return get_codec(codec).dumps(dict(self))
+
+    @classmethod
+    def deserialize(cls, data, codec: Text = "json-compact", positional: bool = False, check_params=False):
+        """ Deserializes an instance serialized with ``Params.serialize()``.
+
+        :param data: the serialized ``str`` or ``bytes``.
+        :param codec: the codec used for serialization.
+        :param positional: whether ``data`` was serialized with ``positional=True``.
+        :param check_params: whether to throw an exception when
+               data contains params not compatible with the current instance.
+        """
+        lparams = get_codec(codec).loads(data)
+        if positional:
+            if not isinstance(lparams, (list, tuple)):
+                raise TypeError("Expected a list of positional values for '{}', but got: {}".format(
+                    cls.__name__, type(lparams).__name__))
+            if len(lparams) != len(cls.__value_names):
+                raise ValueError("Expected {} positional values for '{}', but got {}".format(
+                    len(cls.__value_names), cls.__name__, len(lparams)))
+            return cls._from_valid_dict(dict(zip(cls.__value_names, lparams)))
+        if check_params:
+            return cls(**lparams)
+        else:
+            return cls.from_dict(lparams, return_instance=True, return_unused=False)
+
     @staticmethod
     def _check_yaml_import():
         try:
@@ -238,15 +747,9 @@ class Params(dict):
 
     @classmethod
     def _open_file(cls, *args, **kwargs):
-        """ Selects an open() implementation.
-        Tries to with Tensorflows first (tf.io.gfile.GFile)
-        and if not available fall backs to python's default open().
+        """ Opens a file with the ``open()`` implementation registered
+        for the URL scheme of the path (see ``params.register_file_backend()``).
         """
-        try:
-            import tensorflow as tf
-            open_file = tf.io.gfile.GFile  # pragma: no cover
-        except Exception:                  # pragma: no cover
-            open_file = open
         return open_file(*args, **kwargs)
 
     @classmethod
@@ -297,17 +800,249 @@ class Params(dict):
             print("Failed to read {} instance from: {}".format(cls.__name__, yaml_file), err)
             return None
 
+    #
+    # streaming of many instances
+    #
+
+    @classmethod
+    def iter_jsonl(cls, file_path, codec: Text = "json-compact", check_params=False,
+                   on_error: Text = "raise", errors: list = None):
+        """ Lazily reads the instances from a JSON Lines file (one JSON object per line).
+
+        :param file_path: the file path or URL (see ``params.register_file_backend()``).
+        :param codec: the JSON codec to decode the lines with (i.e. ``orjson``).
+        :param check_params: whether to throw an exception when
+               a record contains params not compatible with the current instance.
+        :param on_error: ``raise`` to abort on the first invalid record, or ``skip`` to skip the invalid records.
+        :param errors: (Optional) a list to collect the ``(record_index, exception)`` tuples
+               of the skipped invalid records (implies ``on_error="skip"``).
+        :return: a generator of instances.
+        """
+        with open_file(file_path, "r") as reader:
+            lines = (line for line in reader if line.strip())
+            yield from cls._iter_documents(lines, get_codec(codec).loads, check_params, on_error, errors)
+
+    @classmethod
+    def write_jsonl(cls, file_path, instances, codec: Text = "json-compact", append=False, buffer_size=1024):
+        """ Writes the given instances to a JSON Lines file.
+
+        :param file_path: the file path or URL (see ``params.register_file_backend()``).
+        :param instances: an iterable of instances (or dicts).
+        :param codec: the JSON codec to encode the lines with (a single line encoding one, i.e. not ``json``).
+        :param append: True to append to an existing file.
+        :param buffer_size: the number of lines to write at once.
+        :return: the number of instances written.
+        :raises ValueError: if the codec encodes an instance over multiple lines.
+        """
+        dumps = get_codec(codec).dumps
+
+        def to_line(params):
+            line = dumps(dict(params))
+            line = (line.decode("utf-8") if isinstance(line, bytes) else line).rstrip("\n")
+            if "\n" in line:
+                raise ValueError("The '{}' codec does not encode single lines, "
+                                 "try 'json-compact' or 'orjson' instead".format(codec))
+            return line + "\n"
+
+        with open_file(file_path, "a" if append else "w") as writer:
+            return cls._write_documents(writer, map(to_line, instances), buffer_size)
+
+    @classmethod
+    def iter_yaml(cls, file_path, check_params=False, on_error: Text = "raise", errors: list = None):
+        """ Lazily reads the instances from a multi-document YAML file (documents separated by ``---``).
+
+        See ``Params.iter_jsonl()`` for the parameters.
+        """
+        Params._check_yaml_import()
+        import yaml
+
+        def documents(reader):
+            lines = []
+            for line in reader:
+                if line.startswith("---") or line.startswith("..."):
+                    document = "".join(lines)
+                    if document.strip():
+                        yield document
+                    lines = [line[3:]] if line.startswith("---") else []
+                else:
+                    lines.append(line)
+            document = "".join(lines)
+            if document.strip():
+                yield document
+
+        with open_file(file_path, "r") as reader:
+            yield from cls._iter_documents(documents(reader), yaml.safe_load, check_params, on_error, errors)
+
+    @classmethod
+    def write_yaml(cls, file_path, instances, append=False, buffer_size=1024, **kwargs):
+        """ Writes the given instances to a multi-document YAML file.
+
+        See ``Params.write_jsonl()`` for the parameters, ``kwargs`` are passed to ``yaml.safe_dump()``.
+        """
+        Params._check_yaml_import()
+        import yaml
+
+        def to_document(params):
+            return "---\n" + yaml.safe_dump(dict(params), **kwargs)
+
+        with open_file(file_path, "a" if append else "w") as writer:
+            return cls._write_documents(writer, map(to_document, instances), buffer_size)
+
+    @classmethod
+    def _iter_documents(cls, documents, loads, check_params, on_error, errors):
+        if on_error not in ("raise", "skip"):
+            raise ValueError("Unexpected on_error='{}', expected one of: raise, skip".format(on_error))
+        for index, document in enumerate(documents):
+            try:
+                lparams = loads(document)
+                if not isinstance(lparams, dict):
+                    raise TypeError("Expected a {} record, but got: {}".format(cls.__name__, type(lparams).__name__))
+                if check_params:
+                    params = cls(**lparams)
+                else:
+                    params = cls.from_dict(lparams, return_instance=True, return_unused=False)
+            except Exception as err:
+                if errors is not None:
+                    errors.append((index, err))
+                elif on_error == "raise":
+                    raise
+                continue
+            yield params
+
+    @staticmethod
+    def _write_documents(writer, documents, buffer_size):
+        count, buffer = 0, []
+        for document in documents:
+            buffer.append(document)
+            if len(buffer) >= buffer_size:
+                writer.write("".join(buffer))
+                count, buffer = count + len(buffer), []
+        if buffer:
+            writer.write("".join(buffer))
+        return count + len(buffer)
+
+    #
+    # deltas
+    #
+
+    def diff(self, other) -> Dict[Text, Any]:
+        """ Returns the (non ``@property``) parameters of ``other`` with a value different from this instance.
+
+        Example:
+
+            base = MyParams()
+            delta = base.diff(trial)          # i.e. {'learning_rate': 0.01}
+            assert base.patch(delta) == trial
+
+        :param other: an instance (or dict) of the same class.
+        :return: a dict with the changed parameters and their values in ``other``.
+        """
+        self._check_keys(other)
+        return {name: other[name] for name in self.__value_names
+                if name in other and not _same_value(self[name], other[name])}
+
+    def patch(self, delta: Dict[Text, Any]) -> 'Params':
+        """ Returns a new (mutable) instance with the values of this instance updated with ``delta``
+        (see ``Params.diff()``). """
+        self._check_keys(delta)
+        args = {name: self[name] for name in self.__value_names}
+        args.update(delta)
+        params_class = getattr(type(self), "_public_class_", None) or type(self)
+        return params_class._from_valid_dict(args)
+
+    @classmethod
+    def serialize_delta(cls, delta: Dict[Text, Any], codec: Text = "json-compact", positional: bool = False):
+        """ Serializes a delta returned by ``Params.diff()``.
+
+        :param delta: a dict with the changed parameters.
+        :param codec: the codec to use (see ``Params.serialize()``).
+        :param positional: True to encode the parameter indices in declaration order instead of the keys.
+        """
+        cls._check_keys(delta)
+        if positional:
+            indices = [idx for idx, name in enumerate(cls.__value_names) if name in delta]
+            return get_codec(codec).dumps([indices, [delta[cls.__value_names[idx]] for idx in indices]])
+        return get_codec(codec).dumps(delta)
+
+    @classmethod
+    def deserialize_delta(cls, data, codec: Text = "json-compact", positional: bool = False) -> Dict[Text, Any]:
+        """ Deserializes a delta serialized with ``Params.serialize_delta()``. """
+        delta = get_codec(codec).loads(data)
+        if positional:
+            indices, values = delta
+            delta = {cls.__value_names[idx]: value for idx, value in zip(indices, values)}
+        cls._check_keys(delta)
+        return delta
+
+    def freeze(self) -> 'FrozenParams':
+        """ Returns an immutable and hashable copy of this instance (see ``FrozenParams``). """
+        if isinstance(self, FrozenParams):
+            return self
+        params_class = getattr(type(self), "_public_class_", None) or type(self)
+        frozen_class = params_class.__dict__.get("_frozen_class_")
+        if frozen_class is None:
+            frozen_class = params_class._frozen_class_ = _frozen_class(params_class)
+
+        frozen = dict.__new__(frozen_class)
+        frozen._init_values({name: self[name] for name in self.__value_names})
+        object.__setattr__(frozen, "_hash_", hash(tuple(_hashable(frozen[name]) for name in frozen)))
+        return frozen
+
+    @classmethod
+    def intern(cls, params) -> 'FrozenParams':
+        """ Returns the canonical frozen instance with the values of ``params`` (see ``Params.freeze()``).
+
+        Interned instances are registered (per class) by their hash with weak references,
+        so value-identical instances share a single immutable object as long as it is referenced.
+
+        Example:
+
+            layers = [Layer.from_params(Layer.Params.intern(config)) for config in configs]
+            Layer.Params.intern_info()      # InternInfo(hits=..., misses=..., currsize=..., bytes_saved=...)
+
+        :param params: an instance (or dict) of this class.
+        """
+        params_class = getattr(cls, "_public_class_", None) or cls
+        if (getattr(type(params), "_public_class_", None) or type(params)) is not params_class:
+            params = params_class(params)
+        registry = params_class.__dict__.get("_intern_registry_")
+        if registry is None:
+            registry = params_class._intern_registry_ = _InternRegistry()
+        return registry.intern(params.freeze())
+
+    @classmethod
+    def intern_info(cls) -> InternInfo:
+        """ Returns the hits, misses, number of live instances and the estimated
+        (shallow) bytes saved by ``Params.intern()``. """
+        params_class = getattr(cls, "_public_class_", None) or cls
+        registry = params_class.__dict__.get("_intern_registry_") or _InternRegistry()
+        return registry.info()
+
+    @classmethod
+    def intern_clear(cls):
+        """ Clears the registry of the interned instances (and its statistics). """
+        params_class = getattr(cls, "_public_class_", None) or cls
+        params_class._intern_registry_ = _InternRegistry()
+
     def clone(self, **kwargs):
         """
         Creates a clone.
         :param kwargs: parameters to override in the clone.
         """
+        self._check_keys(kwargs)
         args = dict(self)
-        args.update(**kwargs)
-        return self.__class__(**args)
+        args.update(kwargs)
+        return self.__class__._from_valid_dict(args)
 
     @classmethod
-    def to_argument_parser(cls) -> argparse.ArgumentParser:
+    def _argument_specs(cls):
+        """ Returns the ``(param_name, dest, arg_name, add_argument_kwargs)`` tuples of the parameters
+        having a doc string, positional arguments first (built once per class). """
+        params_class = getattr(cls, "_public_class_", None) or cls
+        arg_specs = params_class.__dict__.get("_argument_specs_")
+        if arg_specs is not None:
+            return arg_specs
+
         def arg_name(param_name: Text):
             result = param_name.lower().replace("_", "-")
             return result
@@ -317,16 +1052,16 @@ class Params(dict):
             res += list(filter(lambda t: not t[1].positional, attribs.items()))
             return res
 
-        parser = argparse.ArgumentParser()
-        for attr, spec in sort_positional_args(cls.__specs):
+        arg_specs = []
+        for attr, spec in sort_positional_args(params_class.__specs):
             if spec.doc_string is None:
                 continue
             name = arg_name(spec.name)
             add_argument_args = {
-                "type": spec.dtype,
+                "type": argument_type(spec.dtype),
                 "required": spec.required,
                 "help": spec.doc_string,
-                "default": spec.default_value
+                "default": spec.default_value if spec.is_property else params_class.__defaults[spec.name]
             }
             if spec.dtype == bool:
                 add_argument_args.update({
@@ -334,11 +1069,433 @@ class Params(dict):
                 })
             if spec.positional:
                 del add_argument_args['required']
-                parser.add_argument("{}".format(name), **add_argument_args)
+                arg_specs.append((spec.name, name, name, add_argument_args))
             else:
-                parser.add_argument("--{}".format(name), **add_argument_args)
+                add_argument_args["dest"] = spec.name
+                arg_specs.append((spec.name, spec.name, "--{}".format(name), add_argument_args))
+        arg_specs = params_class._argument_specs_ = tuple(arg_specs)
+        return arg_specs
+
+    @classmethod
+    def _add_arguments(cls, parser: argparse.ArgumentParser, prefix: Text = None, required: bool = True):
+        """ Adds the arguments of this class to ``parser`` (namespaced with ``prefix``)
+        and returns the ``(param_name, dest)`` pairs. With ``required=False`` none of the
+        arguments is required (i.e. when the parameters could be set by other sources). """
+        dests = []
+        for param_name, dest, name, add_argument_args in cls._argument_specs():
+            if not required:
+                if name.startswith("--"):
+                    add_argument_args = dict(add_argument_args, required=False)
+                else:
+                    add_argument_args = dict(add_argument_args, nargs="?")
+            if prefix:
+                dest = "{}.{}".format(prefix, dest)
+                if name.startswith("--"):
+                    name = "--{}.{}".format(prefix, name[2:])
+                    add_argument_args = dict(add_argument_args, dest=dest)
+                else:
+                    name = dest = "{}.{}".format(prefix, name)
+            parser.add_argument(name, **add_argument_args)
+            dests.append((param_name, dest))
+        return dests
+
+    @classmethod
+    def _from_namespace(cls, namespace: argparse.Namespace, dests):
+        return cls._from_valid_dict({param_name: getattr(namespace, dest) for param_name, dest in dests})
+
+    @classmethod
+    def to_argument_parser(cls) -> argparse.ArgumentParser:
+        """ Creates an ``argparse`` parser with an argument for every parameter having a doc string
+        (see ``params.ParamsArgumentParser`` for parsing the parameters of several classes). """
+        parser = argparse.ArgumentParser()
+        cls._add_arguments(parser)
         return parser
 
+    @classmethod
+    def from_argv(cls, argv=None, return_unused=False):
+        """ Parses the command line arguments directly into an instance (see ``Params.to_argument_parser()``).
+
+        :param argv: (Optional) the list of arguments to parse (defaults to ``sys.argv[1:]``).
+        :param return_unused: True to ignore the unknown arguments and return them
+               in a ``(params, unused_argv)`` tuple.
+        """
+        parser = argparse.ArgumentParser()
+        dests = cls._add_arguments(parser)
+        if return_unused:
+            namespace, unused_argv = parser.parse_known_args(argv)
+            return cls._from_namespace(namespace, dests), unused_argv
+        return cls._from_namespace(parser.parse_args(argv), dests)
+
+
+class _CompactParams:
+    """ Implements the dict API of a compact Params class over the values stored in ``__slots__``. """
+    __slots__ = ()
+
+    _public_class_ = None   # the compact Params class
+    _slot_names_   = {}     # parameter name to slot name
+    _param_names_  = ()     # parameter names in declaration order
+
+    def _init_values(self, overrides):
+        for name, value in self._public_class_._Params__defaults.items():
+            object.__setattr__(self, self._slot_names_[name], value)
+        for name, value in overrides.items():
+            object.__setattr__(self, self._slot_names_[name], value)
+        for spec in self._public_class_._Params__prop_specs:
+            object.__setattr__(self, self._slot_names_[spec.name], getattr(self, spec.name))
+
+    def __getitem__(self, key):
+        try:
+            slot = self._slot_names_[key]
+        except KeyError:
+            raise KeyError(key) from None
+        return getattr(self, slot)
+
+    def __setitem__(self, key, value):
+        if key not in self._slot_names_:
+            raise AttributeError("Setting unexpected parameter '{}' "
+                                 "in Params instance '{}'".format(key, self.__class__.__name__))
+        if self._public_class_._Params__strict:
+            value = self._validate_value(key, value)
+        object.__setattr__(self, self._slot_names_[key], value)
+        if self._public_class_._Params__cache_properties:
+            self._invalidate_properties(key)
+
+    def __delitem__(self, key):
+        raise TypeError("Removing parameter '{}' from a compact Params instance '{}' is not supported".format(
+            key, self.__class__.__name__))
+
+    def __iter__(self):
+        return iter(self._param_names_)
+
+    def __reversed__(self):
+        return reversed(self._param_names_)
+
+    def __len__(self):
+        return len(self._param_names_)
+
+    def __contains__(self, key):
+        return key in self._slot_names_
+
+    def __eq__(self, other):
+        return dict(self) == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __or__(self, other):
+        if not isinstance(other, dict):
+            return NotImplemented
+        result = dict(self)
+        result.update(other)
+        return result
+
+    def __ror__(self, other):
+        if not isinstance(other, dict):
+            return NotImplemented
+        result = dict(other)
+        result.update(self)
+        return result
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def __repr__(self):
+        return repr(dict(self))
+
+    def get(self, key, default=None):
+        return self[key] if key in self._slot_names_ else default
+
+    def keys(self):
+        return collections.abc.KeysView(self)
+
+    def values(self):
+        return collections.abc.ValuesView(self)
+
+    def items(self):
+        return collections.abc.ItemsView(self)
+
+    def copy(self):
+        return dict(self)
+
+    def pop(self, key, *args):
+        del self[key]
+
+    def popitem(self):
+        raise TypeError("Removing parameters from a compact Params instance '{}' is not supported".format(
+            self.__class__.__name__))
+
+    def clear(self):
+        self.popitem()
+
+    def setdefault(self, key, default=None):
+        return self[key]
+
+
+def _compact_class(cls):
+    """ Generates the ``__slots__`` backed storage class for the compact Params class ``cls``. """
+    slot_names = {}
+    for name, spec in cls.param_specs().items():
+        if spec.is_property:
+            slot_names[name] = "_prop_" + name     # keep the property descriptors
+        elif cls._Params__cache_properties:
+            slot_names[name] = "_param_" + name    # keep the read tracking descriptors
+        else:
+            slot_names[name] = name
+    return type(cls.__name__, (_CompactParams, cls), {
+        "__slots__": tuple(slot_names.values()),
+        "__module__": cls.__module__,
+        "__qualname__": cls.__qualname__,
+        "_public_class_": cls,
+        "_slot_names_": slot_names,
+        "_param_names_": tuple(slot_names),
+    })
+
+
+def _compact_new(cls, *args, **kwargs):
+    if not cls._Params__compact:
+        return dict.__new__(cls)      # a non compact subclass of a compact Params class
+    return dict.__new__(cls._Params__compact_class)
+
+
+class FrozenParams:
+    """
+    An immutable and hashable ``Params`` instance as returned by ``Params.freeze()``.
+
+    Frozen instances are instances of the ``Params`` class they were created from,
+    but reject any modification, so they could be shared across threads and used
+    as cache or ``dict`` keys. The hash is computed once on creation (from the values
+    in parameter declaration order) and compared first when checking for equality.
+
+    Example:
+
+        import functools
+        import params as pp
+
+        class MyParams(pp.Params):
+            num_layers = 2
+
+        @functools.lru_cache()
+        def build_model(params: MyParams):
+            ...
+
+        model = build_model(MyParams(num_layers=4).freeze())
+
+    **N.B.** mutable parameter values (i.e. lists) are not copied and should not be modified.
+    """
+    __slots__ = ()
+
+    def _reject(self, *args, **kwargs):
+        raise TypeError("Frozen Params instance '{}' could not be modified".format(self.__class__.__name__))
+
+    __setitem__ = __delitem__ = __ior__ = update = pop = popitem = clear = setdefault = _reject
+
+    def __hash__(self):
+        return self._hash_
+
+    def __eq__(self, other):
+        if type(other) is type(self) and other._hash_ != self._hash_:
+            return False
+        return super(FrozenParams, self).__eq__(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __reduce__(self):
+        return (_restore_frozen_params,) + super(FrozenParams, self).__reduce__()[1:]
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def thaw(self) -> Params:
+        """ Returns a mutable copy of this instance. """
+        return self._public_class_._from_valid_dict({name: self[name] for name in self._Params__value_names})
+
+    def clone(self, **kwargs) -> Params:
+        """
+        Creates a mutable copy-on-write clone, sharing the values of this frozen instance.
+
+        The clone stores only the overridden parameters and a reference to this instance.
+        It gets materialized into a regular instance of its class on the first
+        modification or on any access to its full content (i.e. ``dict(clone)``,
+        ``clone.items()``, equality checks or serialization).
+
+        **N.B.** as the ``dict`` storage of a clone stays empty until materialized, use ``dict(clone)``
+        when passing it to C code accessing the ``dict`` storage directly (i.e. ``json.dumps()``).
+
+        :param kwargs: parameters to override in the clone.
+        """
+        params_class = self._public_class_
+        params_class._check_keys(kwargs)
+        if params_class._Params__strict and kwargs:
+            kwargs = params_class._validate_values(kwargs)
+        cow_class = params_class.__dict__.get("_cow_class_")
+        if cow_class is None:
+            cow_class = params_class._cow_class_ = _cow_class(params_class)
+        params = dict.__new__(cow_class)
+        vars(params).update(_cow_parent_=self, _cow_overrides_=kwargs)
+        return params
+
+
+def _restore_frozen_params(params_class, mask, values):
+    return _restore_params(params_class, mask, values).freeze()
+
+
+def _frozen_class(cls):
+    """ Generates the frozen class of the Params class ``cls``. """
+    storage_class = cls._Params__compact_class if cls._Params__compact else cls
+    return type(cls.__name__, (FrozenParams, storage_class), {
+        "__slots__": ("_hash_",),
+        "__module__": cls.__module__,
+        "__qualname__": cls.__qualname__,
+        "__new__": staticmethod(_frozen_new),
+        "_public_class_": cls,
+    })
+
+
+def _frozen_new(cls, *args, **kwargs):
+    return dict.__new__(cls)
+
+
+class _CopyOnWriteParams:
+    """ Serves the parameter reads of a ``FrozenParams.clone()`` from its overrides and the frozen parent,
+    until it gets materialized into an instance of its storage class. """
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        overrides = vars(self)["_cow_overrides_"]
+        if key in overrides:
+            return overrides[key]
+        if key in self._cow_properties_:
+            return getattr(self, key)           # evaluate with the overrides
+        return vars(self)["_cow_parent_"][key]
+
+    def __contains__(self, key):
+        return key in self._Params__keys
+
+    def get(self, key, default=None):
+        return self[key] if key in self._Params__keys else default
+
+    def _cow_materialize(self):
+        values = {name: self[name] for name in self._Params__value_names}
+        state = vars(self)
+        del state["_cow_parent_"], state["_cow_overrides_"]
+        object.__setattr__(self, "__class__", self._storage_class_)
+        self._init_values(values)
+
+
+def _materializing(name):
+    def method(self, *args, **kwargs):
+        self._cow_materialize()
+        return getattr(self, name)(*args, **kwargs)
+    method.__name__ = name
+    return method
+
+
+for _name in ["__setitem__", "__delitem__", "__iter__", "__reversed__", "__len__", "__eq__", "__ne__", "__repr__",
+              "__or__", "__ror__", "__ior__", "__reduce_ex__", "keys", "values", "items", "copy", "update",
+              "pop", "popitem", "clear", "setdefault", "freeze", "clone", "serialize"]:
+    setattr(_CopyOnWriteParams, _name, _materializing(_name))
+_CopyOnWriteParams.__hash__ = None
+
+
+def _cow_class(cls):
+    """ Generates the copy-on-write clone class of the Params class ``cls``. """
+    storage_class = cls._Params__compact_class if cls._Params__compact else cls
+    namespace = {
+        "__slots__": (),
+        "__module__": cls.__module__,
+        "__qualname__": cls.__qualname__,
+        "__new__": staticmethod(_frozen_new),
+        "_public_class_": cls,
+        "_storage_class_": storage_class,
+        "_cow_properties_": frozenset(spec.name for spec in cls._Params__prop_specs),
+    }
+    for name in getattr(storage_class, "__slots__", ()):
+        if name in cls._Params__keys:           # replace the compact slot descriptors
+            namespace[name] = _ParamAttribute(name, cls._Params__defaults[name])
+    return type(cls.__name__, (_CopyOnWriteParams, storage_class), namespace)
+
+
+class _InternRegistry:
+    """ Maps the hash of the interned frozen instances to weak references of the instances. """
+    __slots__ = ("entries", "lock", "hits", "misses", "bytes_saved")
+
+    def __init__(self):
+        self.entries = {}                   # hash -> [weakref]
+        self.lock = threading.RLock()       # reentrant, as the weakref callbacks might run in the GC
+        self.hits = self.misses = self.bytes_saved = 0
+
+    def intern(self, frozen: 'FrozenParams') -> 'FrozenParams':
+        names = frozen._Params__value_names
+        with self.lock:
+            refs = self.entries.get(frozen._hash_)
+            for ref in refs or ():
+                candidate = ref()
+                if candidate is not None and all(_same_value(candidate[name], frozen[name]) for name in names):
+                    self.hits += 1
+                    if candidate is not frozen:
+                        self.bytes_saved += sys.getsizeof(frozen)
+                    return candidate
+            if refs is None:
+                refs = self.entries[frozen._hash_] = []
+            refs.append(weakref.ref(frozen, functools.partial(self._discard, frozen._hash_)))
+            self.misses += 1
+            return frozen
+
+    def _discard(self, key, ref):
+        with self.lock:
+            refs = self.entries.get(key, [])
+            if ref in refs:
+                refs.remove(ref)
+                if not refs:
+                    del self.entries[key]
+
+    def info(self) -> InternInfo:
+        with self.lock:
+            currsize = sum(ref() is not None for refs in self.entries.values() for ref in refs)
+            return InternInfo(self.hits, self.misses, currsize, self.bytes_saved)
+
+
+_GENERATED_BASES = frozenset([_CompactParams, FrozenParams, _CopyOnWriteParams])
+
+
+def _hashable(value):
+    """ Returns a hashable equivalent of the given (nested list, set or dict) value. """
+    if isinstance(value, (list, tuple)):
+        return tuple(map(_hashable, value))
+    if isinstance(value, dict):
+        return frozenset((key, _hashable(val)) for key, val in value.items())
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
+
+def _same_value(value, other) -> bool:
+    if value is other:
+        return True
+    try:
+        return type(value) is type(other) and bool(value == other)
+    except Exception:   # i.e. NumPy arrays
+        return False
+
+
+def _restore_params(params_class, mask, values):
+    """ Restores a pickled Params instance (see ``Params.__reduce__()``). """
+    names = params_class._Params__value_names
+    overrides = {}
+    values = iter(values)
+    while mask:
+        bit = (mask & -mask).bit_length() - 1
+        overrides[names[bit]] = next(values)
+        mask &= mask - 1
+    return params_class._from_valid_dict(overrides)
+
 
 def _str2bool(v: Text) -> bool:
     if isinstance(v, bool):
@@ -0,0 +1,205 @@
+# coding=utf-8
+#
+# created by kpe on 19.10.2026 at 10:20 AM
+#
+
+from __future__ import division, absolute_import, print_function
+
+import itertools
+import math
+import random
+from typing import Text, Type, Dict, Sequence
+
+from .params import Params
+
+
+class Choice:
+    """ A uniform distribution over the given values. """
+    def __init__(self, values: Sequence):
+        if not values:
+            raise ValueError("Choice() expects at least one value")
+        self.values = list(values)
+
+    def ppf(self, u: float):
+        """ Maps a ``u`` in ``[0, 1)`` to a value (the inverse of the cumulative distribution function). """
+        return self.values[min(int(u * len(self.values)), len(self.values) - 1)]
+
+
+class Uniform:
+    """ A uniform distribution over the ``[low, high)`` interval. """
+    def __init__(self, low: float, high: float):
+        self.low, self.high = low, high
+
+    def ppf(self, u: float) -> float:
+        return self.low + u * (self.high - self.low)
+
+
+class LogUniform(Uniform):
+    """ A log-uniform distribution over the ``[low, high)`` interval (i.e. for learning rates). """
+    def __init__(self, low: float, high: float):
+        super(LogUniform, self).__init__(low, high)
+        self._log_low, self._log_high = math.log(low), math.log(high)
+
+    def ppf(self, u: float) -> float:
+        return math.exp(self._log_low + u * (self._log_high - self._log_low))
+
+
+class IntUniform(Uniform):
+    """ A uniform distribution over the integers in ``[low, high]``. """
+    def ppf(self, u: float) -> int:
+        return min(self.low + int(u * (self.high - self.low + 1)), self.high)
+
+
+def _check_names(params_class: Type[Params], names):
+    """ Checks the given names are (non ``@property``) parameters of ``params_class``. """
+    params_class._check_keys(dict.fromkeys(names))
+    properties = [name for name in names if params_class.param_specs()[name].is_property]
+    if properties:
+        raise ValueError("Could not sweep the @property parameters {} of '{}'".format(
+            ", ".join(map("'{}'".format, properties)), params_class.__name__))
+
+
+def _base_values(params_class: Type[Params], base) -> Dict[Text, object]:
+    if base is None:
+        return {}
+    base = base if isinstance(base, params_class) else params_class(base)
+    return {name: base[name] for name in params_class.value_names()}
+
+
+def _shard_indices(size: int, worker_index: int, num_workers: int):
+    if not 0 <= worker_index < num_workers:
+        raise ValueError("Expected 0 <= worker_index < num_workers, but got worker_index={} and num_workers={}".format(
+            worker_index, num_workers))
+    return range(worker_index, size, num_workers)
+
+
+class ParamsGrid:
+    """
+    A lazy cartesian product grid of ``Params`` instances.
+
+    The grid points are enumerated like ``itertools.product()`` (the last parameter varies fastest)
+    and are addressable by index, so a grid with billions of points is never materialized
+    and could be split deterministically across workers with ``shard()``.
+
+    Example:
+
+        import params as pp
+
+        grid = pp.ParamsGrid(MyParams, {"learning_rate": [0.1, 0.01], "num_layers": [2, 4, 8]})
+        len(grid)                                # 6
+        for params in grid.shard(worker_index, num_workers):
+            train(params)
+    """
+
+    def __init__(self, params_class: Type[Params], values: Dict[Text, Sequence], base=None):
+        """
+        :param params_class: the ``Params`` subclass to create instances of.
+        :param values: a dict with the values to sweep for each parameter.
+        :param base: (Optional) an instance (or dict) with the values of the parameters not swept.
+        """
+        _check_names(params_class, values)
+        self.params_class = params_class
+        self.names = list(values)
+        self.values = [list(vals) for vals in values.values()]
+        self._base = _base_values(params_class, base)
+
+    def __len__(self):
+        size = 1
+        for vals in self.values:
+            size *= len(vals)
+        return size
+
+    def _create(self, point) -> Params:
+        args = dict(self._base)
+        args.update(zip(self.names, point))
+        return self.params_class._from_valid_dict(args)
+
+    def __getitem__(self, index: int) -> Params:
+        """ Returns the grid point with the given index. """
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("ParamsGrid index out of range")
+        point = []
+        for vals in reversed(self.values):
+            index, idx = divmod(index, len(vals))
+            point.append(vals[idx])
+        return self._create(reversed(point))
+
+    def __iter__(self):
+        return map(self._create, itertools.product(*self.values))
+
+    def shard(self, worker_index: int, num_workers: int):
+        """ Lazily yields the grid points with ``index % num_workers == worker_index``. """
+        return map(self.__getitem__, _shard_indices(len(self), worker_index, num_workers))
+
+
+class ParamsSampler:
+    """
+    A random sampler of ``Params`` instances.
+
+    Every sample is drawn from a random generator seeded with the sampler seed and the sample index,
+    so the samples are reproducible and a sweep could be split deterministically across workers
+    without coordination.
+
+    Example:
+
+        import params as pp
+        from params.sweep import LogUniform, IntUniform
+
+        sampler = pp.ParamsSampler(MyParams, {"learning_rate": LogUniform(1e-4, 1e-1),
+                                              "num_layers":    IntUniform(2, 12),
+                                              "optimizer":     ["adam", "sgd"]}, seed=42)
+        for params in sampler.sample(1000, worker_index, num_workers):
+            train(params)
+    """
+
+    def __init__(self, params_class: Type[Params], distributions: Dict[Text, object], seed=0, base=None):
+        """
+        :param params_class: the ``Params`` subclass to create instances of.
+        :param distributions: a dict with a distribution (an object with a ``ppf(u)`` method,
+               like ``Uniform``, ``LogUniform``, ``IntUniform`` or ``Choice``) or a list of values
+               for each sampled parameter.
+        :param seed: the random seed.
+        :param base: (Optional) an instance (or dict) with the values of the parameters not sampled.
+        """
+        _check_names(params_class, distributions)
+        self.params_class = params_class
+        self.names = list(distributions)
+        self.distributions = [dist if hasattr(dist, "ppf") else Choice(dist) for dist in distributions.values()]
+        self.seed = seed
+        self._base = _base_values(params_class, base)
+
+    def _create(self, units) -> Params:
+        args = dict(self._base)
+        args.update((name, dist.ppf(u)) for name, dist, u in zip(self.names, self.distributions, units))
+        return self.params_class._from_valid_dict(args)
+
+    def _sample(self, index: int) -> Params:
+        rng = random.Random("{}:{}".format(self.seed, index))
+        return self._create([rng.random() for _ in self.names])
+
+    def sample(self, num_samples: int, worker_index: int = 0, num_workers: int = 1):
+        """ Lazily yields the random samples with ``index % num_workers == worker_index``. """
+        return map(self._sample, _shard_indices(num_samples, worker_index, num_workers))
+
+    def latin_hypercube(self, num_samples: int, worker_index: int = 0, num_workers: int = 1):
+        """ Lazily yields the Latin hypercube samples with ``index % num_workers == worker_index``.
+
+        Each parameter range is divided into ``num_samples`` equally probable strata and every stratum
+        is sampled exactly once (across all the workers).
+        """
+        indices = _shard_indices(num_samples, worker_index, num_workers)
+        rng = random.Random("{}:lhs".format(self.seed))
+        strata = []
+        for _ in self.names:
+            perm = list(range(num_samples))
+            rng.shuffle(perm)
+            strata.append(perm)
+
+        def create(index):
+            jitter = random.Random("{}:lhs:{}".format(self.seed, index))
+            return self._create([(perm[index] + jitter.random()) / num_samples for perm in strata])
+
+        return map(create, indices)
@@ -0,0 +1,184 @@
+# coding=utf-8
+#
+# created by kpe on 18.10.2026 at 10:12 AM
+#
+
+from __future__ import division, absolute_import, print_function
+
+import array
+import operator
+from typing import Text, Type
+
+from .params import Params
+
+
+_TYPECODES = {bool: "b", int: "q", float: "d"}
+
+
+def _numpy():
+    try:
+        import numpy
+        return numpy
+    except ImportError:  # pragma: no cover
+        return None      # pragma: no cover
+
+
+class ParamsTable:
+    """
+    A columnar container for many instances of a single ``Params`` class.
+
+    Stores one column per parameter spec - an ``array.array`` for parameters
+    declared with a ``bool``, ``int`` or ``float`` dtype (falling back to a ``list``
+    when a value is not of exactly that type, i.e. ``None``, or does not fit) and
+    a ``list`` otherwise. ``Params`` instances are only materialized when rows are accessed.
+
+    Example:
+
+        import params as pp
+
+        class MyParams(pp.Params):
+            learning_rate = 0.1
+            num_layers    = 2
+
+        table = pp.ParamsTable(MyParams, [MyParams(learning_rate=lr) for lr in [0.1, 0.01, 0.001]])
+        small = table.filter(table.column("learning_rate") < 0.05)   # vectorized with NumPy
+        best  = small.sort("learning_rate")[0]                        # a MyParams instance
+    """
+
+    def __init__(self, params_class: Type[Params], rows=()):
+        """
+        :param params_class: the ``Params`` subclass of the rows.
+        :param rows: (Optional) an iterable of ``params_class`` instances or parameter dictionaries.
+        """
+        self.params_class = params_class
+        self._specs = params_class.param_specs()
+        self._columns = {}
+        for name, spec in self._specs.items():
+            typecode = _TYPECODES.get(spec.dtype)
+            self._columns[name] = array.array(typecode) if typecode else []
+        self._size = 0
+        self.extend(rows)
+
+    def __len__(self):
+        return self._size
+
+    def append(self, params):
+        """ Appends a row given as a ``Params`` instance or a dictionary of parameter values. """
+        if not isinstance(params, self.params_class):
+            params = self.params_class(params)
+        for name, column in self._columns.items():
+            value = params[name]
+            if type(value) is not self._specs[name].dtype and not isinstance(column, list):
+                column = self._columns[name] = self._decode_column(name, column)   # i.e. None or 1 for a float
+            try:
+                column.append(value)
+            except OverflowError:
+                column = self._columns[name] = self._decode_column(name, column)
+                column.append(value)
+        self._size += 1
+
+    def extend(self, rows):
+        """ Appends all the rows in the given iterable. """
+        for params in rows:
+            self.append(params)
+
+    def _decode_column(self, name, column):
+        """ Returns the values of a column as a list. """
+        if isinstance(column, list):
+            return column
+        values = column.tolist()
+        if self._specs[name].dtype is bool:
+            values = list(map(bool, values))
+        return values
+
+    def _row_values(self, index):
+        values = {}
+        for name, spec in self._specs.items():
+            if spec.is_property:
+                continue                          # derived on materialization
+            value = self._columns[name][index]
+            if spec.dtype is bool and not isinstance(self._columns[name], list):
+                value = bool(value)
+            values[name] = value
+        return values
+
+    def row(self, index: int) -> Params:
+        """ Materializes the row at the given index as a ``Params`` instance
+        (modifications of the instance are not reflected in the table). """
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("ParamsTable index out of range")
+        return self.params_class._from_valid_dict(self._row_values(index))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.take(range(*index.indices(self._size)))
+        return self.row(index)
+
+    def __iter__(self):
+        for index in range(self._size):
+            yield self.params_class._from_valid_dict(self._row_values(index))
+
+    def column(self, name: Text):
+        """ Returns the column of the given parameter.
+
+        Typed columns are returned as a zero-copy NumPy view (if NumPy is available, otherwise as
+        ``array.array``) - the table could not be appended to while such views are alive.
+        All other columns are returned as ``list``.
+        """
+        if name not in self._columns:
+            raise KeyError("Unexpected parameter '{}' for ParamsTable of '{}'".format(
+                name, self.params_class.__name__))
+        column = self._columns[name]
+        np = _numpy()
+        if np is None or isinstance(column, list):
+            return column
+        dtype = np.bool_ if column.typecode == "b" else np.dtype(column.typecode)
+        return np.frombuffer(column, dtype=dtype) if len(column) else np.array([], dtype=dtype)
+
+    def columns(self):
+        """ Returns a dictionary of all columns (suitable for ``Params.from_columns()``). """
+        return {name: self.column(name) for name in self._columns}
+
+    def take(self, indices) -> 'ParamsTable':
+        """ Returns a new table with the rows at the given indices. """
+        indices = list(map(operator.index, indices))
+        result = ParamsTable(self.params_class)
+        for name, column in self._columns.items():
+            values = operator.itemgetter(*indices)(column) if indices else ()
+            values = values if len(indices) != 1 else (values,)
+            if isinstance(column, list):
+                result._columns[name] = list(values)
+            else:
+                result._columns[name] = array.array(column.typecode, values)
+        result._size = len(indices)
+        return result
+
+    def filter(self, mask) -> 'ParamsTable':
+        """ Returns a new table with the selected rows.
+
+        :param mask: a sequence of booleans (i.e. a NumPy boolean array like ``table.column("lr") > 0.1``),
+               or a predicate called with every materialized ``Params`` row.
+        """
+        if callable(mask):
+            mask = map(mask, self)
+        else:
+            if len(mask) != self._size:
+                raise ValueError("Mask length {} does not match the table length {}".format(len(mask), self._size))
+        return self.take(index for index, selected in enumerate(mask) if selected)
+
+    def sort(self, by, reverse: bool = False) -> 'ParamsTable':
+        """ Returns a new table sorted (stable) by the given parameter name or list of parameter names. """
+        names = [by] if isinstance(by, str) else list(by)
+        columns = [self._columns[name] for name in names]
+        key = (lambda idx: tuple(col[idx] for col in columns)) if len(columns) > 1 else columns[0].__getitem__
+        return self.take(sorted(range(self._size), key=key, reverse=reverse))
+
+    def group_by(self, name: Text):
+        """ Returns a dictionary mapping every distinct value of the given parameter to a table of its rows. """
+        column = self._decode_column(name, self._columns[name])
+        groups = {}
+        for index, value in enumerate(column):
+            groups.setdefault(value, []).append(index)
+        return {value: self.take(indices) for value, indices in groups.items()}
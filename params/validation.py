@@ -0,0 +1,206 @@
+# coding=utf-8
+#
+# created by kpe on 19.10.2026 at 6:10 PM
+#
+
+from __future__ import division, absolute_import, print_function
+
+import enum
+import json
+import typing
+from typing import Callable, Optional
+
+_TRUE_STRINGS  = ('yes', 'true', 't', 'y', '1')
+_FALSE_STRINGS = ('no', 'false', 'f', 'n', '0')
+
+
+def _type_name(dtype) -> str:
+    if isinstance(dtype, type) and getattr(dtype, "__origin__", None) is None:
+        return dtype.__name__
+    return str(dtype).replace("typing.", "")
+
+
+def _mismatch(dtype, value):
+    return TypeError("expected {}, but got {} {!r}".format(_type_name(dtype), type(value).__name__, value))
+
+
+def instance_check_type(dtype):
+    """ Returns the class to check the values of ``dtype`` with ``isinstance()`` or None if not applicable. """
+    if isinstance(dtype, type) and getattr(dtype, "__origin__", None) is None:
+        return dtype
+    origin = getattr(dtype, "__origin__", None)
+    return origin if isinstance(origin, type) else None
+
+
+def _bool_validator(value):
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        if value.lower() in _TRUE_STRINGS:
+            return True
+        if value.lower() in _FALSE_STRINGS:
+            return False
+    raise _mismatch(bool, value)
+
+
+def _int_validator(value):
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            pass
+    raise _mismatch(int, value)
+
+
+def _float_validator(value):
+    if isinstance(value, float):
+        return value
+    if isinstance(value, int) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    raise _mismatch(float, value)
+
+
+def _str_validator(value):
+    if isinstance(value, str):
+        return value
+    raise _mismatch(str, value)
+
+
+_SCALAR_VALIDATORS = {bool: _bool_validator, int: _int_validator, float: _float_validator, str: _str_validator}
+
+
+def _enum_validator(dtype):
+    def validate(value):
+        if isinstance(value, dtype):
+            return value
+        try:
+            return dtype(value)             # by value
+        except ValueError:
+            pass
+        if isinstance(value, str) and value in dtype.__members__:
+            return dtype[value]             # by name
+        raise _mismatch(dtype, value)
+    return validate
+
+
+def _union_validator(dtype, args):
+    args = [arg for arg in args if arg is not type(None)]
+    validators = [compile_validator(arg) for arg in args]
+    if None in validators:
+        return None                         # i.e. Optional[Any]
+    classes = [arg for arg in args if instance_check_type(arg) is arg]
+
+    def validate(value):
+        for cls in classes:                 # keep the values matching a member type (i.e. "5" for Union[int, str])
+            if isinstance(value, cls) and (cls is not int or not isinstance(value, bool)):
+                return value
+        for validator in validators:        # before coercing to the first possible member type
+            try:
+                return validator(value)
+            except TypeError:
+                continue
+        raise _mismatch(dtype, value)
+    return validate
+
+
+def _sequence_validator(dtype, container, item_validator):
+    def validate(value):
+        if not isinstance(value, (list, tuple, set, frozenset)):
+            raise _mismatch(dtype, value)
+        if item_validator is None:
+            return container(value)
+        return container(item_validator(item) for item in value)
+    return validate
+
+
+def _dict_validator(dtype, key_validator, value_validator):
+    def validate(value):
+        if not isinstance(value, dict):
+            raise _mismatch(dtype, value)
+        return {key_validator(key): value_validator(val) for key, val in value.items()}
+    return validate
+
+
+def _identity(value):
+    return value
+
+
+def _isinstance_validator(dtype):
+    def validate(value):
+        if isinstance(value, dtype):
+            return value
+        raise _mismatch(dtype, value)
+    return validate
+
+
+def compile_validator(dtype) -> Optional[Callable]:
+    """
+    Compiles a validating and coercing callable for the given ``dtype``
+    (a class, an ``Enum`` or a ``typing`` generic like ``Optional[int]``, ``List[float]``
+    or ``Dict[str, int]``).
+
+    The callable returns the (coerced) value or raises a ``TypeError``. The coercions
+    are: ``int`` to ``float``, strings to ``bool``, ``int`` and ``float``, values or names
+    to ``Enum`` members and between lists, tuples and sets (with their items validated).
+
+    :return: the validator, or None if ``dtype`` does not restrict the values.
+    """
+    if dtype is None or dtype is typing.Any or dtype is object:
+        return None
+    if dtype in _SCALAR_VALIDATORS:
+        return _SCALAR_VALIDATORS[dtype]
+    if isinstance(dtype, type) and issubclass(dtype, enum.Enum):
+        return _enum_validator(dtype)
+
+    origin = getattr(dtype, "__origin__", None)
+    args = [arg for arg in getattr(dtype, "__args__", None) or () if not isinstance(arg, typing.TypeVar)]
+    if origin is typing.Union:
+        return _union_validator(dtype, args)
+    if origin in (list, typing.List, tuple, typing.Tuple, set, typing.Set):
+        container = {typing.List: list, typing.Tuple: tuple, typing.Set: set}.get(origin, origin)
+        if container is tuple and args and (len(args) != 2 or args[1] is not Ellipsis):
+            return _isinstance_validator(tuple)     # fixed length tuples are only type checked
+        item_validator = compile_validator(args[0]) if args else None
+        return _sequence_validator(dtype, container, item_validator)
+    if origin in (dict, typing.Dict):
+        key_validator = (compile_validator(args[0]) if args else None) or _identity
+        value_validator = (compile_validator(args[1]) if len(args) > 1 else None) or _identity
+        return _dict_validator(dtype, key_validator, value_validator)
+
+    check_type = instance_check_type(dtype)
+    return _isinstance_validator(check_type) if check_type is not None else None
+
+
+def parse_text(dtype, text: str):
+    """ Parses a command line argument or environment variable string into a value of ``dtype``
+    (with JSON for lists, dicts and the other non scalar types). """
+    validator = compile_validator(dtype)
+    if validator is None or dtype is str:
+        return text
+    try:
+        return validator(text)
+    except TypeError:
+        pass
+    try:
+        value = json.loads(text)
+    except ValueError:
+        raise TypeError("Could not parse '{}' as {}".format(text, _type_name(dtype))) from None
+    return None if value is None else validator(value)
+
+
+def argument_type(dtype) -> Optional[Callable]:
+    """ Returns the ``argparse`` argument ``type`` parsing the values of ``dtype`` (see ``parse_text()``). """
+    if dtype is None or instance_check_type(dtype) is dtype:
+        return dtype                        # a plain class
+
+    def parse(text):
+        return parse_text(dtype, text)
+    parse.__name__ = _type_name(dtype)      # reported by argparse as i.e. "invalid List[int] value"
+    return parse
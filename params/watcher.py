@@ -0,0 +1,140 @@
+# coding=utf-8
+#
+# created by kpe on 19.10.2026 at 10:30 PM
+#
+
+from __future__ import division, absolute_import, print_function
+
+import os
+import threading
+from typing import Type, Callable
+
+from .loader import _read_file
+from .params import Params, FrozenParams
+
+
+class ParamsWatcher:
+    """
+    Hot reloads a ``Params`` instance from a (local) JSON or YAML config file.
+
+    A background thread polls the modification time and the size of the file and reparses
+    it only when they change. The new config is validated against the class specs
+    (see ``Params.validate()``) and then atomically swapped in as a frozen instance,
+    so readers could access ``watcher.params`` from any thread without locking.
+    An invalid config is ignored (keeping the current instance) and reported
+    to the ``on_error`` callback, as are the exceptions raised by the callbacks.
+
+    Example:
+
+        import params as pp
+
+        watcher = pp.ParamsWatcher("serving.yaml", ServingParams, interval=5.0)
+        watcher.add_callback(lambda params, changes: print("reloaded:", changes))
+        with watcher:
+            while True:
+                handle(request, watcher.params.batch_size)
+    """
+
+    def __init__(self, file_path, params_class: Type[Params], interval: float = 1.0,
+                 check_params=True, on_error: Callable = None):
+        """
+        Loads the config file (raising on errors) without starting the watching thread.
+
+        :param file_path: the config file path (``*.yaml``/``*.yml`` files are parsed as YAML, all others as JSON).
+        :param params_class: the ``Params`` subclass of the config.
+        :param interval: the polling interval in seconds.
+        :param check_params: whether to reject configs with params not compatible with ``params_class``.
+        :param on_error: (Optional) a callable called with the exception of a failed reload
+               or of a failed callback.
+        """
+        self.file_path = os.fspath(file_path)
+        self.params_class = params_class
+        self.interval = interval
+        self.check_params = check_params
+        self.on_error = on_error
+        self.last_error = None
+        self._callbacks = []
+        self._thread = None
+        self._stopped = threading.Event()
+        self._stat = self._file_stat()
+        self._params = self._load()
+
+    @property
+    def params(self) -> FrozenParams:
+        """ The current (frozen) instance. """
+        return self._params
+
+    def add_callback(self, callback: Callable):
+        """ Registers a callable to be called (from the watching thread) with the new instance and
+        a dict of the changed parameters with their new values (see ``Params.diff()``) after every reload. """
+        self._callbacks.append(callback)
+
+    def _file_stat(self):
+        stat = os.stat(self.file_path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def _load(self) -> FrozenParams:
+        values = _read_file(self.params_class, self.file_path)
+        if not self.check_params:
+            values = {key: value for key, value in values.items() if key in self.params_class.param_specs()}
+        return self.params_class._from_valid_dict(self.params_class.validate(values)).freeze()
+
+    def check(self) -> bool:
+        """ Reloads the config, if the file has changed since the last check.
+
+        :return: True if the config was reloaded with changed parameter values.
+        """
+        try:
+            stat = self._file_stat()
+            if stat == self._stat:
+                return False
+            self._stat = stat
+            params = self._load()
+        except Exception as err:
+            self._report_error(err)
+            return False
+        self.last_error = None
+
+        changes = self._params.diff(params)
+        if not changes:
+            return False
+        self._params = params                   # atomic reference swap
+        for callback in list(self._callbacks):
+            try:
+                callback(params, changes)
+            except Exception as err:            # do not skip the other callbacks
+                self._report_error(err)
+        return True
+
+    def _report_error(self, err: Exception):
+        self.last_error = err
+        if self.on_error is not None:
+            self.on_error(err)
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            try:
+                self.check()
+            except Exception as err:            # raised by on_error, keep watching
+                self.last_error = err
+
+    def start(self) -> 'ParamsWatcher':
+        """ Starts watching the file in a daemon thread. """
+        if self._thread is None:
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, name="ParamsWatcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """ Stops the watching thread. """
+        if self._thread is not None:
+            self._stopped.set()
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
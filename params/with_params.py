@@ -58,11 +58,46 @@ class WithParams:
     def from_params(cls, params: Params, *args, **kwargs):
         """
         Creates an instance from the specified parameters (by overriding the params argument with kwargs).
+
+        The kwargs are split only once and the values of ``params`` (when being an instance
+        of ``cls.Params`` or of a subclass) are not validated again. A frozen ``cls.Params``
+        instance without overrides is shared as is (see ``Params.freeze()``).
         """
-        # split non Params kwargs
-        kwargs, other_args = cls.Params.from_dict(kwargs, return_unused=True, return_instance=False)
-        kwargs = dict(cls.Params.from_dict(
-            params, return_unused=False).clone(**kwargs))   # override with kwargs
-        kwargs.update(**other_args)                         # add non Params kwargs back
-        instance = cls(*args, **kwargs)
+        params_class = cls.Params
+        overrides, other_args = _split_kwargs(params_class, kwargs)
+
+        if cls.__init__ is not WithParams.__init__:             # respect custom constructors
+            args_dict = {name: params[name] for name in params_class.value_names() if name in params}
+            args_dict.update(overrides)
+            args_dict.update(other_args)
+            return cls(*args, **args_dict)
+
+        if not overrides and isinstance(params, pp.FrozenParams) and params._public_class_ is params_class:
+            cls_params = params                                 # immutable, so could be shared
+        elif isinstance(params, params_class):                  # already validated
+            if overrides and params_class._Params__strict:
+                overrides = params_class._validate_values(overrides)
+            values = {name: params[name] for name in params_class.value_names()}
+            values.update(overrides)
+            cls_params = params_class._from_valid_dict(values, validated=True)
+        else:
+            values = {name: params[name] for name in params_class.value_names() if name in params}
+            values.update(overrides)
+            cls_params = params_class._from_valid_dict(values)
+
+        instance = cls.__new__(cls, *args, **other_args)
+        instance._params = cls_params
+        instance._construct(*args, **other_args)
         return instance
+
+
+def _split_kwargs(params_class, kwargs):
+    """ Splits ``kwargs`` (in a single pass) into the ``params_class`` parameters and the other arguments. """
+    keys = params_class._Params__keys
+    overrides, other_args = {}, {}
+    for key, value in kwargs.items():
+        if key in keys:
+            overrides[key] = value
+        else:
+            other_args[key] = value
+    return overrides, other_args
@@ -0,0 +1,102 @@
+# coding=utf-8
+#
+# created by kpe on 18.10.2026 at 7:55 PM
+#
+
+from __future__ import division, absolute_import, print_function
+
+import os
+import sys
+import tempfile
+import unittest
+
+import params as pp
+
+
+class TrialParams(pp.Params):
+    learning_rate = 0.1
+    num_layers    = 2
+    use_bias      = True
+    optimizer     = "adam"
+    max_steps     = pp.Param(None, dtype=int)
+    layer_sizes   = [8, 4]
+
+    @property
+    def depth(self):
+        return self.num_layers * 2
+
+
+class ParamsArchiveTest(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, "trials.bin")
+        self.trials = [TrialParams(learning_rate=idx / 10, num_layers=idx, use_bias=idx % 2 == 0,
+                                   optimizer="sgd-ü" * idx, max_steps=idx if idx > 1 else None)
+                       for idx in range(5)]
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_archive(self):
+        self.assertEqual(5, pp.ParamsArchive.write(self.file_path, TrialParams, iter(self.trials)))
+        with pp.ParamsArchive(self.file_path, TrialParams) as archive:
+            self.assertEqual(5, len(archive))
+            self.assertEqual(self.trials[3], archive[3])
+            self.assertIsInstance(archive[3], TrialParams)
+            self.assertEqual(8, archive[-1].depth)
+            self.assertIs(archive[1].use_bias, False)
+            self.assertEqual(self.trials, list(archive))
+            with self.assertRaises(IndexError):
+                archive[5]
+
+            self.assertEqual([0, 1, 2, 3, 4], list(archive.column("num_layers")))
+            self.assertEqual([True, False, True, False, True], list(archive.column("use_bias")))
+            self.assertEqual([None, None, 2, 3, 4], archive.column("max_steps"))
+            self.assertEqual("sgd-ü", archive.column("optimizer")[1])
+            with self.assertRaises(KeyError):
+                archive.column("depth")
+
+    def test_exact_types(self):
+        trials = [TrialParams(learning_rate=1), TrialParams(num_layers=True), TrialParams(num_layers=2 ** 70)]
+        pp.ParamsArchive.write(self.file_path, TrialParams, trials)
+        with pp.ParamsArchive(self.file_path, TrialParams) as archive:
+            self.assertEqual(trials, list(archive))
+            self.assertIs(int, type(archive[0].learning_rate))
+            self.assertIs(True, archive[1].num_layers)
+            self.assertEqual({}, archive[0].diff(trials[0]))
+        pp.ParamsArchive.write(self.file_path, TrialParams, trials[2:])         # not fitting
+        with pp.ParamsArchive(self.file_path, TrialParams) as archive:
+            self.assertEqual(trials[2:], list(archive))
+
+    def test_dicts(self):
+        pp.ParamsArchive.write(self.file_path, TrialParams, [{"num_layers": 7}, {}])
+        with pp.ParamsArchive(self.file_path, TrialParams) as archive:
+            self.assertEqual([TrialParams(num_layers=7), TrialParams()], list(archive))
+
+    def test_invalid(self):
+        class OtherParams(pp.Params):
+            num_layers = 2
+
+        pp.ParamsArchive.write(self.file_path, TrialParams, self.trials)
+        with self.assertRaises(AttributeError):
+            pp.ParamsArchive(self.file_path, OtherParams)
+
+        with open(self.file_path, "rb") as fp:
+            data = fp.read()
+        other_byteorder = "big" if sys.byteorder == "little" else "little"
+        with open(self.file_path, "wb") as fp:       # same header size
+            fp.write(data.replace('"{}"'.format(sys.byteorder).encode("utf-8"),
+                                  '"{}"'.format(other_byteorder).ljust(len(sys.byteorder) + 2).encode("utf-8"), 1))
+        with self.assertRaises(ValueError) as ctx:
+            pp.ParamsArchive(self.file_path, TrialParams)
+        self.assertIn(other_byteorder, str(ctx.exception))
+
+        with open(self.file_path, "wb") as fp:
+            fp.write(b"something else")
+        with self.assertRaises(ValueError):
+            pp.ParamsArchive(self.file_path, TrialParams)
+
+
+if __name__ == '__main__':
+    unittest.main()
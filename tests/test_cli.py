@@ -0,0 +1,79 @@
+# coding=utf-8
+#
+# created by kpe on 19.10.2026 at 8:40 PM
+#
+
+from __future__ import division, absolute_import, print_function
+
+import contextlib
+import io
+import unittest
+from typing import List, Optional
+
+import params as pp
+
+
+class ModelParams(pp.Params):
+    num_layers = pp.Param(2, doc="number of layers")
+    use_bias   = pp.Param(True, doc="whether to use bias")
+    activation = pp.Param("relu", doc="activation function")
+    maxLen     = pp.Param(16, doc="max length")
+    internal   = 1
+
+    @property
+    def depth(self):
+        return self.num_layers * 2
+
+
+class TrainParams(pp.Params, strict=True):
+    learning_rate = pp.Param(0.1, doc="learning rate")
+    command       = pp.Param(None, dtype=str, doc="command to execute", positional=True)
+
+
+class TypedParams(pp.Params):
+    max_steps   = pp.Param(None, dtype=Optional[int], doc="maximal number of steps")
+    layer_sizes = pp.Param([8], dtype=List[int], doc="layer sizes")
+
+
+class ParamsCliTest(unittest.TestCase):
+
+    def test_argument_specs_cached(self):
+        self.assertIs(ModelParams._argument_specs(), ModelParams._argument_specs())
+        self.assertIsNot(ModelParams.to_argument_parser(), ModelParams.to_argument_parser())
+        self.assertEqual(["command", "learning_rate"], [spec[0] for spec in TrainParams._argument_specs()])
+
+    def test_from_argv(self):
+        params = ModelParams.from_argv(["--num-layers", "4", "--use-bias", "no", "--maxlen", "8"])
+        self.assertIsInstance(params, ModelParams)
+        self.assertEqual(ModelParams(num_layers=4, use_bias=False, maxLen=8), params)
+        self.assertEqual(8, params.depth)
+        self.assertEqual(ModelParams(), ModelParams.from_argv([]))
+
+        params, unused = ModelParams.from_argv(["--activation", "tanh", "--other", "1"], return_unused=True)
+        self.assertEqual("tanh", params.activation)
+        self.assertEqual(["--other", "1"], unused)
+
+        params = TrainParams.from_argv(["start", "--learning-rate", "1e-3"])
+        self.assertEqual(TrainParams(learning_rate=1e-3, command="start"), params)
+
+    def test_typing_generics(self):
+        params = TypedParams.from_argv(["--max-steps", "3", "--layer-sizes", "[16, \"4\"]"])
+        self.assertEqual(TypedParams(max_steps=3, layer_sizes=[16, 4]), params)
+        self.assertEqual(TypedParams(), TypedParams.from_argv([]))
+        self.assertIsNone(TypedParams.from_argv(["--max-steps", "null"]).max_steps)
+
+        stderr = io.StringIO()
+        with self.assertRaises(SystemExit), contextlib.redirect_stderr(stderr):
+            TypedParams.from_argv(["--layer-sizes", "many"])
+        self.assertIn("invalid List[int] value", stderr.getvalue())
+
+    def test_combined_parser(self):
+        parser = pp.ParamsArgumentParser({"model": ModelParams, "train": TrainParams})
+        params = parser.parse_params(["--model.num-layers", "3", "stop", "--train.learning-rate", "0.5"])
+        self.assertEqual({"model": ModelParams(num_layers=3),
+                          "train": TrainParams(learning_rate=0.5, command="stop")}, params)
+
+        params, unused = parser.parse_known_params(["go", "--num-layers", "3"])
+        self.assertEqual(ModelParams(), params["model"])
+        self.assertEqual("go", params["train"].command)
+        self.assertEqual(["--num-layers", "3"], unused)
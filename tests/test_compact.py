@@ -0,0 +1,118 @@
+# coding=utf-8
+#
+# created by kpe on 18.10.2026 at 1:15 PM
+#
+
+from __future__ import division, absolute_import, print_function
+
+import copy
+import json
+import pickle
+import unittest
+
+import params as pp
+
+
+class CompactParams(pp.Params, compact=True):
+    param_a = 1
+    param_b = "b"
+
+    @property
+    def param_c(self):
+        return self.param_a + 1
+
+
+class CompactSubParams(CompactParams):
+    param_d = 2.0
+
+
+class ParamsCompactTest(unittest.TestCase):
+
+    def test_construction(self):
+        params = CompactParams(param_a=3)
+        self.assertIsInstance(params, CompactParams)
+        self.assertIsInstance(params, dict)
+        self.assertEqual("CompactParams", type(params).__name__)
+        self.assertEqual({'param_a': 3, 'param_b': "b", 'param_c': 4}, dict(params))
+        self.assertEqual({'param_a': 3, 'param_b': "b", 'param_c': 4}, params)
+        self.assertEqual(CompactParams(param_a=3), params)
+        self.assertNotEqual(CompactParams(), params)
+        self.assertEqual(1, CompactParams.param_a)
+        with self.assertRaises(AttributeError):
+            CompactParams(param_x=1)
+
+        params, other = CompactParams.from_dict({'param_b': "x", 'other': 1})
+        self.assertEqual("x", params.param_b)
+        self.assertEqual({'other': 1}, other)
+        self.assertEqual([2, 3], [p.param_c for p in CompactParams.from_records([{'param_a': 1}, {'param_a': 2}])])
+
+    def test_dict_api(self):
+        params = CompactParams()
+        params.param_a = 5
+        params['param_b'] = "x"
+        self.assertEqual(5, params['param_a'])
+        self.assertEqual(6, params.param_c)
+        self.assertEqual(['param_a', 'param_b', 'param_c'], list(params.keys()))
+        self.assertEqual([5, "x", 2], list(params.values()))
+        self.assertEqual(('param_b', "x"), list(params.items())[1])
+        self.assertEqual(3, len(params))
+        self.assertIn('param_a', params)
+        self.assertEqual(5, params.get('param_a'))
+        self.assertEqual(7, params.get('param_x', 7))
+        self.assertEqual(5, params.setdefault('param_a', 1))
+        self.assertEqual(dict(params), params.copy())
+        self.assertEqual(repr(dict(params)), repr(params))
+        params.update({'param_a': 6}, param_b="y")
+        self.assertEqual({'param_a': 6, 'param_b': "y", 'param_c': 2}, params)
+
+        with self.assertRaises(KeyError):
+            params['param_x']
+        with self.assertRaises(AttributeError):
+            params['param_x'] = 1
+        with self.assertRaises(AttributeError):
+            params.param_x = 1
+        self.assertEqual(['param_c', 'param_b', 'param_a'], list(reversed(params)))
+        merged = params | {'param_a': 7, 'other': 1}
+        self.assertEqual({'param_a': 7, 'param_b': "y", 'param_c': 2, 'other': 1}, merged)
+        self.assertIs(dict, type(merged))
+        self.assertEqual({'other': 1, 'param_a': 6, 'param_b': "y", 'param_c': 2}, {'other': 1} | params)
+        params |= {'param_a': 8}
+        self.assertIsInstance(params, CompactParams)
+        self.assertEqual(8, params.param_a)
+        self.assertEqual(9, params.param_c)
+        with self.assertRaises(AttributeError):
+            params |= {'param_x': 1}
+        with self.assertRaises(TypeError):
+            params | [('param_a', 1)]
+        with self.assertRaises(TypeError):
+            [('param_a', 1)] | params
+
+        for remove in [lambda: params.pop('param_a'), params.popitem, params.clear,
+                       lambda: params.__delitem__('param_a')]:
+            with self.assertRaises(TypeError):
+                remove()
+
+    def test_serialization(self):
+        params = CompactParams(param_a=2)
+        self.assertEqual(params, CompactParams.from_json_string(params.to_json_string()))
+        self.assertEqual(params, CompactParams.from_yaml_string(params.to_yaml_string()))
+        self.assertEqual(dict(params), json.loads(json.dumps(dict(params))))
+        self.assertEqual(params, pickle.loads(pickle.dumps(params)))
+        self.assertEqual(params, copy.deepcopy(params))
+        self.assertEqual("z", params.clone(param_b="z").param_b)
+
+    def test_subclassing(self):
+        params = CompactSubParams(param_d=3.0)
+        self.assertIsInstance(params, CompactParams)
+        self.assertEqual({'param_a': 1, 'param_b': "b", 'param_c': 2, 'param_d': 3.0}, params)
+
+        class NotCompactParams(CompactParams, compact=False):
+            pass
+
+        params = NotCompactParams()
+        self.assertIs(NotCompactParams, type(params))
+        self.assertEqual(CompactParams(), params)
+
+
+if __name__ == '__main__':
+    unittest.main()
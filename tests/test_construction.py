@@ -5,16 +5,30 @@
 
 from __future__ import division, absolute_import, print_function
 
+import pickle
 import unittest
 
 from params import Params
 
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
 
 class MyParams(Params):
     param_a = True
     param_b = 1
 
 
+class KwargsInitParams(MyParams):
+    _init_kwargs = []
+
+    def __init__(self, **kwargs):
+        KwargsInitParams._init_kwargs.append(kwargs)
+        super(KwargsInitParams, self).__init__(**kwargs)
+
+
 class ParamsConstructionTest(unittest.TestCase):
     def test_defaults(self):
         expected = {'param_a': True, 'param_b': 1}
@@ -77,6 +91,54 @@ class ParamsConstructionTest(unittest.TestCase):
         self.assertEqual({'param_a': 3, 'param_b': 4}, params)
         self.assertIsInstance(params, dict)
 
+    def test_custom_init(self):
+        params = KwargsInitParams.from_dict({'param_b': 4, 'param_c': 5}, return_unused=False)
+        self.assertEqual({'param_a': True, 'param_b': 4}, params)
+        self.assertEqual({'param_b': 4}, KwargsInitParams._init_kwargs[-1])
+
+        self.assertEqual(params, KwargsInitParams.from_json_string(params.to_json_string()))
+        self.assertEqual(params, KwargsInitParams.from_yaml_string(params.to_yaml_string()))
+        self.assertEqual({'param_a': False, 'param_b': 4}, params.clone(param_a=False))
+        self.assertIsInstance(params.clone(), KwargsInitParams)
+        self.assertEqual(params, pickle.loads(pickle.dumps(params)))
+
+    def test_from_records(self):
+        records = [{'param_a': False},
+                   {'param_b': 2, 'param_c': 3},
+                   {'param_b': 4, 'param_c': 5}]
+        params = MyParams.from_records(records)
+        self.assertNotIsInstance(params, list)
+        params = list(params)
+        self.assertEqual([{'param_a': False, 'param_b': 1},
+                          {'param_a': True, 'param_b': 2},
+                          {'param_a': True, 'param_b': 4}], params)
+        self.assertIsInstance(params[0], MyParams)
+
+        params, other = zip(*MyParams.from_records(records, return_unused=True))
+        self.assertEqual({'param_a': True, 'param_b': 4}, params[2])
+        self.assertEqual([{}, {'param_c': 3}, {'param_c': 5}], list(other))
+
+    def test_from_columns(self):
+        columns = {'param_b': [1, 2, 3], 'param_c': ("a", "b", "c")}
+        params = list(MyParams.from_columns(columns))
+        self.assertEqual([1, 2, 3], [p.param_b for p in params])
+        self.assertEqual([True] * 3, [p.param_a for p in params])
+
+        params, other = zip(*MyParams.from_columns(columns, return_unused=True))
+        self.assertEqual([{'param_c': "a"}, {'param_c': "b"}, {'param_c': "c"}], list(other))
+
+        self.assertEqual([], list(MyParams.from_columns({})))
+        with self.assertRaises(ValueError):
+            list(MyParams.from_columns({'param_a': [True], 'param_b': [1, 2]}))
+
+    @unittest.skipUnless(numpy, "NumPy not installed")
+    def test_from_numpy_columns(self):
+        columns = {'param_b': numpy.arange(3), 'param_a': numpy.array([True, False, True])}
+        params = list(MyParams.from_columns(columns))
+        self.assertEqual([1, 2], [p.param_b for p in params][1:])
+        self.assertIs(type(params[0].param_b), int)
+        self.assertIs(params[1].param_a, False)
+
     def test_construct_dict(self):
         params = MyParams(param_a=99)
         self.assertEqual(99, params.param_a)
@@ -103,6 +165,29 @@ class ParamsConstructionTest(unittest.TestCase):
         params.update({"param_a": 3})
         params.update([("param_a", 4)])
 
+    def test_unexpected_params(self):
+        with self.assertRaises(AttributeError) as ctx:
+            MyParams([("param_c", 1)], param_d=2, param_a=False)
+        self.assertIn("'param_c', 'param_d'", str(ctx.exception))
+        with self.assertRaises(AttributeError) as ctx:
+            MyParams(param_c=1)
+        self.assertIn("parameter 'param_c'", str(ctx.exception))
+
+    def test_attribute_access(self):
+        self.assertEqual(MyParams.param_a, True)
+        self.assertEqual(MyParams.param_b, 1)
+        params = MyParams(param_b=2)
+        self.assertEqual(params.param_b, 2)
+        params.param_b = 3
+        self.assertEqual(params['param_b'], 3)
+        self.assertEqual(MyParams.param_b, 1)
+        with self.assertRaises(AttributeError):
+            params.param_c
+
+        object.__setattr__(params, 'param_b', 4)    # through the parameter descriptor
+        self.assertEqual(4, params['param_b'])
+        self.assertEqual(4, MyParams.param_specs()['param_b'].value(params))
+
 
 if __name__ == '__main__':
     unittest.main()
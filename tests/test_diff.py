@@ -0,0 +1,80 @@
+# coding=utf-8
+#
+# created by kpe on 19.10.2026 at 4:45 PM
+#
+
+from __future__ import division, absolute_import, print_function
+
+import unittest
+
+import params as pp
+
+
+class TrialParams(pp.Params):
+    learning_rate = 0.1
+    num_layers    = 2
+    use_bias      = True
+    layer_sizes   = [8, 4]
+
+    @property
+    def depth(self):
+        return self.num_layers * 2
+
+
+class CompactTrialParams(TrialParams, compact=True):
+    pass
+
+
+class ParamsDiffTest(unittest.TestCase):
+
+    def check_diff_patch(self, params_class):
+        base = params_class()
+        trial = params_class(learning_rate=0.01, layer_sizes=[8, 4], use_bias=1)
+        delta = base.diff(trial)
+        self.assertEqual({'learning_rate': 0.01, 'use_bias': 1}, delta)     # type changes included
+        self.assertEqual({}, base.diff(params_class()))
+        self.assertEqual({'num_layers': 3}, base.diff({'num_layers': 3, 'depth': 6}))
+
+        patched = base.patch(delta)
+        self.assertIsInstance(patched, params_class)
+        self.assertEqual(trial, patched)
+        self.assertEqual(0.1, base.learning_rate)
+        self.assertEqual(8, base.patch({'num_layers': 4}).depth)
+
+        for receiver in [base.freeze(), base.freeze().clone(num_layers=4)]:     # frozen and copy-on-write
+            patched = receiver.patch({'use_bias': False})
+            self.assertIs(type(params_class()), type(patched))
+            self.assertEqual(params_class(num_layers=receiver.num_layers, use_bias=False), patched)
+            patched.num_layers = 5                                              # mutable
+            self.assertEqual(10, patched.depth)
+        self.assertEqual(2, base.num_layers)
+
+        with self.assertRaises(AttributeError):
+            base.diff({'unknown': 1})
+        with self.assertRaises(AttributeError):
+            base.patch({'unknown': 1})
+
+    def test_diff_patch(self):
+        self.check_diff_patch(TrialParams)
+
+    def test_compact_diff_patch(self):
+        self.check_diff_patch(CompactTrialParams)
+
+    def test_delta_serialization(self):
+        delta = {'use_bias': False, 'learning_rate': 0.01}
+        data = TrialParams.serialize_delta(delta)
+        self.assertEqual('{"use_bias":false,"learning_rate":0.01}', data)
+        self.assertEqual(delta, TrialParams.deserialize_delta(data))
+
+        data = TrialParams.serialize_delta(delta, positional=True)
+        self.assertEqual('[[0,2],[0.01,false]]', data)
+        self.assertEqual(delta, TrialParams.deserialize_delta(data, positional=True))
+
+        with self.assertRaises(AttributeError):
+            TrialParams.serialize_delta({'unknown': 1})
+        with self.assertRaises(AttributeError):
+            TrialParams.deserialize_delta('{"unknown": 1}')
+
+
+if __name__ == '__main__':
+    unittest.main()
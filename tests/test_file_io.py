@@ -0,0 +1,77 @@
+# coding=utf-8
+#
+# created by kpe on 18.10.2026 at 4:40 PM
+#
+
+from __future__ import division, absolute_import, print_function
+
+import io
+import os
+import tempfile
+import unittest
+
+import params as pp
+from params import file_io
+
+
+class SomeParams(pp.Params):
+    param_a = 1
+
+
+class MemoryFile(io.StringIO):
+    files = {}
+
+    def __init__(self, path, mode="r"):
+        super(MemoryFile, self).__init__(self.files.get(path, "") if "r" in mode else "")
+        self.path = path
+
+    def close(self):
+        self.files[self.path] = self.getvalue()
+        super(MemoryFile, self).close()
+
+
+class FileBackendTest(unittest.TestCase):
+
+    def test_local(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "params.json")
+            self.assertEqual(file_path, SomeParams(param_a=2).to_json_file(file_path))
+            self.assertEqual({'param_a': 2}, SomeParams.from_json_file("file://" + file_path))
+            with file_io.open_file(file_path) as fp:
+                self.assertIn("param_a", fp.read())
+
+    def test_registered_backend(self):
+        pp.register_file_backend("mem", MemoryFile)
+        try:
+            SomeParams(param_a=3).to_yaml_file("mem://params.yaml")
+            self.assertIn("mem://params.yaml", MemoryFile.files)
+            self.assertEqual({'param_a': 3}, SomeParams.from_yaml_file("mem://params.yaml"))
+        finally:
+            pp.register_file_backend("mem", "local")
+        with self.assertRaises(ValueError):
+            pp.register_file_backend("mem", "unknown")
+
+    def test_url_scheme(self):
+        self.assertEqual("gs", file_io._url_scheme("gs://bucket/params.json"))
+        self.assertEqual("", file_io._url_scheme("/tmp/params.json"))
+        self.assertEqual("", file_io._url_scheme("C:\\params.json"))
+
+    def test_unresolved_backend(self):
+        pp.register_file_backend("mem", "fsspec")
+        try:
+            open_fn = file_io._resolve("mem")
+            self.assertTrue(callable(open_fn))   # pragma: no cover
+        except ModuleNotFoundError:
+            pass
+        finally:
+            pp.register_file_backend("mem", "local")
+
+        try:
+            open_fn = file_io._resolve("unknown")
+            self.assertTrue(callable(open_fn))   # pragma: no cover
+        except ValueError:
+            pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+# coding=utf-8
+#
+# created by kpe on 18.10.2026 at 8:40 PM
+#
+
+from __future__ import division, absolute_import, print_function
+
+import copy
+import functools
+import json
+import pickle
+import unittest
+
+import params as pp
+
+
+class ModelParams(pp.Params):
+    num_layers  = 2
+    layer_sizes = [8, 4]
+    options     = {"bias": True}
+
+    @property
+    def depth(self):
+        return self.num_layers * 2
+
+
+class CompactModelParams(ModelParams, compact=True):
+    pass
+
+
+class FrozenParamsTest(unittest.TestCase):
+
+    def check_frozen(self, params_class):
+        frozen = params_class(num_layers=3).freeze()
+        self.assertIsInstance(frozen, params_class)
+        self.assertIsInstance(frozen, pp.FrozenParams)
+        self.assertEqual(params_class.__name__, type(frozen).__name__)
+        self.assertIs(frozen, frozen.freeze())
+        self.assertEqual(3, frozen.num_layers)
+        self.assertEqual(6, frozen.depth)
+        self.assertEqual({'num_layers': 3, 'layer_sizes': [8, 4], 'options': {"bias": True}, 'depth': 6}, frozen)
+
+        self.assertEqual(hash(frozen), hash(params_class(num_layers=3).freeze()))
+        self.assertEqual(frozen, params_class(num_layers=3).freeze())
+        self.assertNotEqual(frozen, params_class().freeze())
+        self.assertEqual(params_class(num_layers=3), frozen)
+        self.assertEqual(1, len({frozen, params_class(num_layers=3).freeze()}))
+
+        for modify in [lambda: frozen.__setitem__('num_layers', 1),
+                       lambda: setattr(frozen, 'num_layers', 1),
+                       lambda: frozen.update(num_layers=1),
+                       lambda: frozen.pop('num_layers'),
+                       lambda: frozen.__ior__({'num_layers': 1}),
+                       frozen.clear]:
+            with self.assertRaises(TypeError):
+                modify()
+        with self.assertRaises(TypeError):
+            frozen |= {'num_layers': 1}
+        self.assertEqual(3, frozen.num_layers)
+        self.assertEqual(hash(frozen), hash(params_class(num_layers=3).freeze()))
+        self.assertIs(type(frozen), type(type(frozen).__new__(type(frozen))))
+
+        tagged = params_class(options={"tags": {"a", "b"}}).freeze()
+        self.assertEqual(hash(tagged), hash(params_class(options={"tags": {"b", "a"}}).freeze()))
+
+        self.assertIs(frozen, copy.deepcopy(frozen))
+        self.assertIs(frozen, copy.copy(frozen))
+        unpickled = pickle.loads(pickle.dumps(frozen))
+        self.assertEqual(frozen, unpickled)
+        self.assertIsInstance(unpickled, pp.FrozenParams)
+
+        thawed = frozen.thaw()
+        self.assertNotIsInstance(thawed, pp.FrozenParams)
+        thawed.num_layers = 4
+        self.assertEqual(8, thawed.depth)
+
+    def test_frozen(self):
+        self.check_frozen(ModelParams)
+
+    def test_compact_frozen(self):
+        self.check_frozen(CompactModelParams)
+
+    def check_copy_on_write(self, params_class):
+        base = params_class(layer_sizes=[1]).freeze()
+        params = base.clone(num_layers=5)
+        self.assertIsInstance(params, params_class)
+        self.assertNotIsInstance(params, pp.FrozenParams)
+        self.assertEqual(5, params.num_layers)
+        self.assertEqual([1], params.layer_sizes)
+        self.assertEqual(10, params.depth)
+        self.assertEqual(10, params['depth'])
+        self.assertEqual(5, params.get('num_layers'))
+        self.assertIsNone(params.get('unknown'))
+        self.assertIn('options', params)
+        self.assertEqual({'num_layers': 5}, vars(params)['_cow_overrides_'])
+
+        params.num_layers = 6                     # materializes
+        self.assertNotIn('_cow_overrides_', vars(params))
+        expected = params_class(num_layers=5, layer_sizes=[1])
+        expected.num_layers = 6
+        self.assertEqual(expected, params)
+        self.assertEqual(12, params.depth)
+        self.assertEqual(2, base.num_layers)
+
+        self.assertEqual(params_class(num_layers=3, layer_sizes=[1]), base.clone(num_layers=3))
+        self.assertEqual({'num_layers': 3, 'layer_sizes': [1], 'options': {"bias": True}, 'depth': 6},
+                         dict(base.clone(num_layers=3)))
+        self.assertEqual(base, pickle.loads(pickle.dumps(base.clone())))
+        with self.assertRaises(AttributeError):
+            base.clone(unknown=1)
+
+        self.assertEqual(['depth', 'options', 'layer_sizes', 'num_layers'], list(reversed(base.clone(num_layers=3))))
+        merged = base.clone(num_layers=3) | {'options': {}}
+        self.assertEqual({'num_layers': 3, 'layer_sizes': [1], 'options': {}, 'depth': 6}, merged)
+        self.assertEqual({'num_layers': 3, 'layer_sizes': [1], 'options': {"bias": True}, 'depth': 6},
+                         {'num_layers': 1} | base.clone(num_layers=3))
+        params = base.clone(num_layers=3)
+        params |= {'layer_sizes': [2]}
+        self.assertIsInstance(params, params_class)
+        self.assertEqual([2], params.layer_sizes)
+        self.assertEqual(3, params.num_layers)
+
+        params = base.clone(num_layers=3)
+        self.assertEqual("{}", json.dumps(params))  # the dict storage is not populated before materialized
+        self.assertEqual(dict(params), json.loads(json.dumps(dict(params))))
+
+    def test_copy_on_write(self):
+        self.check_copy_on_write(ModelParams)
+
+    def test_compact_copy_on_write(self):
+        self.check_copy_on_write(CompactModelParams)
+
+    def test_cache_key(self):
+        calls = []
+
+        @functools.lru_cache()
+        def build(params):
+            calls.append(params)
+            return params.depth
+
+        self.assertEqual(4, build(ModelParams().freeze()))
+        self.assertEqual(4, build(ModelParams().freeze()))
+        self.assertEqual(6, build(ModelParams(num_layers=3).freeze()))
+        self.assertEqual(2, len(calls))
+
+
+if __name__ == '__main__':
+    unittest.main()
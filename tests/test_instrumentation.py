@@ -0,0 +1,131 @@
+# coding=utf-8
+#
+# created by kpe on 20.10.2026 at 10:15 AM
+#
+
+from __future__ import division, absolute_import, print_function
+
+import unittest
+
+import params as pp
+from params import instrumentation
+
+
+class InstrumentedParams(pp.Params, instrument=True):
+    param_a = 1
+    param_b = "b"
+    unused  = None
+
+    @property
+    def param_c(self):
+        return self.param_a + 1
+
+
+class CompactInstrumentedParams(InstrumentedParams, compact=True):
+    pass
+
+
+class NotInstrumentedSubParams(InstrumentedParams, instrument=False):
+    param_d = 2
+
+
+class PlainParams(pp.Params):
+    param_a = 1
+
+
+def _stats(params_class):
+    return {stats.name: stats for stats in instrumentation.report(params_class)}
+
+
+class InstrumentationTest(unittest.TestCase):
+
+    def tearDown(self):
+        instrumentation.disable()
+        instrumentation.reset()
+
+    def check_counts(self, params_class):
+        params = params_class(param_a=2)
+        self.assertEqual(2, params.param_a)
+        self.assertEqual(2, params["param_a"])
+        self.assertEqual(3, params.param_c)
+        params.param_b = "c"
+        params["param_b"] = "d"
+        self.assertEqual("d", params.param_b)
+
+        stats = _stats(params_class)
+        self.assertEqual(2 + 2, stats["param_a"].reads)              # (+ 2 by the param_c evaluations)
+        self.assertEqual(0, stats["param_a"].writes)
+        self.assertEqual(2, stats["param_b"].writes)
+        self.assertEqual(1, stats["param_b"].reads)
+        self.assertEqual(2, stats["param_c"].evaluations)            # (+ 1 on construction)
+        self.assertGreater(stats["param_c"].eval_time, 0)
+        self.assertEqual(["unused"], instrumentation.unread_params(params_class))
+
+    def test_instrumented(self):
+        self.check_counts(InstrumentedParams)
+
+    def test_instrumented_compact(self):
+        self.check_counts(CompactInstrumentedParams)
+        self.assertEqual(CompactInstrumentedParams(param_a=2), CompactInstrumentedParams(param_a=2).freeze())
+
+    def test_not_instrumented(self):
+        self.assertNotIn("__getitem__", PlainParams.__dict__)
+        PlainParams().param_a
+        self.assertEqual(0, sum(stats.reads for stats in instrumentation.report(PlainParams)))
+
+    def test_not_instrumented_subclass(self):
+        def totals():
+            return [sum(getattr(stats, field) for stats in instrumentation.report(InstrumentedParams))
+                    for field in ("reads", "writes", "evaluations")]
+
+        before = totals()
+        params = NotInstrumentedSubParams(param_a=2)
+        params.param_d = 3
+        params["param_a"] = 4
+        self.assertEqual((4, 3, 5), (params.param_a, params["param_d"], params.param_c))
+        self.assertEqual(NotInstrumentedSubParams(param_a=4, param_d=3), params.freeze().clone())
+        self.assertEqual(before, totals())
+        self.assertEqual(0, sum(stats.reads + stats.writes for stats in instrumentation.report(NotInstrumentedSubParams)))
+
+    def test_descriptors(self):
+        self.assertEqual(2, InstrumentedParams.param_c)
+        params = InstrumentedParams()
+        object.__setattr__(params, "param_c", 5)        # through the property descriptor
+        self.assertEqual(5, params["param_c"])
+
+        params = CompactInstrumentedParams()
+        del params.param_b                              # like not instrumented compact instances
+        with self.assertRaises(AttributeError):
+            params.param_b
+
+    def test_enable_disable(self):
+        instrumentation.enable()
+        self.assertTrue(instrumentation.is_enabled())
+
+        class LaterParams(pp.Params):
+            param_x = 1
+
+        PlainParams().param_a
+        LaterParams(param_x=2).param_x
+        self.assertEqual(1, _stats(PlainParams)["param_a"].reads)
+        self.assertEqual(1, _stats(LaterParams)["param_x"].reads)
+
+        instrumentation.disable()
+        self.assertNotIn("__getitem__", PlainParams.__dict__)
+        self.assertIn("__getitem__", InstrumentedParams.__dict__)
+        PlainParams().param_a
+        self.assertEqual(1, _stats(PlainParams)["param_a"].reads)
+
+    def test_report_and_hooks(self):
+        InstrumentedParams().param_b
+        published = []
+        instrumentation.register_metrics_hook(published.append)
+        try:
+            stats = instrumentation.publish()
+        finally:
+            instrumentation._metrics_hooks.remove(published.append)
+        self.assertEqual([stats], published)
+        self.assertIn(("InstrumentedParams", "param_b", 1),
+                      [(row.params_class.__name__, row.name, row.reads) for row in stats])
+        self.assertEqual(0, _stats(InstrumentedParams)["param_b"].reads)    # reset on publish
+        self.assertIn("param_b", instrumentation.format_report(InstrumentedParams))
@@ -0,0 +1,74 @@
+# coding=utf-8
+#
+# created by kpe on 20.10.2026 at 2:40 PM
+#
+
+from __future__ import division, absolute_import, print_function
+
+import gc
+import unittest
+
+import params as pp
+
+
+class LayerParams(pp.Params):
+    units      = 64
+    activation = "relu"
+    sizes      = [1, 2]
+
+    @property
+    def double_units(self):
+        return self.units * 2
+
+
+class CompactLayerParams(LayerParams, compact=True):
+    pass
+
+
+class ParamsInternTest(unittest.TestCase):
+
+    def check_intern(self, params_class):
+        params_class.intern_clear()
+        first = params_class.intern(params_class(units=32))
+        self.assertIsInstance(first, pp.FrozenParams)
+        self.assertIsInstance(first, params_class)
+        self.assertEqual(64, first.double_units)
+
+        self.assertIs(first, params_class.intern(params_class(units=32)))
+        self.assertIs(first, params_class.intern({"units": 32}))
+        self.assertIs(first, params_class.intern(first))
+        self.assertIs(first, params_class.intern(params_class(units=32).freeze()))
+        float_units = params_class.intern(params_class(units=32.0))
+        self.assertIsNot(first, float_units)                                        # type sensitive
+        other = params_class.intern(params_class(sizes=[1, 2, 3]))
+        self.assertEqual([1, 2, 3], other.sizes)
+
+        info = params_class.intern_info()
+        self.assertEqual((4, 3, 3), info[:3])
+        self.assertGreater(info.bytes_saved, 0)
+
+        del first, other, float_units
+        gc.collect()
+        self.assertEqual(0, params_class.intern_info().currsize)
+
+        params_class.intern_clear()
+        self.assertEqual((0, 0, 0, 0), params_class.intern_info())
+
+    def test_intern(self):
+        self.check_intern(LayerParams)
+
+    def test_intern_compact(self):
+        self.check_intern(CompactLayerParams)
+
+    def test_intern_with_params(self):
+        class Layer(pp.WithParams):
+            class Params(pp.WithParams.Params):
+                units = 8
+
+            def _construct(self):
+                pass
+
+        params = Layer.Params.intern({"units": 16})
+        layers = [Layer.from_params(Layer.Params.intern(Layer.Params(units=16))) for _ in range(3)]
+        for layer in layers:
+            self.assertIs(params, layer.params)
@@ -0,0 +1,102 @@
+# coding=utf-8
+#
+# created by kpe on 19.10.2026 at 9:40 PM
+#
+
+from __future__ import division, absolute_import, print_function
+
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from typing import List, Optional
+
+import params as pp
+from params.loader import parse_env_value
+
+
+class AppParams(pp.Params):
+    learning_rate = pp.Param(0.1, doc="learning rate")
+    num_layers    = pp.Param(2, doc="number of layers")
+    use_bias      = True
+    name          = "model"
+    layer_sizes   = pp.Param([8], dtype=List[int])
+    dropout       = pp.Param(None, dtype=Optional[float])
+
+    @property
+    def depth(self):
+        return self.num_layers * 2
+
+
+class JobParams(pp.Params):
+    max_steps = pp.Param(None, dtype=Optional[int], doc="maximal number of steps", required=True)
+    command   = pp.Param(None, dtype=str, doc="command to execute", positional=True)
+
+
+class ParamsLoaderTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.base_path = os.path.join(self.tmp_dir.name, "base.yaml")
+        self.prod_path = os.path.join(self.tmp_dir.name, "prod.json")
+        with open(self.base_path, "w") as fp:
+            fp.write("num_layers: 4\nname: base\nlearning_rate: 0.2\n")
+        with open(self.prod_path, "w") as fp:
+            fp.write('{"name": "prod", "unknown": 1}')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_parse_env_value(self):
+        self.assertEqual(0.5, parse_env_value(float, "0.5"))
+        self.assertEqual(False, parse_env_value(bool, "false"))
+        self.assertEqual([1, 2], parse_env_value(List[int], "[1, 2]"))
+        self.assertEqual(None, parse_env_value(Optional[float], "null"))
+        self.assertEqual("[1]", parse_env_value(str, "[1]"))
+        with self.assertRaises(TypeError):
+            parse_env_value(int, "many")
+
+    def test_load(self):
+        environ = {"APP_LEARNING_RATE": "0.01", "APP_LAYER_SIZES": "[16, 8]", "OTHER_NAME": "other"}
+        params, sources = AppParams.load([self.base_path, None, self.prod_path, {"use_bias": False}],
+                                         env_prefix="APP_", environ=environ,
+                                         argv=["--num-layers", "6"], return_sources=True)
+        self.assertEqual(AppParams(learning_rate=0.01, num_layers=6, use_bias=False, name="prod",
+                                   layer_sizes=[16, 8]), params)
+        self.assertEqual(12, params.depth)
+        self.assertEqual({"learning_rate": "env:APP_LEARNING_RATE",
+                          "num_layers":    "argv",
+                          "use_bias":      "layer[3]",
+                          "name":          self.prod_path,
+                          "layer_sizes":   "env:APP_LAYER_SIZES",
+                          "dropout":       "default"}, sources)
+
+        self.assertEqual(AppParams(), AppParams.load())
+        self.assertEqual(AppParams(num_layers=4, learning_rate=0.2, name="base"),
+                         AppParams.load([self.base_path], argv=[]))
+
+    def test_load_required(self):
+        self.assertEqual(JobParams(max_steps=5, command="run"),
+                         JobParams.load([{"max_steps": 5, "command": "run"}], argv=[]))
+        self.assertEqual(JobParams(max_steps=3, command="stop"),
+                         JobParams.load([{"command": "run"}], argv=["stop", "--max-steps", "3"]))
+
+        stderr = io.StringIO()
+        with self.assertRaises(SystemExit), contextlib.redirect_stderr(stderr):
+            JobParams.load([{"max_steps": 5}], argv=[])
+        self.assertIn("required: command", stderr.getvalue())
+        self.assertEqual(JobParams(), JobParams.load())      # not parsing any arguments
+
+    def test_load_empty_yaml(self):
+        empty_path = os.path.join(self.tmp_dir.name, "empty.yaml")
+        with open(empty_path, "w") as fp:
+            fp.write("# nothing set\n")
+        self.assertEqual(AppParams(), AppParams.load([empty_path]))
+
+    def test_load_errors(self):
+        with self.assertRaises(AttributeError) as ctx:
+            AppParams.load([self.prod_path], check_params=True)
+        self.assertIn(self.prod_path, str(ctx.exception))
+        with self.assertRaises(TypeError):
+            AppParams.load(env_prefix="APP_", environ={"APP_NUM_LAYERS": "many"})
@@ -0,0 +1,51 @@
+# coding=utf-8
+#
+# created by kpe on 19.10.2026 at 2:10 PM
+#
+
+from __future__ import division, absolute_import, print_function
+
+import os
+import unittest
+
+import params as pp
+from params import parallel
+
+
+class TrialParams(pp.Params):
+    learning_rate = 0.1
+    num_layers    = 2
+
+    @property
+    def depth(self):
+        return self.num_layers * 2
+
+
+def evaluate(params):
+    assert isinstance(params, TrialParams)
+    return params.depth + params.learning_rate, os.getpid()
+
+
+class MapParallelTest(unittest.TestCase):
+
+    def test_map_parallel(self):
+        configs = [TrialParams(num_layers=idx, learning_rate=idx / 10) for idx in range(20)]
+        configs[3] = {"num_layers": 3, "learning_rate": 0.3}
+        results = list(TrialParams.map_parallel(evaluate, configs, workers=2, chunksize=3))
+        self.assertEqual(list(range(20)), sorted(index for index, _ in results))
+        for index, (value, pid) in results:
+            self.assertAlmostEqual(index * 2 + index / 10, value)
+            self.assertNotEqual(os.getpid(), pid)
+
+        self.assertEqual([], list(TrialParams.map_parallel(evaluate, [], workers=1)))
+
+    def test_worker(self):
+        parallel._init_worker(TrialParams, evaluate)     # as run in the pool processes
+        chunks = list(parallel._chunks(TrialParams, [TrialParams(num_layers=3), {"learning_rate": 0.5}], 1))
+        self.assertEqual([[(0, (0.1, 3))], [(1, (0.5, 2))]], chunks)
+        results = [result for chunk in chunks for result in parallel._run_chunk(chunk)]
+        self.assertEqual([(0, (6.1, os.getpid())), (1, (4.5, os.getpid()))], results)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+# coding=utf-8
+#
+# created by kpe on 18.10.2026 at 3:20 PM
+#
+
+from __future__ import division, absolute_import, print_function
+
+import pickle
+import unittest
+
+import params as pp
+
+
+class CachedParams(pp.Params, cache_properties=True):
+    param_a = 1
+    param_b = 2
+    param_c = 3
+
+    _evaluated = []
+
+    @property
+    def param_g(self):
+        self._evaluated.append("param_g")
+        return self.param_a * 10
+
+    @property
+    def param_h(self):
+        self._evaluated.append("param_h")
+        return self.param_g + self.param_b
+
+
+class CompactCachedParams(CachedParams, compact=True):
+    pass
+
+
+class PropertyCacheTest(unittest.TestCase):
+
+    def check_cache(self, params):
+        evaluated = CachedParams._evaluated
+        del evaluated[:]
+        self.assertEqual(12, params.param_h)
+        self.assertEqual(10, params.param_g)
+        self.assertEqual([], evaluated)
+
+        params.param_c = 4                   # not a dependency
+        self.assertEqual(12, params.param_h)
+        self.assertEqual([], evaluated)
+
+        params.param_b = 3                   # invalidates only param_h
+        self.assertEqual(13, params.param_h)
+        self.assertEqual(["param_h"], evaluated)
+
+        params["param_a"] = 2                # invalidates both
+        self.assertEqual(23, params.param_h)
+        self.assertEqual(["param_h", "param_h", "param_g"], evaluated)
+
+        params.update(param_a=3)
+        self.assertEqual(30, params.param_g)
+        self.assertEqual(33, params.param_h)
+        info = params.property_cache_info()
+        self.assertEqual(2, info.currsize)
+        self.assertEqual(7, info.misses)
+
+    def test_cache(self):
+        self.check_cache(CachedParams())
+        info = CachedParams().property_cache_info()
+        self.assertEqual((1, 2, 2), tuple(info))     # param_g read by param_h when evaluated on construction
+
+    def test_class_attributes(self):
+        self.assertEqual(1, CachedParams.param_a)
+        self.assertEqual(12, CachedParams.param_h)
+
+    def test_compact_cache(self):
+        self.check_cache(CompactCachedParams())
+
+    def test_no_cache(self):
+        class NotCachedParams(CachedParams, cache_properties=False):
+            pass
+        params = NotCachedParams()
+        del CachedParams._evaluated[:]
+        self.assertEqual(12, params.param_h)
+        self.assertEqual(["param_h", "param_g"], CachedParams._evaluated)
+        self.assertEqual((0, 0, 0), tuple(params.property_cache_info()))
+
+    def test_pickle(self):
+        params = CachedParams(param_b=5)
+        self.assertIn("_property_cache_", vars(params))
+        params = pickle.loads(pickle.dumps(params))
+        self.assertEqual((1, 2, 2), tuple(params.property_cache_info()))   # a fresh cache
+        self.assertEqual(15, params.param_h)
+
+
+if __name__ == '__main__':
+    unittest.main()
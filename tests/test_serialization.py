@@ -5,9 +5,13 @@
 
 from __future__ import division, absolute_import, print_function
 
+import copy
+import os
+import pickle
 import unittest
 import tempfile
 
+import params as pp
 from params import Params
 
 
@@ -15,6 +19,33 @@ class SomeParams(Params):
     param_a = 1
 
 
+class CodecParams(Params):
+    param_a = 1
+    param_b = "b"
+    param_c = [1.5, None]
+
+    @property
+    def param_d(self):
+        return self.param_a * 2
+
+
+class ArrayLike(list):
+    def __eq__(self, other):
+        raise ValueError("ambiguous comparison")   # like NumPy arrays
+
+
+class ArrayParams(Params):
+    values = ArrayLike([1, 2])
+
+
+def _module_available(name):
+    try:
+        __import__(name)
+        return True
+    except ImportError:  # pragma: no cover
+        return False     # pragma: no cover
+
+
 class ParamsSerializationTest(unittest.TestCase):
     def test_serialization(self):
         params, rest = SomeParams.from_dict({'param_a': 2})
@@ -85,5 +116,103 @@ class ParamsSerializationTest(unittest.TestCase):
         except Exception:
             pass
 
+    def test_codecs(self):
+        params = CodecParams(param_a=3, param_b="x")
+        codecs = ["json", "json-compact"]
+        codecs += [name for name in ["orjson", "msgpack"] if _module_available(name)]
+        for codec in codecs:
+            for positional in [False, True]:
+                data = params.serialize(codec, positional=positional)
+                dparams = CodecParams.deserialize(data, codec, positional=positional)
+                self.assertEqual(params, dparams, codec)
+                self.assertIsInstance(dparams, CodecParams)
+                self.assertEqual(6, dparams.param_d)
+
+        self.assertEqual('{"param_a":3,"param_b":"x","param_c":[1.5,null],"param_d":6}', params.serialize())
+        self.assertEqual('[3,"x",[1.5,null]]', params.serialize(positional=True))
+        self.assertEqual(params.to_json_string(), params.serialize("json"))
+
+        with self.assertRaises(ValueError):
+            CodecParams.deserialize('[3,"x"]', positional=True)
+        with self.assertRaises(TypeError):
+            CodecParams.deserialize('{"param_a":1,"param_b":2,"param_c":3}', positional=True)
+        with self.assertRaises(ValueError):
+            params.serialize("unknown")
+        with self.assertRaises(AttributeError):
+            CodecParams.deserialize('{"param_x":1}', check_params=True)
+        self.assertEqual(CodecParams(), CodecParams.deserialize('{"param_x":1}'))
+
+    def test_jsonl(self):
+        instances = [CodecParams(param_a=idx) for idx in range(5)]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "params.jsonl")
+            self.assertEqual(5, CodecParams.write_jsonl(file_path, iter(instances), buffer_size=2))
+            params = CodecParams.iter_jsonl(file_path)
+            self.assertNotIsInstance(params, list)
+            self.assertEqual(instances, list(params))
+
+            self.assertEqual(1, CodecParams.write_jsonl(file_path, [{'param_x': 1}], append=True))
+            with open(file_path, "a") as fp:
+                fp.write("\n[1, 2]\n{invalid json\n")
+            self.assertEqual(instances + [CodecParams()], list(CodecParams.iter_jsonl(file_path, on_error="skip")))
+
+            errors = []
+            params = list(CodecParams.iter_jsonl(file_path, check_params=True, errors=errors))
+            self.assertEqual(instances, params)
+            self.assertEqual([5, 6, 7], [idx for idx, err in errors])
+            self.assertIsInstance(errors[0][1], AttributeError)
+            self.assertIsInstance(errors[1][1], TypeError)
+
+            with self.assertRaises(TypeError):
+                list(CodecParams.iter_jsonl(file_path))
+            with self.assertRaises(ValueError):
+                list(CodecParams.iter_jsonl(file_path, on_error="ignore"))
+
+            with self.assertRaises(ValueError):
+                CodecParams.write_jsonl(file_path, instances, codec="json")
+
+    def test_multi_document_yaml(self):
+        instances = [CodecParams(param_b=str(idx)) for idx in range(3)]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "params.yaml")
+            self.assertEqual(3, CodecParams.write_yaml(file_path, instances))
+            self.assertEqual(instances, list(CodecParams.iter_yaml(file_path)))
+
+            with open(file_path, "a") as fp:
+                fp.write("---\n---\nparam_a: [unbalanced\n...\n--- {param_a: 5}\n")
+            errors = []
+            params = list(CodecParams.iter_yaml(file_path, errors=errors))
+            self.assertEqual(instances + [CodecParams(param_a=5)], params)
+            self.assertEqual([3], [idx for idx, err in errors])
+
+            with open(file_path, "w") as fp:
+                fp.write("param_a: 2\n")
+            self.assertEqual([CodecParams(param_a=2)], list(CodecParams.iter_yaml(file_path)))
+
+    def test_pickle(self):
+        params = CodecParams(param_a=3, param_c=[1.5, None])
+        reduced = params.__reduce__()
+        self.assertEqual((CodecParams, 0b01, (3,)), reduced[1])
+        self.assertEqual(params, pickle.loads(pickle.dumps(params)))
+        self.assertIsInstance(pickle.loads(pickle.dumps(params)), CodecParams)
+        self.assertEqual(6, pickle.loads(pickle.dumps(params)).param_d)
+
+        params = CodecParams(param_a=True, param_b="x", param_c=[1])
+        self.assertEqual(0b111, params.__reduce__()[1][1])
+        unpickled = pickle.loads(pickle.dumps(params))
+        self.assertEqual(params, unpickled)
+        self.assertIs(True, unpickled.param_a)
+        self.assertEqual(CodecParams(), copy.deepcopy(CodecParams()))
+
+        params = ArrayParams(values=ArrayLike([1, 2]))         # not comparable to the default
+        self.assertEqual(0b1, params.__reduce__()[1][1])
+        self.assertEqual([1, 2], list(pickle.loads(pickle.dumps(params)).values))
+
+    def test_register_codec(self):
+        pp.register_codec("repr", repr, eval)
+        params = CodecParams(param_a=7)
+        self.assertEqual(params, CodecParams.deserialize(params.serialize("repr"), "repr"))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -94,6 +94,32 @@ class ParamsSubclassingTest(unittest.TestCase):
         params = AnotherSubParams(param_d='Z')
         self.assertEqual(params.param_g, "ASg_ASh_Z")
 
+    def test_lazy_property_defaults(self):
+        evaluations = []
+
+        class LazyParams(pp.Params):
+            param_a = 1
+
+            @property
+            def param_b(self):
+                evaluations.append(self)
+                return self.param_a + 1
+
+        class LazySubParams(LazyParams):
+            pass
+
+        class LazySubSubParams(LazySubParams):
+            param_c = 3
+
+        self.assertEqual([], evaluations)                   # not evaluated on class definition
+        self.assertEqual(2, LazySubParams.param_b)          # evaluated with the declaring class
+        self.assertEqual([LazyParams], evaluations)
+        self.assertEqual(2, LazySubSubParams().param_b)
+
+        self.assertIs(LazyParams.param_specs(), LazySubParams.param_specs())
+        self.assertEqual(["param_a", "param_b", "param_c"], list(LazySubSubParams.param_specs()))
+        self.assertEqual(("param_a", "param_c"), LazySubSubParams.value_names())
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,92 @@
+# coding=utf-8
+#
+# created by kpe on 19.10.2026 at 11:05 AM
+#
+
+from __future__ import division, absolute_import, print_function
+
+import itertools
+import unittest
+
+import params as pp
+from params.sweep import Uniform, LogUniform, IntUniform, Choice
+
+
+class TrialParams(pp.Params):
+    learning_rate = 0.1
+    num_layers    = 2
+    optimizer     = "adam"
+    dropout       = 0.0
+
+    @property
+    def depth(self):
+        return self.num_layers * 2
+
+
+class ParamsSweepTest(unittest.TestCase):
+
+    def test_grid(self):
+        grid = pp.ParamsGrid(TrialParams, {"learning_rate": [0.1, 0.01], "num_layers": range(1, 4)},
+                             base=TrialParams(optimizer="sgd"))
+        self.assertEqual(6, len(grid))
+        points = list(grid)
+        expected = [TrialParams(learning_rate=lr, num_layers=nl, optimizer="sgd")
+                    for lr, nl in itertools.product([0.1, 0.01], [1, 2, 3])]
+        self.assertEqual(expected, points)
+        self.assertEqual(expected, [grid[idx] for idx in range(len(grid))])
+        self.assertEqual(expected[-1], grid[-1])
+        self.assertEqual(6, grid[-1].depth)
+        with self.assertRaises(IndexError):
+            grid[6]
+
+        shards = [list(grid.shard(idx, 4)) for idx in range(4)]
+        self.assertEqual([2, 2, 1, 1], list(map(len, shards)))
+        self.assertEqual(expected, [shards[idx % 4][idx // 4] for idx in range(6)])
+        with self.assertRaises(ValueError):
+            grid.shard(4, 4)
+
+    def test_huge_grid(self):
+        grid = pp.ParamsGrid(TrialParams, {"learning_rate": range(10 ** 5), "num_layers": range(10 ** 5)})
+        self.assertEqual(10 ** 10, len(grid))
+        self.assertEqual(TrialParams(learning_rate=12345, num_layers=67890), grid[12345 * 10 ** 5 + 67890])
+        self.assertEqual(TrialParams(learning_rate=0, num_layers=3), next(iter(grid.shard(3, 1000))))
+
+    def test_invalid_names(self):
+        with self.assertRaises(AttributeError):
+            pp.ParamsGrid(TrialParams, {"unknown": [1]})
+        with self.assertRaises(ValueError):
+            pp.ParamsSampler(TrialParams, {"depth": [1]})
+        with self.assertRaises(ValueError):
+            Choice([])
+
+    def test_sampler(self):
+        sampler = pp.ParamsSampler(TrialParams, {"learning_rate": LogUniform(1e-4, 1e-1),
+                                                 "num_layers": IntUniform(2, 4),
+                                                 "dropout": Uniform(0.0, 0.5),
+                                                 "optimizer": ["adam", "sgd"]}, seed=7, base={"dropout": 0.1})
+        samples = list(sampler.sample(100))
+        self.assertEqual(samples, list(pp.ParamsSampler(TrialParams, {"learning_rate": LogUniform(1e-4, 1e-1),
+                                                                      "num_layers": IntUniform(2, 4),
+                                                                      "dropout": Uniform(0.0, 0.5),
+                                                                      "optimizer": ["adam", "sgd"]},
+                                                        seed=7).sample(100)))
+        self.assertTrue(all(1e-4 <= params.learning_rate < 1e-1 for params in samples))
+        self.assertEqual({2, 3, 4}, {params.num_layers for params in samples})
+        self.assertEqual({"adam", "sgd"}, {params.optimizer for params in samples})
+        self.assertTrue(all(0.0 <= params.dropout < 0.5 for params in samples))
+
+        shards = [list(sampler.sample(100, idx, 3)) for idx in range(3)]
+        self.assertEqual(samples, [shards[idx % 3][idx // 3] for idx in range(100)])
+
+    def test_latin_hypercube(self):
+        sampler = pp.ParamsSampler(TrialParams, {"dropout": Uniform(0.0, 1.0), "num_layers": IntUniform(0, 9)})
+        samples = list(sampler.latin_hypercube(10))
+        self.assertEqual(list(range(10)), sorted(int(params.dropout * 10) for params in samples))
+        self.assertEqual(list(range(10)), sorted(params.num_layers for params in samples))
+
+        shards = [list(sampler.latin_hypercube(10, idx, 2)) for idx in range(2)]
+        self.assertEqual(samples, [shards[idx % 2][idx // 2] for idx in range(10)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+# coding=utf-8
+#
+# created by kpe on 18.10.2026 at 10:48 AM
+#
+
+from __future__ import division, absolute_import, print_function
+
+import unittest
+
+import params as pp
+
+
+class TrialParams(pp.Params):
+    learning_rate = 0.1
+    num_layers    = 2
+    use_bias      = True
+    optimizer     = "adam"
+    max_steps     = pp.Param(None, dtype=int)
+
+    @property
+    def depth(self):
+        return self.num_layers * 2
+
+
+class ParamsTableTest(unittest.TestCase):
+
+    def setUp(self):
+        self.table = pp.ParamsTable(TrialParams, [
+            TrialParams(learning_rate=0.01, num_layers=3),
+            TrialParams(learning_rate=0.1, use_bias=False, optimizer="sgd"),
+            {"learning_rate": 0.001, "num_layers": 1, "max_steps": 10},
+        ])
+
+    def test_rows(self):
+        self.assertEqual(3, len(self.table))
+        params = self.table[0]
+        self.assertIsInstance(params, TrialParams)
+        self.assertEqual(TrialParams(learning_rate=0.01, num_layers=3), params)
+        self.assertEqual(6, params.depth)
+        self.assertIs(self.table[1].use_bias, False)
+        self.assertEqual(10, self.table[-1].max_steps)
+        self.assertEqual([3, 2, 1], [params.num_layers for params in self.table])
+        with self.assertRaises(IndexError):
+            self.table.row(3)
+        with self.assertRaises(AttributeError):
+            self.table.append({"unknown": 1})
+
+    def test_columns(self):
+        self.assertEqual([0.01, 0.1, 0.001], list(self.table.column("learning_rate")))
+        self.assertEqual([None, None, 10], self.table.column("max_steps"))
+        self.assertEqual([6, 4, 2], list(self.table.column("depth")))
+        self.assertEqual(set(TrialParams.param_specs()), set(self.table.columns()))
+        with self.assertRaises(KeyError):
+            self.table.column("unknown")
+
+    def test_filter_sort_group(self):
+        small = self.table.filter([lr < 0.05 for lr in self.table.column("learning_rate")])
+        self.assertEqual([3, 1], [params.num_layers for params in small])
+        self.assertEqual(1, len(self.table.filter(lambda params: params.optimizer == "sgd")))
+        with self.assertRaises(ValueError):
+            self.table.filter([True])
+
+        ordered = self.table.sort("learning_rate")
+        self.assertEqual([0.001, 0.01, 0.1], [params.learning_rate for params in ordered])
+        ordered = self.table.sort(["use_bias", "num_layers"], reverse=True)
+        self.assertEqual([3, 1, 2], [params.num_layers for params in ordered])
+        self.assertEqual([2, 1], [params.num_layers for params in self.table[1:]])
+
+        groups = self.table.group_by("use_bias")
+        self.assertEqual({True: 2, False: 1}, {key: len(group) for key, group in groups.items()})
+        groups = self.table.group_by("optimizer")
+        self.assertEqual({"adam": 2, "sgd": 1}, {key: len(group) for key, group in groups.items()})
+        self.assertEqual(0, len(self.table.take([])))
+
+    def test_exact_types(self):
+        rows = [TrialParams(learning_rate=1), TrialParams(num_layers=True), TrialParams(num_layers=2 ** 70)]
+        table = pp.ParamsTable(TrialParams, rows)
+        self.assertEqual(rows, list(table))
+        self.assertIs(int, type(table[0].learning_rate))
+        self.assertIs(True, table[1].num_layers)
+        self.assertEqual(2 ** 70, table[2].num_layers)
+        self.assertEqual({}, table[0].diff(rows[0]))
+        self.assertEqual([2 ** 70], list(pp.ParamsTable(TrialParams, rows[2:]).column("num_layers")))  # not fitting
+
+    def test_from_columns(self):
+        params = list(TrialParams.from_columns(self.table.columns()))
+        self.assertEqual(list(self.table), params)
+
+
+if __name__ == '__main__':
+    unittest.main()
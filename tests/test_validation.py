@@ -0,0 +1,178 @@
+# coding=utf-8
+#
+# created by kpe on 19.10.2026 at 7:05 PM
+#
+
+from __future__ import division, absolute_import, print_function
+
+import enum
+import pickle
+import unittest
+from typing import Dict, List, Optional, Tuple, TypeVar, Union
+
+import params as pp
+from params.validation import compile_validator
+
+
+class Activation(enum.Enum):
+    RELU = "relu"
+    TANH = "tanh"
+
+
+class StrictParams(pp.Params, strict=True):
+    learning_rate = 0.1
+    num_layers    = 2
+    use_bias      = True
+    name          = "model"
+    activation    = pp.Param(Activation.RELU)
+    layer_sizes   = pp.Param([8, 4], dtype=List[int])
+    dropout       = pp.Param(None, dtype=Optional[float])
+    weights       = pp.Param({}, dtype=Dict[str, float])
+    anything      = None
+
+    @property
+    def depth(self):
+        return self.num_layers * 2
+
+
+class CompactStrictParams(StrictParams, compact=True):
+    pass
+
+
+class LooseParams(pp.Params):
+    learning_rate = 0.1
+    num_layers    = 2
+
+
+class ValidatorTest(unittest.TestCase):
+
+    def test_scalars(self):
+        self.assertEqual(1.0, compile_validator(float)(1))
+        self.assertIsInstance(compile_validator(float)(1), float)
+        self.assertEqual(0.5, compile_validator(float)("0.5"))
+        self.assertEqual(3, compile_validator(int)("3"))
+        self.assertEqual(False, compile_validator(bool)("no"))
+        for dtype, value in [(int, True), (int, 1.5), (float, "abc"), (str, 1), (bool, 1)]:
+            with self.assertRaises(TypeError):
+                compile_validator(dtype)(value)
+
+    def test_generics(self):
+        self.assertIsNone(compile_validator(None))
+        self.assertIsNone(compile_validator(Optional[object]))
+        self.assertEqual([1, 2], compile_validator(List[int])(("1", 2)))
+        self.assertEqual({"a": 1.0}, compile_validator(Dict[str, float])({"a": 1}))
+        self.assertEqual(2, compile_validator(Union[int, str])(2))
+        self.assertEqual("a", compile_validator(Union[int, str])("a"))
+        self.assertEqual("5", compile_validator(Union[int, str])("5"))
+        self.assertIs(int, type(compile_validator(Union[float, int])(3)))
+        self.assertEqual(3.5, compile_validator(Union[float, int])("3.5"))
+        self.assertEqual(Activation.RELU, compile_validator(Union[Activation, int])("relu"))
+        self.assertEqual([1], compile_validator(Union[List[int], str])(["1"]))
+        with self.assertRaises(TypeError):
+            compile_validator(Union[int, str])(True)
+        self.assertEqual(Activation.TANH, compile_validator(Activation)("tanh"))
+        self.assertEqual(Activation.TANH, compile_validator(Activation)("TANH"))
+        with self.assertRaises(TypeError):
+            compile_validator(List[int])(1)
+        with self.assertRaises(TypeError):
+            compile_validator(Activation)("sigmoid")
+
+    def test_containers(self):
+        self.assertEqual(True, compile_validator(bool)("Yes"))
+        self.assertEqual([1, "a"], compile_validator(List)((1, "a")))
+        self.assertEqual({1: "a"}, compile_validator(Dict)({1: "a"}))
+        self.assertEqual((1, "a"), compile_validator(Tuple[int, str])((1, "a")))      # only type checked
+        self.assertEqual((1, 2), compile_validator(Tuple[int, ...])(["1", 2]))
+        self.assertEqual(b"x", compile_validator(bytes)(b"x"))
+        self.assertIsNone(compile_validator(TypeVar("T")))
+        for dtype, value in [(Dict[str, int], [1]), (Tuple[int, str], [1, "a"]), (bytes, "x")]:
+            with self.assertRaises(TypeError) as ctx:
+                compile_validator(dtype)(value)
+            self.assertIn("but got", str(ctx.exception))
+
+
+class StrictParamsTest(unittest.TestCase):
+
+    def check_strict(self, params_class):
+        params = params_class(learning_rate="0.01", num_layers="3", use_bias="false",
+                              activation="tanh", layer_sizes=(16,), dropout=0, weights={"a": 1})
+        self.assertEqual(params_class(learning_rate=0.01, num_layers=3, use_bias=False,
+                                      activation=Activation.TANH, layer_sizes=[16], dropout=0.0,
+                                      weights={"a": 1.0}), params)
+        self.assertIsInstance(params.learning_rate, float)
+        self.assertIsInstance(params.dropout, float)
+        self.assertEqual(6, params.depth)
+
+        params.num_layers = "4"
+        self.assertEqual(4, params["num_layers"])
+        params["dropout"] = None
+        params.anything = ["any", 1]
+        with self.assertRaises(TypeError) as ctx:
+            params.num_layers = 1.5
+        self.assertIn("'num_layers'", str(ctx.exception))
+        self.assertEqual(4, params.num_layers)
+
+        with self.assertRaises(TypeError) as ctx:
+            params_class(learning_rate="fast", layer_sizes=["a"])
+        self.assertIn("'learning_rate'", str(ctx.exception))
+        self.assertIn("'layer_sizes'", str(ctx.exception))
+
+        with self.assertRaises(TypeError):
+            params_class.from_dict({"name": 1})
+        with self.assertRaises(TypeError):
+            params.clone(name=1)
+
+        frozen = params_class().freeze()
+        with self.assertRaises(TypeError):
+            frozen.clone(learning_rate="abc")
+        clone = frozen.clone(learning_rate="0.5")
+        self.assertIsInstance(clone.learning_rate, float)
+        self.assertEqual(params_class(learning_rate=0.5), clone)
+        self.assertEqual(params.patch({}), pickle.loads(pickle.dumps(params)))
+
+    def test_strict(self):
+        self.check_strict(StrictParams)
+
+    def test_strict_compact(self):
+        self.check_strict(CompactStrictParams)
+
+    def test_invalid_default(self):
+        with self.assertRaises(TypeError):
+            class InvalidParams(pp.Params, strict=True):
+                layer_sizes = pp.Param(["a"], dtype=List[int])
+
+    def test_coerced_defaults(self):
+        class CoercedParams(StrictParams):
+            dropout = pp.Param(1, dtype=Optional[float])
+            layer_sizes = pp.Param(["16"], dtype=List[int])
+
+        class CoercedSubParams(CoercedParams):
+            pass
+
+        for params_class in [CoercedParams, CoercedSubParams]:
+            self.assertIsInstance(params_class.dropout, float)
+            self.assertIsInstance(params_class().dropout, float)
+            self.assertEqual([16], params_class().layer_sizes)
+
+        class UnionParams(pp.Params, strict=True):
+            threshold = pp.Param(1, dtype=Union[float, int])
+
+        self.assertIs(int, type(UnionParams.threshold))
+        self.assertIs(int, type(UnionParams().threshold))
+        self.assertIs(float, type(UnionParams(threshold="0.5").threshold))
+        self.assertIsNone(StrictParams.dropout)
+        self.assertEqual([8, 4], StrictParams().layer_sizes)
+
+    def test_validate_records(self):
+        self.assertEqual({"learning_rate": 0.5}, LooseParams.validate({"learning_rate": "0.5"}))
+        with self.assertRaises(AttributeError):
+            LooseParams.validate({"unknown": 1})
+
+        records = [{"learning_rate": "0.5"}, {"num_layers": "3"}]
+        self.assertEqual("0.5", list(LooseParams.from_records(records))[0].learning_rate)
+        self.assertEqual([LooseParams(learning_rate=0.5), LooseParams(num_layers=3)],
+                         list(LooseParams.from_records(records, validate=True)))
+        with self.assertRaises(TypeError):
+            list(LooseParams.from_records([{"num_layers": "x"}], validate=True))
+
+        LooseParams(num_layers="x")                       # not strict
@@ -0,0 +1,117 @@
+# coding=utf-8
+#
+# created by kpe on 19.10.2026 at 10:55 PM
+#
+
+from __future__ import division, absolute_import, print_function
+
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+import params as pp
+
+
+class ServingParams(pp.Params):
+    batch_size = 32
+    timeout    = 1.5
+    model_name = "model"
+
+
+class ParamsWatcherTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.tmp_dir.name, "serving.yaml")
+        self.mtime = 1000000000
+        self.write("batch_size: 64\n")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write(self, text):
+        with open(self.file_path, "w") as fp:
+            fp.write(text)
+        self.mtime += 1
+        os.utime(self.file_path, (self.mtime, self.mtime))
+
+    def test_reload(self):
+        watcher = pp.ParamsWatcher(self.file_path, ServingParams)
+        changes = []
+        watcher.add_callback(lambda params, diff: changes.append((params, diff)))
+        params = watcher.params
+        self.assertIsInstance(params, pp.FrozenParams)
+        self.assertEqual(ServingParams(batch_size=64), params)
+        self.assertFalse(watcher.check())                                   # not modified
+
+        self.write("batch_size: 64\ntimeout: 2\n")
+        self.assertTrue(watcher.check())
+        self.assertEqual(ServingParams(batch_size=64, timeout=2), watcher.params)
+        self.assertEqual([(watcher.params, {"timeout": 2})], changes)
+        self.assertEqual(ServingParams(batch_size=64), params)              # unchanged old instance
+
+        self.write("batch_size: 64\ntimeout: 2\n")                          # same content
+        self.assertFalse(watcher.check())
+        self.assertEqual(1, len(changes))
+
+    def test_invalid_config(self):
+        errors = []
+        watcher = pp.ParamsWatcher(self.file_path, ServingParams, on_error=errors.append)
+        params = watcher.params
+        for text in ["batch_size: [64\n", "unknown: 1\n", "- 1\n"]:
+            self.write(text)
+            self.assertFalse(watcher.check())
+            self.assertIs(params, watcher.params)
+            self.assertIs(errors[-1], watcher.last_error)
+        self.assertEqual(3, len(errors))
+
+        self.write("batch_size: 8\n")
+        self.assertTrue(watcher.check())
+        self.assertIsNone(watcher.last_error)
+
+        with self.assertRaises(AttributeError):
+            self.write("unknown: 1\n")
+            pp.ParamsWatcher(self.file_path, ServingParams)
+        self.assertEqual(ServingParams(), pp.ParamsWatcher(self.file_path, ServingParams, check_params=False).params)
+
+    def test_thread(self):
+        reloaded = threading.Event()
+        with pp.ParamsWatcher(self.file_path, ServingParams, interval=0.01) as watcher:
+            watcher.add_callback(lambda params, diff: reloaded.set())
+            self.write("batch_size: 128\n")
+            self.assertTrue(reloaded.wait(5))
+        self.assertEqual(128, watcher.params.batch_size)
+
+    def test_failing_callbacks(self):
+        errors, reloaded = [], []
+
+        def failing_callback(params, diff):
+            raise ValueError("failed")
+
+        watcher = pp.ParamsWatcher(self.file_path, ServingParams, on_error=errors.append)
+        watcher.add_callback(failing_callback)
+        watcher.add_callback(lambda params, diff: reloaded.append(params))
+        self.write("batch_size: 16\n")
+        self.assertTrue(watcher.check())
+        self.assertEqual([watcher.params], reloaded)
+        self.assertIsInstance(watcher.last_error, ValueError)
+        self.assertEqual([watcher.last_error], errors)
+
+    def test_thread_failing_on_error(self):
+        def failing_on_error(err):
+            raise RuntimeError("failed to report")
+
+        reloaded = threading.Event()
+        with pp.ParamsWatcher(self.file_path, ServingParams, interval=0.01, on_error=failing_on_error) as watcher:
+            watcher.add_callback(lambda params, diff: reloaded.set())
+            self.write("batch_size: [16\n")                    # invalid
+            deadline = time.time() + 5
+            while watcher.last_error is None and time.time() < deadline:
+                time.sleep(0.01)
+            self.assertIsInstance(watcher.last_error, RuntimeError)
+            self.write("batch_size: 16\n")
+            self.assertTrue(reloaded.wait(5))
+            self.assertTrue(watcher._thread.is_alive())
+        self.assertEqual(16, watcher.params.batch_size)
@@ -5,6 +5,7 @@
 
 from __future__ import division, absolute_import, print_function
 
+import pickle
 import unittest
 
 import params as pp
@@ -34,6 +35,30 @@ class SubSubClass(SubClass):
         self.sub_sub_arg = sub_sub_arg
 
 
+class StrictLayer(pp.WithParams):
+    class Params(pp.WithParams.Params, strict=True):
+        units      = 8
+        activation = "relu"
+
+    def _construct(self, name=None):
+        self.name = name
+
+
+class StrictBlock(StrictLayer):
+    class Params(StrictLayer.Params):
+        num_layers = 2
+
+    def _construct(self, *args, **kwargs):
+        super()._construct(*args, **kwargs)
+        self.layers = [StrictLayer.from_params(self.params, name=idx) for idx in range(self.params.num_layers)]
+
+
+class CustomInitLayer(StrictLayer):
+    def __init__(self, *args, **kwargs):
+        self.init_kwargs = dict(kwargs)
+        super().__init__(*args, **kwargs)
+
+
 class WithParamsTest(unittest.TestCase):
 
     def check_instance(self, wp):
@@ -68,9 +93,37 @@ class WithParamsTest(unittest.TestCase):
         wp.params.sub_sub_param = "sub_sub_param"
         self.check_instance(wp)
 
+    def test_from_params_fast_path(self):
+        block = StrictBlock(units=16, num_layers=3, name="block")
+        self.assertEqual("block", block.name)
+        self.assertEqual([0, 1, 2], [layer.name for layer in block.layers])
+        for layer in block.layers:
+            self.assertIs(type(layer.params), StrictLayer.Params)
+            self.assertEqual(StrictLayer.Params(units=16), layer.params)
+        self.assertIsNot(block.layers[0].params, block.layers[1].params)
+
+        layer = StrictLayer.from_params(block.params, units="32")
+        self.assertEqual(32, layer.params.units)
+        with self.assertRaises(TypeError):
+            StrictLayer.from_params(block.params, units="many")
+        self.assertEqual(StrictLayer.Params(units=4), StrictLayer.from_params({"units": "4", "other": 1}).params)
+
+        frozen = StrictLayer.Params(units=4).freeze()
+        self.assertIs(frozen, StrictLayer.from_params(frozen).params)
+        self.assertEqual(StrictLayer.Params(units=5), StrictLayer.from_params(frozen, units=5).params)
+
+        layer = CustomInitLayer.from_params(block.params, name="custom")
+        self.assertEqual({"units": 16, "activation": "relu", "name": "custom"}, layer.init_kwargs)
+        self.assertEqual("custom", layer.name)
+
     def test_param_create(self):
         wp = SubSubClass.Params().create(
             "sub_sub_arg", "sub_arg", "base_arg",
             sub_param="sub_param", base_kwarg="base_kwarg", sub_sub_param="sub_sub_param")
         self.check_instance(wp)
 
+    def test_pickle(self):
+        wp = SubClass("sub_arg", "base_arg", base_kwarg="base_kwarg", sub_param="sub_param")
+        wp = pickle.loads(pickle.dumps(wp))
+        self.assertIsInstance(wp.params, SubClass.Params)
+        self.check_instance(wp)